@@ -5,13 +5,13 @@ from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
 from ..core.config import settings
-from ..core.database import get_db
-from ..core.security import create_access_token
+from ..core.database import get_db, run_db
+from ..core.security import PasswordHasherBusy, create_access_token, password_hasher
 from ..crud import (
-    authenticate_user,
     create_user,
     get_user_by_email,
     get_user_by_username,
+    update_password_hash,
 )
 from ..schemas import ApiResponse, Token, User, UserCreate, success_response
 
@@ -19,39 +19,57 @@ router = APIRouter()
 
 
 @router.post("/register", response_model=ApiResponse[User])
-def register(user: UserCreate, db: Session = Depends(get_db)):
+async def register(user: UserCreate, db: Session = Depends(get_db)):
     """회원가입 - 이메일과 사용자명 중복 검사 후 계정 생성"""
     # Check if user already exists
-    db_user = get_user_by_email(db, email=user.email)
+    db_user = await run_db(db, get_user_by_email, email=user.email)
     if db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={"error": "EMAIL_EXISTS", "message": "이미 등록된 이메일입니다."},
         )
 
-    db_user = get_user_by_username(db, username=user.username)
+    db_user = await run_db(db, get_user_by_username, username=user.username)
     if db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={"error": "USERNAME_EXISTS", "message": "이미 사용중인 사용자명입니다."},
         )
 
-    new_user = create_user(db=db, user=user)
+    # bcrypt는 전용 프로세스 풀에서 (가득 차면 PasswordHasherBusy -> 503)
+    hashed_password = await password_hasher.hash(user.password)
+    new_user = await run_db(
+        db, create_user, user=user, hashed_password=hashed_password
+    )
     return success_response(data=new_user, message="회원가입이 완료되었습니다.")
 
 
 @router.post("/token", response_model=Token)
-def login_for_access_token(
+async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
 ):
     """로그인 - JWT 액세스 토큰 발급"""
-    user = authenticate_user(db, form_data.username, form_data.password)
-    if not user:
+    user = await run_db(db, get_user_by_username, username=form_data.username)
+    if not user or not await password_hasher.verify(
+        form_data.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={"error": "INVALID_CREDENTIALS", "message": "사용자명 또는 비밀번호가 올바르지 않습니다."},
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+    # BCRYPT_ROUNDS가 바뀌었으면 평문을 알고 있는 지금 새 cost로 재해싱
+    if password_hasher.needs_rehash(user.hashed_password):
+        try:
+            new_hash = await password_hasher.hash(form_data.password)
+        except PasswordHasherBusy:
+            pass  # 재해싱은 다음 로그인으로 미룸
+        else:
+            await run_db(
+                db, update_password_hash, user_id=user.id, hashed_password=new_hash
+            )
+
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data={"sub": user.username}, expires_delta=access_token_expires
@@ -1,82 +1,237 @@
-from typing import List, Optional
+from typing import Annotated, List, Literal, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import Field
 from sqlalchemy.orm import Session
 
-from ..core.database import get_db
-from ..core.dependencies import get_current_active_user
+from ..core.database import get_db, get_read_db, run_db
+from ..core.dependencies import get_current_active_user, parse_batch_ids
+from ..core.events import question_events
+from ..core.http_cache import (
+    ResourceVersion,
+    conditional_headers,
+    is_not_modified,
+    not_modified_response,
+)
+from ..core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from ..core.principals import Principal
+from ..core.replicas import cache_readable, replica_cache_ttl
+from ..core.response_cache import response_cache
+from ..core.view_counter import view_counter
 from ..crud import (
+    SORT_KEYS,
     create_question,
     get_answers_by_question,
+    get_answers_version,
     get_question,
+    get_question_full,
+    get_question_summaries,
+    get_question_summaries_by_ids,
+    get_question_version,
     get_questions,
-    increment_question_views,
+    get_questions_by_ids,
+    loaders,
+    sort_value,
     update_question,
 )
-from ..models import User
 from ..schemas import (
     Answer,
     ApiResponse,
     Question,
     QuestionCreate,
+    QuestionFull,
+    QuestionSummary,
     QuestionUpdate,
+    render_success,
     success_response,
 )
 
 router = APIRouter()
 
+# OpenAPI 문서용 응답 타입 - ORM 객체가 QuestionSummary 쪽 속성(tags 등)까지 lazy
+# 로드하지 않도록 순서대로 검증
+QuestionListData = Annotated[
+    Union[List[Question], List[QuestionSummary]], Field(union_mode="left_to_right")
+]
+# 실제 직렬화는 view별 타입으로 - 유니온이면 summary 행마다 List[Question] 검증부터
+# 실패한 뒤 다시 검증해 두 배 이상 느림
+QUESTION_LIST_TYPES = {"full": List[Question], "summary": List[QuestionSummary]}
+
 
-@router.get("/", response_model=ApiResponse[List[Question]])
-def read_questions(
+@router.get("/", response_model=ApiResponse[QuestionListData])
+async def read_questions(
+    request: Request,
     skip: int = 0,
-    limit: int = Query(default=100, le=100),
-    db: Session = Depends(get_db),
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        default=None, description="이전 응답의 next_cursor (지정 시 skip 무시)"
+    ),
+    view: Literal["full", "summary"] = Query(
+        default="full", description="summary: 발췌/집계만 담은 경량 목록"
+    ),
+    sort: Literal["newest", "views", "unanswered", "active"] = Query(
+        default="newest",
+        description="newest 최신순, views 조회수순, unanswered 미답변 최신순, "
+        "active 최근 활동(수정/답변)순",
+    ),
+    tag: Optional[str] = Query(default=None, max_length=50, description="태그 이름"),
+    ids: Optional[str] = Query(
+        default=None,
+        description="콤마로 구분한 질문 id - 주면 그 질문들만 요청 순서대로 "
+        "(페이지네이션/정렬/태그 무시, 없는 id는 제외)",
+    ),
+    db: Session = Depends(get_read_db),
 ):
-    """질문 목록 조회 - 페이지네이션 지원"""
-    questions = get_questions(db, skip=skip, limit=limit)
-    return success_response(data=questions, message="질문 목록을 불러왔습니다.")
+    """질문 목록 조회 - 정렬 모드별, offset 또는 커서 페이지네이션, id 목록 배치 조회 지원"""
+    if ids is not None:
+        question_ids = parse_batch_ids(ids)
+        if view == "summary":
+            questions = await run_db(
+                db, get_question_summaries_by_ids, question_ids=question_ids
+            )
+        else:
+            questions = await run_db(
+                db,
+                get_questions_by_ids,
+                question_ids=question_ids,
+                options=loaders.QUESTION_LIST,
+            )
+        body = render_success(
+            QUESTION_LIST_TYPES[view], questions, message="질문 목록을 불러왔습니다."
+        )
+        return Response(content=body, media_type="application/json")
+
+    position = None
+    if cursor is not None:
+        try:
+            position = decode_cursor(cursor, sort, value_type=SORT_KEYS[sort][1])
+        except InvalidCursorError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"error": "INVALID_CURSOR", "message": "잘못된 커서입니다."},
+            )
+
+    cache_key, cached = await response_cache.lookup(
+        response_cache.list_key,
+        readable=cache_readable(db),
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        view=view,
+        sort=sort,
+        tag=tag,
+    )
+    if cached is not None:
+        return cached.to_response(request)
+
+    fetch = get_question_summaries if view == "summary" else get_questions
+    questions = await run_db(
+        db,
+        fetch,
+        skip=skip,
+        limit=limit,
+        cursor=position,
+        sort=sort,
+        tag=tag,
+    )
+
+    # 페이지가 가득 찼을 때만 다음 커서 발급
+    next_cursor = None
+    if len(questions) == limit:
+        last = questions[-1]
+        last_id = last["id"] if view == "summary" else last.id
+        next_cursor = encode_cursor(sort_value(last, sort), last_id, sort)
+
+    body = render_success(
+        QUESTION_LIST_TYPES[view],
+        questions,
+        message="질문 목록을 불러왔습니다.",
+        next_cursor=next_cursor,
+    )
+    entry = await response_cache.store(cache_key, body, ttl=replica_cache_ttl(db))
+    return entry.to_response(request)
 
 
 @router.post("/", response_model=ApiResponse[Question])
-def create_question_endpoint(
+async def create_question_endpoint(
     question: QuestionCreate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """질문 작성 - 로그인 필수"""
-    new_question = create_question(db=db, question=question, author_id=current_user.id)
+    new_question = await run_db(
+        db, create_question, question=question, author_id=current_user.id
+    )
     return success_response(data=new_question, message="질문이 등록되었습니다.")
 
 
 @router.get("/{question_id}", response_model=ApiResponse[Question])
-def read_question(question_id: int, db: Session = Depends(get_db)):
-    """질문 상세 조회 - 조회수 자동 증가"""
-    db_question = get_question(db, question_id=question_id)
-    if db_question is None:
+async def read_question(
+    question_id: int, request: Request, db: Session = Depends(get_read_db)
+):
+    """질문 상세 조회 - 조회수 자동 증가 (주기적으로 일괄 반영), ETag 지원"""
+    # 키(세대)는 DB를 읽기 전에 정함 - 읽는 도중 무효화되면 지나간 세대로 저장됨
+    cache_key, cached = await response_cache.lookup(
+        response_cache.question_key, question_id, readable=cache_readable(db)
+    )
+    if cached is not None:
+        view_counter.record(question_id)
+        return cached.to_response(request)
+
+    version = await run_db(db, get_question_version, question_id=question_id)
+    if version is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail={"error": "QUESTION_NOT_FOUND", "message": "질문을 찾을 수 없습니다."},
+            detail={
+                "error": "QUESTION_NOT_FOUND",
+                "message": "질문을 찾을 수 없습니다.",
+            },
         )
 
-    # Increment views
-    increment_question_views(db, question_id)
+    # Increment views - 쓰기 트랜잭션 없이 메모리에만 기록 (304 재검증도 조회로 계산)
+    view_counter.record(question_id)
+
+    # 클라이언트/프록시 사본이 최신이면 ORM 로드와 직렬화 없이 304
+    headers = conditional_headers(version)
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+
+    db_question = await run_db(
+        db, get_question, question_id=question_id, options=loaders.QUESTION_DETAIL
+    )
+    if db_question is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": "QUESTION_NOT_FOUND",
+                "message": "질문을 찾을 수 없습니다.",
+            },
+        )
 
-    return success_response(data=db_question, message="질문을 불러왔습니다.")
+    body = render_success(Question, db_question, message="질문을 불러왔습니다.")
+    entry = await response_cache.store(
+        cache_key, body, headers, ttl=replica_cache_ttl(db)
+    )
+    return entry.to_response(request)
 
 
 @router.put("/{question_id}", response_model=ApiResponse[Question])
-def update_question_endpoint(
+async def update_question_endpoint(
     question_id: int,
     question_update: QuestionUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """질문 수정 - 작성자만 가능"""
-    db_question = get_question(db, question_id=question_id)
+    db_question = await run_db(db, get_question, question_id=question_id)
     if db_question is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail={"error": "QUESTION_NOT_FOUND", "message": "질문을 찾을 수 없습니다."},
+            detail={
+                "error": "QUESTION_NOT_FOUND",
+                "message": "질문을 찾을 수 없습니다.",
+            },
         )
 
     if db_question.author_id != current_user.id:
@@ -88,21 +243,120 @@ def update_question_endpoint(
             },
         )
 
-    updated_question = update_question(
-        db=db, question_id=question_id, question_update=question_update
+    updated_question = await run_db(
+        db, update_question, question_id=question_id, question_update=question_update
     )
     return success_response(data=updated_question, message="질문이 수정되었습니다.")
 
 
 @router.get("/{question_id}/answers", response_model=ApiResponse[List[Answer]])
-def read_question_answers(question_id: int, db: Session = Depends(get_db)):
-    """특정 질문의 모든 답변 조회"""
-    db_question = get_question(db, question_id=question_id)
-    if db_question is None:
+async def read_question_answers(
+    question_id: int, request: Request, db: Session = Depends(get_read_db)
+):
+    """특정 질문의 모든 답변 조회 - ETag 지원"""
+    cache_key, cached = await response_cache.lookup(
+        response_cache.answers_key, question_id, readable=cache_readable(db)
+    )
+    if cached is not None:
+        return cached.to_response(request)
+
+    version = await run_db(db, get_answers_version, question_id=question_id)
+    if version is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail={"error": "QUESTION_NOT_FOUND", "message": "질문을 찾을 수 없습니다."},
+            detail={
+                "error": "QUESTION_NOT_FOUND",
+                "message": "질문을 찾을 수 없습니다.",
+            },
+        )
+
+    headers = conditional_headers(version)
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+
+    answers = await run_db(db, get_answers_by_question, question_id=question_id)
+    body = render_success(List[Answer], answers, message="답변 목록을 불러왔습니다.")
+    entry = await response_cache.store(
+        cache_key, body, headers, ttl=replica_cache_ttl(db)
+    )
+    return entry.to_response(request)
+
+
+@router.get("/{question_id}/full", response_model=ApiResponse[QuestionFull])
+async def read_question_full(
+    question_id: int, request: Request, db: Session = Depends(get_read_db)
+):
+    """
+    질문 페이지 한 번에 - 질문, 답변, 참조된 작성자 (조회수 증가, ETag 지원)
+
+    상세 + 답변 목록 + 작성자별 사용자 조회를 한 요청으로 대신한다.
+    """
+    cache_key, cached = await response_cache.lookup(
+        response_cache.full_key, question_id, readable=cache_readable(db)
+    )
+    if cached is not None:
+        view_counter.record(question_id)
+        return cached.to_response(request)
+
+    version = await run_db(db, get_question_version, question_id=question_id)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": "QUESTION_NOT_FOUND",
+                "message": "질문을 찾을 수 없습니다.",
+            },
         )
 
-    answers = get_answers_by_question(db, question_id=question_id)
-    return success_response(data=answers, message="답변 목록을 불러왔습니다.")
+    view_counter.record(question_id)
+
+    # 상세와 같은 행으로 결정되지만 본문 모양이 다르므로 ETag도 달라야 함
+    version = ResourceVersion(("full", version.key), version.last_modified)
+    headers = conditional_headers(version)
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+
+    full = await run_db(db, get_question_full, question_id=question_id)
+    if full is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": "QUESTION_NOT_FOUND",
+                "message": "질문을 찾을 수 없습니다.",
+            },
+        )
+
+    body = render_success(QuestionFull, full, message="질문을 불러왔습니다.")
+    entry = await response_cache.store(
+        cache_key, body, headers, ttl=replica_cache_ttl(db)
+    )
+    return entry.to_response(request)
+
+
+@router.get("/{question_id}/events", response_class=StreamingResponse)
+async def question_events_stream(
+    question_id: int,
+    # 스트림 동안 DB 연결을 붙잡지 않도록 존재 확인 직후(응답 전) 세션을 닫음
+    db: Session = Depends(get_read_db, scope="function"),
+):
+    """
+    질문 이벤트 SSE 스트림 - answer.created / answer.updated / answer.accepted /
+    answer.deleted
+
+    data는 답변 JSON(삭제는 id와 question_id만). 연결 후 답변 목록을 한 번 읽고
+    이후 변경은 이벤트로 반영하면 되므로 답변 목록을 폴링할 필요가 없다.
+    """
+    if await run_db(db, get_question, question_id=question_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": "QUESTION_NOT_FOUND",
+                "message": "질문을 찾을 수 없습니다.",
+            },
+        )
+    return StreamingResponse(
+        question_events.stream(question_id),
+        media_type="text/event-stream",
+        # 프록시(nginx)가 버퍼링하거나 캐시하지 않고 바로 흘려보내도록
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,32 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from ..core.database import get_read_db, run_db
+from ..crud import search_questions
+from ..crud.search import SearchNotSupported
+from ..schemas import ApiResponse, QuestionSummary, success_response
+
+router = APIRouter()
+
+
+@router.get("", response_model=ApiResponse[List[QuestionSummary]])
+async def search(
+    q: str = Query(min_length=1, max_length=200, description="검색어"),
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=20, ge=1, le=50),
+    db: Session = Depends(get_read_db),
+):
+    """질문 검색 - 제목, 본문, 답변 내용에서 관련도 순"""
+    try:
+        results = await run_db(db, search_questions, q=q, skip=skip, limit=limit)
+    except SearchNotSupported:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail={
+                "error": "SEARCH_NOT_SUPPORTED",
+                "message": "이 데이터베이스에서는 검색을 지원하지 않습니다.",
+            },
+        )
+    return success_response(data=results, message="검색 결과를 불러왔습니다.")
@@ -0,0 +1,21 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from ..core.database import get_read_db, run_db
+from ..crud import get_tags
+from ..schemas import ApiResponse, Tag, success_response
+
+router = APIRouter()
+
+
+@router.get("/", response_model=ApiResponse[List[Tag]])
+async def read_tags(
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=100),
+    db: Session = Depends(get_read_db),
+):
+    """태그 목록 - 질문 수 많은 순 (질문 수는 미리 집계된 값)"""
+    tags = await run_db(db, get_tags, skip=skip, limit=limit)
+    return success_response(data=tags, message="태그 목록을 불러왔습니다.")
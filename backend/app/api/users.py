@@ -1,26 +1,59 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
-from ..core.database import get_db
-from ..core.dependencies import get_current_active_user
-from ..models import User as UserModel
+from ..core.database import get_db, get_read_db, run_db
+from ..core.dependencies import batch_ids, get_current_active_user
+from ..core.http_cache import check_conditional
+from ..core.principals import Principal
+from ..crud import get_user, get_user_version, get_users_by_ids
 from ..schemas import ApiResponse, User, success_response
 
 router = APIRouter()
 
 
+@router.get("/", response_model=ApiResponse[List[User]])
+async def read_users(
+    user_ids: List[int] = Depends(batch_ids),
+    db: Session = Depends(get_read_db),
+):
+    """여러 사용자 공개 정보 한 번에 조회 (?ids=1,2,3) - 요청 순서대로, 없는 id는 제외"""
+    users = await run_db(db, get_users_by_ids, user_ids=user_ids)
+    return success_response(data=users, message="사용자 정보를 불러왔습니다.")
+
+
 @router.get("/me", response_model=ApiResponse[User])
-def read_users_me(current_user: UserModel = Depends(get_current_active_user)):
+async def read_users_me(
+    current_user: Principal = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+):
     """현재 로그인한 사용자 정보 조회 (마이페이지용)"""
-    return success_response(data=current_user, message="사용자 정보를 불러왔습니다.")
+    # 인증은 캐시된 스냅샷으로 끝나므로 프로필 전체는 여기서만 조회
+    user = await run_db(db, get_user, user_id=current_user.id)
+    return success_response(data=user, message="사용자 정보를 불러왔습니다.")
 
 
 @router.get("/{user_id}", response_model=ApiResponse[User])
-def read_user(user_id: int, db: Session = Depends(get_db)):
-    """특정 사용자 공개 정보 조회"""
-    from ..crud import get_user
+async def read_user(
+    user_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db),
+):
+    """특정 사용자 공개 정보 조회 - ETag 지원"""
+    version = await run_db(db, get_user_version, user_id=user_id)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "USER_NOT_FOUND", "message": "사용자를 찾을 수 없습니다."},
+        )
+
+    not_modified = check_conditional(request, response, version)
+    if not_modified is not None:
+        return not_modified
 
-    user = get_user(db, user_id=user_id)
+    user = await run_db(db, get_user, user_id=user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -0,0 +1,220 @@
+"""
+캐시 백엔드
+
+- memory: 워커 프로세스 안의 TTL + LRU 캐시 (기본값)
+- redis: 여러 워커/호스트가 공유하는 Redis (redis 패키지 필요)
+- local: Redis 대신 프로세스 안 dict를 쓰는 공유 캐시 대역 (개발/테스트용)
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from fastapi.concurrency import run_in_threadpool
+
+from .config import settings
+
+T = TypeVar("T")
+
+
+class CacheBackend:
+    """캐시 백엔드 공통 인터페이스"""
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    """
+    스레드 안전한 TTL + LRU 캐시 - 가득 차면 가장 오래 안 쓴 항목부터 제거
+
+    maxbytes를 주면 bytes/str 값의 길이 합도 그 이하로 유지한다.
+    """
+
+    def __init__(
+        self, maxsize: int, ttl: Optional[float] = None, maxbytes: Optional[int] = None
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self._data: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _sizeof(value: Any) -> int:
+        return len(value) if isinstance(value, (bytes, str)) else 0
+
+    def _pop(self, key: str) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.nbytes -= self._sizeof(entry[1])
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._pop(key)
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        size = self._sizeof(value)
+        with self._lock:
+            self._pop(key)
+            if self.maxbytes is not None and size > self.maxbytes:
+                return
+            self._data[key] = (expires_at, value)
+            self.nbytes += size
+            while len(self._data) > self.maxsize or (
+                self.maxbytes is not None and self.nbytes > self.maxbytes
+            ):
+                self._pop(next(iter(self._data)))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class LocalSharedStore:
+    """Redis 클라이언트의 get/set/delete만 흉내 내는 프로세스 내 저장소"""
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[Optional[float], bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._data.get(name)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[name]
+                return None
+            return value
+
+    def set(self, name: str, value: bytes, px: Optional[int] = None) -> bool:
+        expires_at = time.monotonic() + px / 1000 if px is not None else None
+        with self._lock:
+            self._data[name] = (expires_at, value)
+        return True
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            return sum(self._data.pop(name, None) is not None for name in names)
+
+    def scan_iter(self, match: str):
+        prefix = match.rstrip("*")
+        with self._lock:
+            keys = [key for key in self._data if key.startswith(prefix)]
+        return iter(keys)
+
+
+class SharedCache(CacheBackend):
+    """
+    Redis 호환 클라이언트 위의 캐시
+
+    값은 JSON으로 저장하고 bytes는 그대로 저장한다 (첫 바이트로 구분).
+    """
+
+    def __init__(self, client: Any, namespace: str, ttl: Optional[float] = None):
+        self.client = client
+        self.namespace = namespace
+        self.ttl = ttl
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(self._key(key))
+        if raw is None:
+            return None
+        if raw[:1] == b"b":
+            return raw[1:]
+        return json.loads(raw[1:])
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if isinstance(value, bytes):
+            raw = b"b" + value
+        else:
+            raw = b"j" + json.dumps(value, separators=(",", ":")).encode("utf-8")
+        px = max(1, int(ttl * 1000)) if ttl is not None else None
+        self.client.set(self._key(key), raw, px=px)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self._key(key))
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=f"{self.namespace}:*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+async def run_cache(
+    backend: CacheBackend, fn: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """
+    비동기 핸들러에서 캐시를 쓰는 fn 실행
+
+    memory는 바로 실행하고, 공유 저장소(redis)는 네트워크 왕복 동안 이벤트 루프를
+    막지 않도록 스레드풀에서 실행한다.
+    """
+    if isinstance(backend, MemoryCache):
+        return fn(*args, **kwargs)
+    return await run_in_threadpool(fn, *args, **kwargs)
+
+
+_local_store: Optional[LocalSharedStore] = None
+
+
+def create_cache(
+    backend: str,
+    namespace: str,
+    maxsize: int,
+    ttl: Optional[float] = None,
+    maxbytes: Optional[int] = None,
+) -> CacheBackend:
+    """
+    설정값(memory / redis / local)에 맞는 캐시 백엔드 생성
+
+    maxsize/maxbytes는 memory 백엔드에만 적용 (공유 저장소는 자체 maxmemory 정책을 따름)
+    """
+    global _local_store
+    if backend == "memory":
+        return MemoryCache(maxsize=maxsize, ttl=ttl, maxbytes=maxbytes)
+    if backend == "redis":
+        import redis  # 선택 의존성: pip install -e ".[redis]"
+
+        client = redis.Redis.from_url(settings.CACHE_REDIS_URL)
+        return SharedCache(client, namespace=namespace, ttl=ttl)
+    if backend == "local":
+        if _local_store is None:
+            _local_store = LocalSharedStore()
+        return SharedCache(_local_store, namespace=namespace, ttl=ttl)
+    raise ValueError(f"Unknown cache backend: {backend}")
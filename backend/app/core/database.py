@@ -1,24 +1,204 @@
-from sqlalchemy import create_engine
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, make_url
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
+from .cache import run_cache
 from .config import settings
+from .pool import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    PoolSizes,
+    instrument_engine,
+    pool_sizes,
+)
+from .replicas import (
+    Replica,
+    ReplicaRouter,
+    mark_write,
+    read_routes,
+    recent_writers,
+    request_identity,
+    wrote_recently,
+)
+
+T = TypeVar("T")
+
+# 동기 드라이버 -> 비동기 드라이버 (DATABASE_ASYNC=true 일 때)
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def _engine_options(url: URL, name: str, sizes: PoolSizes, is_async=False) -> dict:
+    if url.get_backend_name() == "sqlite":
+        # 요청 처리 중 세션이 스레드풀 스레드 사이를 오가므로 스레드 검사 해제
+        return {"connect_args": {"check_same_thread": False}}
+    # PostgreSQL: 워커별 고정 크기 풀. pre-ping(체크아웃마다 왕복 1번) 대신
+    # pool_recycle로 오래된 연결을 교체하고, 끊긴 연결 오류가 나면 SQLAlchemy가
+    # 풀 전체를 무효화해 다음 체크아웃부터 새로 연결한다.
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": sizes.pool_size,
+        "max_overflow": sizes.max_overflow,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+        "pool_logging_name": name,
+    }
+
+
+def async_database_url(url: str) -> URL:
+    """DATABASE_URL을 asyncpg / aiosqlite 드라이버 URL로 변환"""
+    url = make_url(url)
+    return url.set(drivername=ASYNC_DRIVERS.get(url.drivername, url.drivername))
+
 
-# PostgreSQL을 위한 엔진 설정
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,  # 연결 확인
-    pool_size=10,  # 커넥션 풀 크기
-    max_overflow=20  # 추가 연결 허용
+# 워커 하나에 허용된 연결 수
+_sizes = pool_sizes(
+    settings.DATABASE_MAX_CONNECTIONS,
+    settings.WEB_CONCURRENCY,
+    settings.DATABASE_POOL_SIZE,
+    settings.DATABASE_MAX_OVERFLOW,
 )
+# 비동기 모드에서 동기 엔진은 조회수 flush 스레드/스크립트용 연결 1개만 쓰고
+# 나머지 예산은 요청 경로의 비동기 엔진에
+_sync_sizes = PoolSizes(1, 0) if settings.DATABASE_ASYNC else _sizes
+
+_url = make_url(settings.DATABASE_URL)
+engine = create_engine(_url, **_engine_options(_url, "sync", _sync_sizes))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+instrument_engine("sync", engine)
+
+# 비동기 모드: 요청 경로만 AsyncSession을 쓰고, 스크립트/백그라운드 작업은 위 동기 엔진 사용
+async_engine = None
+AsyncSessionLocal = None
+if settings.DATABASE_ASYNC:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    _async_url = async_database_url(settings.DATABASE_URL)
+    _async_sizes = PoolSizes(max(1, _sizes.pool_size - 1), _sizes.max_overflow)
+    async_engine = create_async_engine(
+        _async_url, **_engine_options(_async_url, "async", _async_sizes, True)
+    )
+    instrument_engine("async", async_engine.sync_engine)
+    # 커밋 후 속성 만료 시 직렬화 중 lazy 로드(=이벤트 루프 밖 I/O)가 일어나므로 끔
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+
+# 읽기 전용 복제본 (DATABASE_REPLICA_URLS, 콤마 구분) - 각각 primary와 같은 워커별 풀
+_replicas = []
+for _index, _replica_url in enumerate(
+    url.strip() for url in settings.DATABASE_REPLICA_URLS.split(",") if url.strip()
+):
+    _name = f"replica-{_index}"
+    if settings.DATABASE_ASYNC:
+        _replica_url = async_database_url(_replica_url)
+        _replica_engine = create_async_engine(
+            _replica_url, **_engine_options(_replica_url, _name, _async_sizes, True)
+        )
+        _replica_sessions = async_sessionmaker(
+            _replica_engine, autoflush=False, expire_on_commit=False
+        )
+        instrument_engine(_name, _replica_engine.sync_engine)
+    else:
+        _replica_url = make_url(_replica_url)
+        _replica_engine = create_engine(
+            _replica_url, **_engine_options(_replica_url, _name, _sizes)
+        )
+        _replica_sessions = sessionmaker(
+            autocommit=False, autoflush=False, bind=_replica_engine
+        )
+        instrument_engine(_name, _replica_engine)
+    _replicas.append(Replica(_name, _replica_engine, _replica_sessions))
+replicas = ReplicaRouter(_replicas, settings.DATABASE_REPLICA_HEALTH_INTERVAL_SECONDS)
 
 Base = declarative_base()
 
 
-def get_db():
+@event.listens_for(Session, "after_commit")
+def _remember_writer(session: Session) -> None:
+    # get_db 세션이 커밋하면 그 사용자의 이후 읽기는 잠시 primary로
+    mark_write(session.info.get("writer"))
+
+
+def _writer(request: Request) -> Optional[str]:
+    return request_identity(request) if replicas.replicas else None
+
+
+def _read_target(request: Request) -> Tuple[Optional[Replica], bool]:
+    """
+    get_read_db가 쓸 복제본과 read-your-writes 여부
+
+    최근에 쓴 사용자거나 건강한 복제본이 없으면 복제본은 None.
+    """
+    replica = None
+    recent_writer = bool(replicas.replicas) and wrote_recently(
+        request_identity(request)
+    )
+    if replicas.replicas and not recent_writer:
+        replica = replicas.pick()
+    read_routes.inc(target=replica.name if replica else "primary")
+    return replica, recent_writer
+
+
+def get_sync_db(request: Request):
     db = SessionLocal()
+    db.info["writer"] = _writer(request)
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db(request: Request):
+    async with AsyncSessionLocal() as db:
+        db.info["writer"] = _writer(request)
+        yield db
+
+
+def get_sync_read_db(request: Request):
+    replica, recent_writer = _read_target(request)
+    db = replica.session_factory() if replica else SessionLocal()
+    db.info["replica"] = replica.name if replica else None
+    db.info["recent_writer"] = recent_writer
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request):
+    # recent_writers가 redis면 조회 동안 이벤트 루프를 막지 않도록 스레드풀에서
+    replica, recent_writer = await run_cache(recent_writers, _read_target, request)
+    async with (replica.session_factory if replica else AsyncSessionLocal)() as db:
+        db.info["replica"] = replica.name if replica else None
+        db.info["recent_writer"] = recent_writer
+        yield db
+
+
+# get_db: 쓰기(와 자기 정보 조회) - 항상 primary
+# get_read_db: 읽기 전용 엔드포인트 - 복제본이 있으면 복제본 (read-your-writes 보장)
+get_db = get_async_db if settings.DATABASE_ASYNC else get_sync_db
+get_read_db = get_async_read_db if settings.DATABASE_ASYNC else get_sync_read_db
+
+
+async def run_db(db: Any, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    crud 함수 fn(db, ...)을 세션 종류에 맞게 실행
+
+    - AsyncSession: run_sync로 이벤트 루프 위 greenlet에서 실행 (I/O는 asyncpg/aiosqlite)
+    - Session: 스레드풀에서 실행 (DB 호출 동안만 스레드를 점유)
+    """
+    run_sync = getattr(db, "run_sync", None)
+    if run_sync is not None:
+        return await run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
@@ -1,18 +1,27 @@
-from fastapi import Depends, HTTPException, status
+from typing import List
+
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
-from ..core.database import get_db
+from ..core.cache import run_cache
+from ..core.config import settings
+from ..core.database import get_db, run_db
+from ..core.principals import (
+    Principal,
+    cache_principal,
+    get_cached_principal,
+    principal_cache,
+)
 from ..core.security import decode_access_token
 from ..crud import get_user_by_username
-from ..models import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 
-def get_current_user(
+async def get_current_user(
     token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
-) -> User:
+) -> Principal:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -23,13 +32,53 @@ def get_current_user(
     if username is None:
         raise credentials_exception
 
-    user = get_user_by_username(db, username=username)
+    # 캐시에 있으면 DB 조회 없이 스냅샷 사용 (redis면 스레드풀에서 조회)
+    principal = await run_cache(principal_cache, get_cached_principal, username)
+    if principal is not None:
+        return principal
+
+    user = await run_db(db, get_user_by_username, username=username)
     if user is None:
         raise credentials_exception
-    return user
+    return await run_cache(principal_cache, cache_principal, user)
 
 
-def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_active_user(
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
+
+
+def parse_batch_ids(raw: str) -> List[int]:
+    """
+    "3,1,2" -> [3, 1, 2] (요청 순서 유지, 중복 제거)
+
+    형식이 틀리거나 BATCH_MAX_IDS개를 넘으면 400.
+    """
+    try:
+        ids = list(dict.fromkeys(int(part) for part in raw.split(",") if part.strip()))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "INVALID_IDS",
+                "message": "id 목록 형식이 올바르지 않습니다.",
+            },
+        )
+    if len(ids) > settings.BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "TOO_MANY_IDS",
+                "message": f"한 번에 최대 {settings.BATCH_MAX_IDS}개까지 조회할 수 있습니다.",
+            },
+        )
+    return ids
+
+
+def batch_ids(
+    ids: str = Query(..., description="콤마로 구분한 id 목록 (예: 1,2,3)")
+) -> List[int]:
+    return parse_batch_ids(ids)
@@ -0,0 +1,228 @@
+"""
+질문 이벤트 Server-Sent Events 허브
+
+crud가 답변을 만들거나 바꾸면(커밋 이후) question_events.publish로 이벤트를 보내고,
+GET /questions/{id}/events 스트림을 연 클라이언트가 그 질문의 이벤트를 받는다.
+클라이언트는 답변 목록을 주기적으로 다시 조회하지 않고 처음에 한 번만 읽으면 된다.
+
+- 허브: 워커마다 질문 id -> 구독 큐 집합. 연결 하나는 대기 중인 코루틴과 작은 큐뿐이라
+  이벤트 루프 하나가 수천 개의 유휴 연결을 붙잡고 있을 수 있다. SSE 프레임은
+  이벤트마다 한 번만 만들어 모든 구독자 큐에 같은 bytes를 넣는다.
+- 브로커: 이벤트를 모든 워커의 허브로 전달. memory는 같은 워커 안에서만, redis는
+  pub/sub 채널 하나로 모든 워커/호스트에 전달한다.
+
+큐가 가득 찰 만큼 느린 클라이언트는 스트림을 끊는다 (EventSource가 다시 연결하면
+답변 목록을 새로 읽음). 이벤트 재전송(Last-Event-ID)은 지원하지 않는다.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import AsyncIterator, Callable, Dict, Optional, Set
+
+from .config import settings
+from .metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# 연결이 끊겼을 때 EventSource가 다시 연결하기까지 기다릴 시간 (ms)
+RETRY_MS = 3000
+
+Deliver = Callable[[bytes], None]
+
+
+class EventBroker:
+    """워커 간 이벤트 전달 공통 인터페이스"""
+
+    def publish(self, message: bytes) -> None:
+        """아무 스레드에서나 호출 - 모든 워커의 listen 콜백으로 전달"""
+        raise NotImplementedError
+
+    async def listen(self, deliver: Deliver) -> None:
+        """이벤트 루프에서 실행 - 받은 메시지마다 deliver 호출 (취소될 때까지)"""
+        raise NotImplementedError
+
+
+class MemoryBroker(EventBroker):
+    """같은 워커 프로세스 안에서만 전달 (워커 1개 또는 개발용)"""
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._deliver: Optional[Deliver] = None
+
+    def publish(self, message: bytes) -> None:
+        loop, deliver = self._loop, self._deliver
+        # 허브가 시작되지 않았으면(스크립트, lifespan 없는 테스트) 받을 연결도 없음
+        if loop is not None and deliver is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(deliver, message)
+
+    async def listen(self, deliver: Deliver) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._deliver = deliver
+        try:
+            await asyncio.Event().wait()
+        finally:
+            self._loop = self._deliver = None
+
+
+class RedisBroker(EventBroker):
+    """
+    redis pub/sub 채널 하나로 모든 워커에 전달
+
+    발행은 crud 스레드에서 동기 클라이언트로, 구독은 redis.asyncio로 한다.
+    구독 연결이 끊기면 다시 연결하며, 그 사이의 이벤트는 잃는다.
+    """
+
+    def __init__(self, url: str, channel: str = "semicolon:question-events"):
+        import redis  # 선택 의존성: pip install -e ".[redis]"
+
+        self.url = url
+        self.channel = channel
+        self.client = redis.Redis.from_url(url)
+
+    def publish(self, message: bytes) -> None:
+        try:
+            self.client.publish(self.channel, message)
+        except Exception:
+            # 실시간 알림 실패로 이미 커밋된 쓰기 요청을 실패시키지 않음
+            logger.warning("질문 이벤트 발행 실패", exc_info=True)
+
+    async def listen(self, deliver: Deliver) -> None:
+        import redis.asyncio
+
+        client = redis.asyncio.Redis.from_url(self.url)
+        try:
+            while True:
+                try:
+                    async with client.pubsub() as pubsub:
+                        await pubsub.subscribe(self.channel)
+                        async for message in pubsub.listen():
+                            if message["type"] == "message":
+                                deliver(message["data"])
+                except (OSError, redis.RedisError):
+                    logger.warning(
+                        "질문 이벤트 구독 끊김 - 1초 후 재연결", exc_info=True
+                    )
+                    await asyncio.sleep(1)
+        finally:
+            await client.aclose()
+
+
+def create_broker(
+    backend: str, channel: str = "semicolon:question-events"
+) -> EventBroker:
+    """설정값(memory / redis)에 맞는 브로커 생성 (channel은 redis pub/sub 채널)"""
+    if backend == "memory":
+        return MemoryBroker()
+    if backend == "redis":
+        return RedisBroker(settings.CACHE_REDIS_URL, channel=channel)
+    raise ValueError(f"Unknown event broker: {backend}")
+
+
+def _frame(event: bytes, data: bytes) -> bytes:
+    return b"event: " + event + b"\ndata: " + data + b"\n\n"
+
+
+class QuestionEventHub:
+    def __init__(self, broker: EventBroker, queue_size: int, keepalive: float):
+        self.broker = broker
+        self.queue_size = queue_size
+        self.keepalive = keepalive
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = defaultdict(set)
+        self._task: Optional[asyncio.Task] = None
+        self.connections = 0
+
+    def publish(self, question_id: int, event: str, data: bytes) -> None:
+        """
+        질문 이벤트 발행 - 커밋 이후에 호출 (crud 스레드/이벤트 루프 어디서든)
+
+        data는 한 줄짜리 JSON bytes.
+        """
+        self.broker.publish(b"%d\n%s\n%s" % (question_id, event.encode(), data))
+
+    def _deliver(self, message: bytes) -> None:
+        """브로커에서 받은 메시지를 이 워커의 구독자에게 전달 (이벤트 루프 스레드)"""
+        question_id, event, data = message.split(b"\n", 2)
+        queues = self._subscribers.get(int(question_id))
+        if not queues:
+            return
+        frame = _frame(event, data)
+        for queue in list(queues):
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                self._close(int(question_id), queue)
+                dropped_connections.inc()
+
+    def _close(self, question_id: int, queue: asyncio.Queue) -> None:
+        """구독 해제 후 스트림 종료 신호(None)를 넣음"""
+        self._unsubscribe(question_id, queue)
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    def _subscribe(self, question_id: int) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[question_id].add(queue)
+        return queue
+
+    def _unsubscribe(self, question_id: int, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(question_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[question_id]
+
+    async def stream(self, question_id: int) -> AsyncIterator[bytes]:
+        """한 연결의 SSE 본문 - 유휴 시간이 keepalive를 넘으면 주석 줄로 연결 유지"""
+        queue = self._subscribe(question_id)
+        self.connections += 1
+        try:
+            yield b"retry: %d\n\n" % RETRY_MS
+            while True:
+                try:
+                    frame = await asyncio.wait_for(queue.get(), self.keepalive)
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+                    continue
+                if frame is None:
+                    return
+                yield frame
+        finally:
+            self.connections -= 1
+            self._unsubscribe(question_id, queue)
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self.broker.listen(self._deliver))
+        # memory 브로커가 루프를 등록할 때까지 한 번 양보
+        await asyncio.sleep(0)
+
+    async def stop(self) -> None:
+        """브로커 구독을 멈추고 열린 스트림을 모두 닫음 (종료 시 연결이 남지 않도록)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for question_id, queues in list(self._subscribers.items()):
+            for queue in list(queues):
+                self._close(question_id, queue)
+
+
+question_events = QuestionEventHub(
+    create_broker(settings.EVENTS_BACKEND),
+    queue_size=settings.EVENTS_QUEUE_SIZE,
+    keepalive=settings.EVENTS_KEEPALIVE_SECONDS,
+)
+
+registry.gauge(
+    "semicolon_sse_connections",
+    "Open question event streams in this worker",
+    fn=lambda: question_events.connections,
+)
+dropped_connections = registry.counter(
+    "semicolon_sse_dropped_connections",
+    "Event streams closed because the client fell behind",
+)
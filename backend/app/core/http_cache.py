@@ -0,0 +1,99 @@
+"""
+HTTP 조건부 요청 (ETag / Last-Modified -> 304)
+
+읽기 엔드포인트는 먼저 가벼운 검증자 쿼리(행의 id, updated_at 등)로
+ResourceVersion을 만들고, 클라이언트/프록시가 가진 버전과 같으면 ORM 로드와
+직렬화 없이 304를 돌려준다.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, NamedTuple, Optional
+
+from fastapi import Request, Response, status
+
+from .config import settings
+
+
+class ResourceVersion(NamedTuple):
+    """응답 본문을 결정하는 값들과 그중 가장 최근 수정 시각"""
+
+    key: Any
+    last_modified: Optional[datetime] = None
+
+    @property
+    def etag(self) -> str:
+        # 강한 ETag: 본문에 포함되는 행의 id/수정 시각이 모두 같을 때만 일치
+        digest = hashlib.blake2b(repr(self.key).encode("utf-8"), digest_size=16)
+        return f'"{digest.hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+def _http_date(value: datetime) -> str:
+    # DB에는 UTC naive datetime으로 저장됨
+    return format_datetime(value.replace(tzinfo=timezone.utc), usegmt=True)
+
+
+def _not_modified_since(if_modified_since: str, last_modified: str) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+        modified = parsedate_to_datetime(last_modified)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return modified <= since
+
+
+def conditional_headers(version: ResourceVersion) -> Dict[str, str]:
+    """검증자(ETag, Last-Modified)와 Cache-Control 헤더"""
+    headers = {
+        "ETag": version.etag,
+        "Cache-Control": (
+            f"public, max-age={settings.HTTP_CACHE_MAX_AGE_SECONDS}, "
+            f"s-maxage={settings.HTTP_CACHE_SHARED_MAX_AGE_SECONDS}"
+        ),
+    }
+    if version.last_modified is not None:
+        headers["Last-Modified"] = _http_date(version.last_modified)
+    return headers
+
+
+def is_not_modified(request: Request, headers: Dict[str, str]) -> bool:
+    """
+    요청의 조건부 헤더와 응답 검증자를 비교
+
+    If-None-Match가 있으면 그것만 보고, 없을 때만 If-Modified-Since를 본다.
+    """
+    etag = headers.get("ETag")
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag is not None and _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    last_modified = headers.get("Last-Modified")
+    return (
+        if_modified_since is not None
+        and last_modified is not None
+        and _not_modified_since(if_modified_since, last_modified)
+    )
+
+
+def not_modified_response(headers: Dict[str, str]) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+
+def check_conditional(
+    request: Request, response: Response, version: ResourceVersion
+) -> Optional[Response]:
+    """response에 검증자/Cache-Control 헤더를 달고, 클라이언트 버전이 최신이면 304 반환"""
+    headers = conditional_headers(version)
+    response.headers.update(headers)
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+    return None
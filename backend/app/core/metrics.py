@@ -0,0 +1,279 @@
+"""
+Prometheus 텍스트 형식 메트릭
+
+외부 의존성 없이 카운터/게이지/히스토그램을 워커 프로세스 안에 모으고 /metrics에서
+text exposition format으로 내보낸다. 값은 워커별이므로 스크레이퍼에서 합산한다.
+"""
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+# 요청 지연 시간용 기본 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(names: Sequence[str], values: LabelValues) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+class Metric:
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple([str(labels[name]) for name in self.labelnames])
+
+    def samples(self) -> Iterable[Tuple[str, LabelValues, float]]:
+        """(이름 접미사, 라벨 값, 값) 목록"""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        for suffix, values, value in self.samples():
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}{suffix}{labels} {value}")
+        return lines
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._label_values(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        return [("_total", values, value) for values, value in items]
+
+
+class Gauge(Metric):
+    """set/inc/dec로 값을 갱신하거나, fn을 주면 스크레이프 시점에 계산"""
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        fn: Optional[Callable[[], float]] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._fn = fn
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._label_values(labels)] = value
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        if self._fn is not None:
+            return self._fn()
+        return self._values.get(self._label_values(labels), 0)
+
+    def samples(self):
+        if self._fn is not None:
+            return [("", (), self._fn())]
+        with self._lock:
+            items = list(self._values.items())
+        return [("", values, value) for values, value in items]
+
+
+class Summary(Metric):
+    """관측값의 합계와 개수 (분위수 없음) - rate(_sum) / rate(_count)로 평균"""
+
+    type = "summary"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            total = self._values.setdefault(key, [0.0, 0])
+            total[0] += value
+            total[1] += 1
+
+    def count(self, **labels: str) -> int:
+        return self._values.get(self._label_values(labels), [0.0, 0])[1]
+
+    def samples(self):
+        with self._lock:
+            items = [(values, list(total)) for values, total in self._values.items()]
+        samples = []
+        for values, (total, count) in items:
+            samples.append(("_sum", values, total))
+            samples.append(("_count", values, count))
+        return samples
+
+
+class HistogramSeries:
+    """
+    라벨 값이 정해진 히스토그램 시계열 하나 - Histogram.labels()로 얻음
+
+    요청마다 라벨 dict를 만들고 찾는 비용을 없애려고 호출하는 쪽에서 보관해 재사용한다.
+    """
+
+    __slots__ = ("_buckets", "_lock", "counts", "total")
+
+    def __init__(self, buckets: Tuple[float, ...], lock: threading.Lock):
+        self._buckets = buckets
+        self._lock = lock
+        # 버킷별 개수 (누적 아님, 마지막은 +Inf)
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.total += value
+
+
+class Histogram(Metric):
+    """
+    누적 버킷 히스토그램 - histogram_quantile()로 라우트별 p50/p99 계산
+
+    버킷은 le(이하) 경계 목록이고 +Inf는 자동으로 붙는다.
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values: Dict[LabelValues, HistogramSeries] = {}
+
+    def labels(self, **labels: str) -> HistogramSeries:
+        key = self._label_values(labels)
+        series = self._values.get(key)
+        if series is None:
+            with self._lock:
+                series = self._values.setdefault(
+                    key, HistogramSeries(self.buckets, self._lock)
+                )
+        return series
+
+    def observe(self, value: float, **labels: str) -> None:
+        self.labels(**labels).observe(value)
+
+    def count(self, **labels: str) -> int:
+        series = self._values.get(self._label_values(labels))
+        return sum(series.counts) if series is not None else 0
+
+    def sum(self, **labels: str) -> float:
+        series = self._values.get(self._label_values(labels))
+        return series.total if series is not None else 0.0
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        with self._lock:
+            items = [
+                (key, list(series.counts), series.total)
+                for key, series in self._values.items()
+            ]
+        names = self.labelnames + ("le",)
+        for values, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                labels = _format_labels(names, values + (le,))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {total}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self._lock:
+            # 모듈 재임포트 등으로 같은 이름이 다시 등록되면 기존 것을 재사용
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames=(), fn=None) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, fn))
+
+    def summary(self, name: str, documentation: str, labelnames=()) -> Summary:
+        return self.register(Summary(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collect: Callable[[], None]) -> None:
+        """스크레이프 직전에 호출할 함수 - 라벨이 있는 게이지 값을 채울 때 사용"""
+        with self._lock:
+            self._collectors.append(collect)
+
+    def render(self) -> str:
+        with self._lock:
+            collectors = list(self._collectors)
+        for collect in collectors:
+            collect()
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# /metrics 응답의 Content-Type
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
@@ -0,0 +1,75 @@
+"""
+Alembic 마이그레이션 연동
+
+스키마 생성/변경은 `alembic upgrade head`(배포 단계)에서만 한다. 앱은 시작할 때
+DB의 alembic_version이 SCHEMA_REVISION과 같은지만 확인하므로 워커마다 테이블
+카탈로그를 조회하는 비용이 없다. alembic 자체도 import 비용이 커서(~170ms)
+앱 시작 경로에서는 불러오지 않는다.
+"""
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+# 코드가 기대하는 스키마 리비전 - 마이그레이션을 추가하면 함께 올린다
+# (test_migrations가 migrations/versions의 head와 같은지 확인)
+SCHEMA_REVISION = "0003"
+
+# ORM 밖에서 관리하는 검색 저장소 (app.models.SEARCH_DDL) - autogenerate 비교 제외
+_UNMAPPED_TABLE_PREFIX = "questions_fts"
+_UNMAPPED_COLUMNS = {("questions", "search_vector")}
+
+
+class SchemaOutOfDate(RuntimeError):
+    """DB 스키마 리비전이 코드가 기대하는 리비전과 다름"""
+
+
+def alembic_config(url: Optional[str] = None):
+    """alembic.ini 설정 (url을 주면 .env 대신 그 DB를 대상으로)"""
+    from alembic.config import Config
+
+    config = Config(str(ALEMBIC_INI))
+    if url is not None:
+        config.set_main_option("sqlalchemy.url", url)
+    return config
+
+
+def head_revision() -> Optional[str]:
+    """migrations/versions의 최신 리비전 (마이그레이션 파일을 읽음)"""
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def current_revision(engine: Engine) -> Optional[str]:
+    """DB에 기록된 리비전 - alembic_version 한 행만 읽음 (테이블이 없으면 None)"""
+    try:
+        with engine.connect() as connection:
+            return connection.execute(
+                text("SELECT version_num FROM alembic_version")
+            ).scalar()
+    except DBAPIError:
+        return None
+
+
+def check_schema(engine: Engine) -> None:
+    """DB 리비전이 SCHEMA_REVISION이 아니면 SchemaOutOfDate - 시작 단계에서 바로 실패"""
+    current = current_revision(engine)
+    if current != SCHEMA_REVISION:
+        raise SchemaOutOfDate(
+            f"DB 스키마 리비전({current})이 코드({SCHEMA_REVISION})와 다릅니다. "
+            "`alembic upgrade head`를 먼저 실행하세요."
+        )
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    """autogenerate가 SEARCH_DDL로 만든 테이블/컬럼을 삭제 대상으로 잡지 않게 함"""
+    if type_ == "table":
+        return not name.startswith(_UNMAPPED_TABLE_PREFIX)
+    if type_ == "column":
+        return (obj.table.name, name) not in _UNMAPPED_COLUMNS
+    return True
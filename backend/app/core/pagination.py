@@ -0,0 +1,47 @@
+"""
+커서 기반(keyset) 페이지네이션을 위한 커서 인코딩/디코딩
+
+커서는 (정렬 키 값, id)이며 최신순이 아닌 정렬이면 정렬 이름도 함께 담아
+다른 정렬의 커서를 잘못 이어 쓰지 못하게 한다.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Tuple, Union
+
+SortValue = Union[datetime, int]
+
+DEFAULT_SORT = "newest"
+
+
+class InvalidCursorError(ValueError):
+    """디코딩할 수 없거나 변조된 커서"""
+
+
+def encode_cursor(value: SortValue, id: int, sort: str = DEFAULT_SORT) -> str:
+    """(정렬 키 값, id)를 클라이언트에 전달할 불투명한 문자열로 인코딩"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = [value, id] if sort == DEFAULT_SORT else [value, id, sort]
+    raw = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(
+    cursor: str, sort: str = DEFAULT_SORT, value_type: type = datetime
+) -> Tuple[SortValue, int]:
+    """encode_cursor로 만든 커서를 (정렬 키 값, id)로 복원 - 정렬/값 타입이 다르면 거부"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        value, id, *rest = payload
+        if (rest[0] if rest else DEFAULT_SORT) != sort or len(rest) > 1:
+            raise ValueError("cursor belongs to another sort")
+        if value_type is datetime:
+            value = datetime.fromisoformat(value)
+        elif type(value) is not value_type:
+            raise TypeError(value)
+        return value, int(id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as exc:
+        raise InvalidCursorError(cursor) from exc
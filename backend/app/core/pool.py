@@ -0,0 +1,108 @@
+"""
+DB 커넥션 풀 크기 계산과 계측
+
+한 호스트(또는 클러스터)의 앱 전체가 쓸 수 있는 연결 수
+(DATABASE_MAX_CONNECTIONS)를 워커 수(WEB_CONCURRENCY)로 나눠 워커별 풀 크기를
+정한다. 기본은 overflow 없이 고정 크기 풀 - 순간 부하마다 연결을 새로 열고 닫는
+연결 폭주 대신 pool_timeout 동안 기다렸다가 실패(503)시킨다.
+"""
+import time
+from typing import List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from .metrics import registry
+
+pool_checkout_wait = registry.summary(
+    "semicolon_db_pool_checkout_wait_seconds",
+    "Time spent acquiring a pooled connection (queue wait + new connects)",
+    labelnames=("pool",),
+)
+pool_timeouts = registry.counter(
+    "semicolon_db_pool_timeouts",
+    "Checkouts that gave up after pool_timeout",
+    labelnames=("pool",),
+)
+pool_size_gauge = registry.gauge(
+    "semicolon_db_pool_size", "Configured pool size", labelnames=("pool",)
+)
+pool_checked_out_gauge = registry.gauge(
+    "semicolon_db_pool_checked_out",
+    "Connections currently checked out",
+    labelnames=("pool",),
+)
+pool_overflow_gauge = registry.gauge(
+    "semicolon_db_pool_overflow",
+    "Connections open beyond pool_size (negative: not yet opened)",
+    labelnames=("pool",),
+)
+
+
+class PoolSizes(NamedTuple):
+    pool_size: int
+    max_overflow: int
+
+
+def pool_sizes(
+    max_connections: int,
+    workers: int,
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None,
+) -> PoolSizes:
+    """워커 하나의 (pool_size, max_overflow) - 명시값이 없으면 예산을 워커 수로 나눔"""
+    per_worker = max(1, max_connections // max(1, workers))
+    if pool_size is None:
+        pool_size = per_worker
+    if max_overflow is None:
+        max_overflow = max(0, per_worker - pool_size)
+    return PoolSizes(pool_size, max_overflow)
+
+
+def _timed_get(pool, do_get):
+    name = pool.logging_name or "default"
+    started = time.perf_counter()
+    try:
+        return do_get()
+    except exc.TimeoutError:
+        pool_timeouts.inc(pool=name)
+        raise
+    finally:
+        pool_checkout_wait.observe(time.perf_counter() - started, pool=name)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """체크아웃 대기 시간/타임아웃을 기록하는 QueuePool (라벨은 pool_logging_name)"""
+
+    def _do_get(self):
+        return _timed_get(self, super()._do_get)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncEngine용 InstrumentedQueuePool"""
+
+    def _do_get(self):
+        return _timed_get(self, super()._do_get)
+
+
+_engines: List[Tuple[str, Engine]] = []
+
+
+def _collect() -> None:
+    # dispose() 후에는 engine.pool이 새 객체이므로 스크레이프마다 engine에서 다시 꺼냄
+    for name, engine in _engines:
+        pool = engine.pool
+        if not isinstance(pool, QueuePool):
+            continue
+        pool_size_gauge.set(pool.size(), pool=name)
+        pool_checked_out_gauge.set(pool.checkedout(), pool=name)
+        pool_overflow_gauge.set(pool.overflow(), pool=name)
+
+
+def instrument_engine(name: str, engine: Engine) -> None:
+    """engine(AsyncEngine이면 sync_engine)의 풀 상태를 /metrics 게이지로 노출"""
+    _engines.append((name, engine))
+
+
+registry.add_collector(_collect)
@@ -0,0 +1,51 @@
+"""
+인증된 사용자(principal) 캐시
+
+토큰 subject(username)마다 사용자 스냅샷(id, username, is_active)을 캐시해
+인증이 필요한 요청마다 users 테이블을 조회하지 않도록 한다. 사용자 정보가
+바뀌거나 비활성화되면 crud에서 invalidate_principal을 호출한다.
+"""
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from .cache import create_cache
+from .config import settings
+from .metrics import registry
+
+
+@dataclass(frozen=True)
+class Principal:
+    id: int
+    username: str
+    is_active: bool
+
+
+principal_cache = create_cache(
+    settings.PRINCIPAL_CACHE_BACKEND,
+    namespace="principal",
+    maxsize=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+principal_cache_requests = registry.counter(
+    "semicolon_principal_cache_requests",
+    "Authenticated user snapshot cache lookups",
+    labelnames=("result",),
+)
+
+
+def get_cached_principal(username: str) -> Optional[Principal]:
+    snapshot = principal_cache.get(username)
+    principal_cache_requests.inc(result="miss" if snapshot is None else "hit")
+    return Principal(**snapshot) if snapshot is not None else None
+
+
+def cache_principal(user) -> Principal:
+    """ORM User에서 스냅샷을 만들어 캐시에 저장"""
+    principal = Principal(id=user.id, username=user.username, is_active=user.is_active)
+    principal_cache.set(principal.username, asdict(principal))
+    return principal
+
+
+def invalidate_principal(username: str) -> None:
+    principal_cache.delete(username)
@@ -0,0 +1,228 @@
+"""
+요청 수 제한(token bucket)과 동시 처리 상한 - 과부하 시 빨리 거절
+
+RateLimitMiddleware는 요청마다
+
+1. 진행 중 요청이 MAX_IN_FLIGHT_REQUESTS 이상이면 503 (워커 단위)
+2. 로그인/회원가입(POST)은 클라이언트 IP별 엄격한 버킷 (요청마다 bcrypt를 돌리므로)
+3. 그 밖의 요청은 유효한 토큰이 있으면 사용자별, 없으면 IP별 버킷
+
+을 확인하고 토큰이 없으면 429로 거절한다. 두 응답 모두 Retry-After를 붙인다.
+/health, /metrics는 제한하지 않고, 오래 열려 있는 SSE 스트림(.../events)은 버킷만
+확인하고 동시 처리 수에는 세지 않는다.
+
+버킷 저장소는 memory(워커 내부, 실제 한도는 워커 수만큼 곱해짐)와 redis(워커/호스트
+공유, Lua 스크립트로 원자적으로 갱신)가 있다. redis 오류 시에는 요청을 통과시킨다.
+IP는 ASGI scope의 client이므로 프록시 뒤에서는 uvicorn --proxy-headers가 필요하다.
+"""
+
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, Tuple
+
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+
+from .config import settings
+from .metrics import registry
+from .replicas import request_identity
+
+logger = logging.getLogger(__name__)
+
+rejected_requests = registry.counter(
+    "semicolon_rate_limited_requests",
+    "Requests rejected by the rate limiter, by limit (ip / user / auth / in_flight)",
+    labelnames=("limit",),
+)
+
+
+class BucketStore:
+    """token bucket 저장소 공통 인터페이스"""
+
+    async def take(self, key: str, rate: float, burst: float) -> float:
+        """
+        key 버킷에서 토큰 1개를 꺼냄 - 성공하면 0, 부족하면 다시 시도할 때까지 남은 초
+
+        rate는 초당 채워지는 토큰 수, burst는 버킷 용량.
+        """
+        raise NotImplementedError
+
+
+class MemoryBucketStore(BucketStore):
+    """
+    워커 프로세스 안의 버킷 - 이벤트 루프 스레드에서만 호출되므로 잠금 없음
+
+    키가 maxsize를 넘으면 가장 오래 안 쓴 버킷부터 버린다 (버려진 버킷은 가득 찬
+    상태로 다시 시작).
+    """
+
+    def __init__(self, maxsize: int = 100_000):
+        self.maxsize = maxsize
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def take(self, key: str, rate: float, burst: float) -> float:
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(key, (burst, now))
+        tokens = min(burst, tokens + (now - updated) * rate)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / rate
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.maxsize:
+            self._buckets.popitem(last=False)
+        return wait
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+# 시각은 redis 서버 기준(TIME) - 호스트 간 시계 차이의 영향을 받지 않음.
+# Lua 숫자는 정수로 잘려 응답되므로 대기 시간은 문자열로 돌려줌
+_TAKE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or burst
+local updated = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+else
+  wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return tostring(wait)
+"""
+
+
+class RedisBucketStore(BucketStore):
+    """redis.asyncio 클라이언트 위의 공유 버킷 (버킷이 가득 찰 시간이 지나면 키 만료)"""
+
+    def __init__(self, client: Any, namespace: str = "rate-limit"):
+        self.client = client
+        self.namespace = namespace
+        self._script = client.register_script(_TAKE_SCRIPT)
+
+    async def take(self, key: str, rate: float, burst: float) -> float:
+        wait = await self._script(keys=[f"{self.namespace}:{key}"], args=[rate, burst])
+        return float(wait)
+
+
+def create_bucket_store(backend: str) -> BucketStore:
+    """설정값(memory / redis)에 맞는 버킷 저장소 생성"""
+    if backend == "memory":
+        return MemoryBucketStore()
+    if backend == "redis":
+        import redis.asyncio  # 선택 의존성: pip install -e ".[redis]"
+
+        return RedisBucketStore(redis.asyncio.Redis.from_url(settings.CACHE_REDIS_URL))
+    raise ValueError(f"Unknown rate limit backend: {backend}")
+
+
+def _error_response(status_code: int, error: str, message: str, retry_after: float):
+    return JSONResponse(
+        status_code=status_code,
+        content={"detail": {"error": error, "message": message}},
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+class RateLimitMiddleware:
+    def __init__(
+        self,
+        app,
+        store: BucketStore,
+        ip_rate: float,
+        ip_burst: float,
+        user_rate: float,
+        user_burst: float,
+        auth_rate: float,
+        auth_burst: float,
+        auth_paths: Iterable[str] = (),
+        max_in_flight: int = 0,
+        exempt_paths: Iterable[str] = ("/health", "/metrics"),
+        stream_suffixes: Tuple[str, ...] = ("/events",),
+    ):
+        self.app = app
+        self.store = store
+        self.ip_limit = (ip_rate, ip_burst)
+        self.user_limit = (user_rate, user_burst)
+        self.auth_limit = (auth_rate, auth_burst)
+        self.auth_paths = frozenset(auth_paths)
+        self.max_in_flight = max_in_flight
+        self.exempt_paths = frozenset(exempt_paths)
+        self.stream_suffixes = stream_suffixes
+        self.in_flight = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        streaming = scope["path"].endswith(self.stream_suffixes)
+        if (
+            self.max_in_flight
+            and not streaming
+            and self.in_flight >= self.max_in_flight
+        ):
+            rejected_requests.inc(limit="in_flight")
+            response = _error_response(
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+                "SERVICE_BUSY",
+                "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요.",
+                retry_after=1,
+            )
+            await response(scope, receive, send)
+            return
+
+        limit, wait = await self._check(scope)
+        if wait > 0:
+            rejected_requests.inc(limit=limit)
+            response = _error_response(
+                status.HTTP_429_TOO_MANY_REQUESTS,
+                "RATE_LIMITED",
+                "요청이 너무 많습니다. 잠시 후 다시 시도해 주세요.",
+                retry_after=wait,
+            )
+            await response(scope, receive, send)
+            return
+
+        if streaming:
+            await self.app(scope, receive, send)
+            return
+        self.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+
+    async def _check(self, scope) -> Tuple[str, float]:
+        """(적용한 제한 이름, 대기 초) - 통과면 대기 0"""
+        if scope["method"] == "POST" and scope["path"] in self.auth_paths:
+            client = scope.get("client")
+            limit, key = "auth", f"auth:{client[0] if client else '-'}"
+            rate, burst = self.auth_limit
+        else:
+            identity = request_identity(Request(scope)) or "ip:-"
+            limit = "user" if identity.startswith("user:") else "ip"
+            key = identity
+            rate, burst = self.user_limit if limit == "user" else self.ip_limit
+        if rate <= 0:
+            return limit, 0.0
+        try:
+            return limit, await self.store.take(key, rate, burst)
+        except Exception:
+            # 공유 저장소 장애로 전체 요청을 막지 않음 - 제한 없이 통과
+            logger.warning("요청 수 제한 저장소 오류 - 제한 없이 통과", exc_info=True)
+            return limit, 0.0
@@ -0,0 +1,178 @@
+"""
+읽기 전용 복제본 라우팅
+
+GET 전용 의존성(get_read_db)은 건강한 복제본 중 하나를 라운드 로빈으로 골라
+세션을 열고, 쓰기(get_db)는 항상 primary로 간다. 복제 지연 때문에 방금 쓴
+내용이 안 보이는 일을 막기 위해, 쓰기를 커밋한 사용자(토큰 subject, 없으면
+클라이언트 IP)의 읽기는 READ_YOUR_WRITES_SECONDS 동안 primary로 보낸다.
+
+복제본 상태는 lifespan의 주기적 SELECT 1과, 요청 중 연결 끊김 오류(handle_error)
+두 경로로 갱신한다. 건강한 복제본이 없으면 읽기도 primary로 간다.
+"""
+
+import asyncio
+import itertools
+import logging
+from typing import Any, Callable, List, Optional
+
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event, text
+
+from .cache import create_cache
+from .config import settings
+from .metrics import registry
+
+logger = logging.getLogger(__name__)
+
+read_routes = registry.counter(
+    "semicolon_db_reads",
+    "Read-only sessions opened, by target (primary / replica name)",
+    labelnames=("target",),
+)
+replica_up = registry.gauge(
+    "semicolon_db_replica_up",
+    "1 if the replica passed its last health check",
+    labelnames=("replica",),
+)
+
+# 최근에 쓰기를 커밋한 사용자 - 워커가 여러 개면 공유 백엔드(redis)여야 워커 간에도 유지
+recent_writers = create_cache(
+    settings.READ_YOUR_WRITES_BACKEND,
+    namespace="recent-writer",
+    maxsize=100_000,
+    ttl=settings.READ_YOUR_WRITES_SECONDS,
+)
+
+
+def request_identity(request: Request) -> Optional[str]:
+    """읽기/쓰기를 같은 사용자로 묶는 키 - 토큰 subject, 없으면 클라이언트 IP"""
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        from .security import decode_access_token
+
+        username = decode_access_token(token)
+        if username is not None:
+            return f"user:{username}"
+    if request.client is not None:
+        return f"ip:{request.client.host}"
+    return None
+
+
+def mark_write(identity: Optional[str]) -> None:
+    if identity is not None and settings.READ_YOUR_WRITES_SECONDS > 0:
+        recent_writers.set(identity, 1)
+
+
+def wrote_recently(identity: Optional[str]) -> bool:
+    return identity is not None and recent_writers.get(identity) is not None
+
+
+def cache_readable(db: Any) -> bool:
+    """
+    get_read_db 세션으로 응답 캐시를 읽어도 되는지
+
+    최근에 쓴 사용자는 primary에서 읽어야 하는데, 캐시에는 무효화 직후 다른 사용자가
+    지연된 복제본에서 읽어 다시 채운 옛 응답이 있을 수 있으므로 건너뛴다.
+    """
+    return not db.info.get("recent_writer")
+
+
+def replica_cache_ttl(db: Any) -> Optional[float]:
+    """
+    복제본에서 읽어 만든 응답의 캐시 TTL
+
+    무효화 직후 지연된 복제본이 옛 데이터로 캐시를 다시 채울 수 있으므로
+    복제 지연 허용치(READ_YOUR_WRITES_SECONDS)만큼만 보관한다.
+    """
+    if db.info.get("replica") is None:
+        return None
+    return settings.READ_YOUR_WRITES_SECONDS
+
+
+class Replica:
+    def __init__(self, name: str, engine: Any, session_factory: Callable[[], Any]):
+        self.name = name
+        self.engine = engine
+        self.session_factory = session_factory
+        self.healthy = True
+        replica_up.set(1, replica=name)
+        sync_engine = getattr(engine, "sync_engine", engine)
+        event.listen(sync_engine, "handle_error", self._on_error)
+
+    def _on_error(self, context) -> None:
+        # 연결이 끊긴 복제본은 다음 헬스 체크가 통과할 때까지 제외
+        if context.is_disconnect:
+            self.mark(False)
+
+    def mark(self, healthy: bool) -> None:
+        if healthy != self.healthy:
+            logger.warning(
+                "복제본 %s %s", self.name, "복구" if healthy else "제외 (연결 실패)"
+            )
+        self.healthy = healthy
+        replica_up.set(int(healthy), replica=self.name)
+
+    def _ping_sync(self) -> None:
+        with self.engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    async def ping(self) -> bool:
+        try:
+            if hasattr(self.engine, "sync_engine"):
+                async with self.engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+            else:
+                await run_in_threadpool(self._ping_sync)
+        except Exception:
+            return False
+        return True
+
+
+class ReplicaRouter:
+    """건강한 복제본을 라운드 로빈으로 고름"""
+
+    def __init__(self, replicas: List[Replica], interval: float):
+        self.replicas = replicas
+        self.interval = interval
+        self._next = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+
+    def pick(self) -> Optional[Replica]:
+        """다음 차례부터 건강한 복제본 하나 (없으면 None -> primary)"""
+        count = len(self.replicas)
+        if count == 0:
+            return None
+        start = next(self._next)
+        for offset in range(count):
+            replica = self.replicas[(start + offset) % count]
+            if replica.healthy:
+                return replica
+        return None
+
+    async def check(self) -> int:
+        """전체 헬스 체크 - 건강한 복제본 수를 반환"""
+        results = await asyncio.gather(*(replica.ping() for replica in self.replicas))
+        for replica, healthy in zip(self.replicas, results):
+            replica.mark(healthy)
+        return sum(results)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.check()
+
+    def start(self) -> None:
+        """워커의 이벤트 루프에서 주기적 헬스 체크 시작 (lifespan에서 호출)"""
+        if self.replicas and self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
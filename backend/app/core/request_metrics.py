@@ -0,0 +1,170 @@
+"""
+요청 단위 메트릭 - 라우트별 지연 시간, 응답 크기, 진행 중 요청 수, 요청당 SQL
+
+MetricsMiddleware는 순수 ASGI 미들웨어다 (BaseHTTPMiddleware는 요청마다 태스크와
+메모리 스트림을 만들어 그 자체로 오버헤드가 크다). route 라벨은 매칭된 경로
+템플릿(/api/v1/questions/{question_id})이라 id마다 시계열이 늘어나지 않는다.
+
+SQL 문 수와 시간은 Engine 클래스의 before/after_cursor_execute 이벤트로 재서
+요청마다 contextvar에 둔 RequestStats에 더한다. run_in_threadpool과 run_sync는
+컨텍스트를 넘겨받으므로 스레드풀/greenlet 안에서 실행된 쿼리도 같은 요청에 잡힌다.
+"""
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .metrics import HistogramSeries, registry
+
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SQL_SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+request_duration = registry.histogram(
+    "semicolon_http_request_duration_seconds",
+    "Request latency by route template",
+    labelnames=("method", "route", "status"),
+)
+response_size = registry.histogram(
+    "semicolon_http_response_size_bytes",
+    "Response body size by route template",
+    labelnames=("method", "route"),
+    buckets=SIZE_BUCKETS,
+)
+# 미들웨어는 이벤트 루프 스레드에서만 돌므로 잠금 없는 정수로 세고 스크레이프 때 읽음
+_in_flight = 0
+requests_in_flight = registry.gauge(
+    "semicolon_http_requests_in_flight",
+    "Requests currently being handled",
+    fn=lambda: _in_flight,
+)
+request_statements = registry.histogram(
+    "semicolon_db_statements_per_request",
+    "SQL statements executed while handling a request",
+    labelnames=("route",),
+    buckets=STATEMENT_BUCKETS,
+)
+request_sql_seconds = registry.histogram(
+    "semicolon_db_seconds_per_request",
+    "Time spent executing SQL statements while handling a request",
+    labelnames=("route",),
+    buckets=SQL_SECONDS_BUCKETS,
+)
+
+
+class RequestStats:
+    __slots__ = ("statements", "sql_seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.sql_seconds = 0.0
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> Optional[RequestStats]:
+    """처리 중인 요청의 SQL 집계 (요청 밖이면 None)"""
+    return _current.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info["query_started"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.pop("query_started", None)
+    stats = _current.get()
+    if stats is not None and started is not None:
+        stats.statements += 1
+        stats.sql_seconds += time.perf_counter() - started
+
+
+def instrument_sql() -> None:
+    """모든 엔진(primary, 복제본, AsyncEngine의 sync_engine)에 SQL 계측 연결"""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def uninstrument_sql() -> None:
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.remove(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def route_template(scope) -> str:
+    # FastAPI 0.137부터 include_router로 붙인 라우트는 scope["route"]가 prefix 없는
+    # 원래 APIRoute라 prefix까지 붙은 템플릿은 effective_route_context에서 꺼냄 (비공개
+    # 키 - 없어지면 test_router_roots_keep_their_prefix가 잡음). 그 전 버전은
+    # include_router가 prefix를 붙인 복사본을 만들어 scope["route"]가 곧 전체 템플릿.
+    route = scope.get("fastapi", {}).get("effective_route_context")
+    if route is None:
+        route = scope.get("route")
+    if route is None:
+        # 매칭 안 된 경로(404)는 한 시계열로 - 임의 URL로 라벨이 늘지 않게
+        return "unmatched"
+    return getattr(route, "path_format", None) or getattr(route, "path", "unmatched")
+
+
+# (method, route, status) -> 그 요청이 기록할 시계열들 (라벨 조회는 조합당 한 번)
+_series: Dict[Tuple[str, str, str], Tuple[HistogramSeries, ...]] = {}
+
+
+def _request_series(
+    method: str, route: str, status: str
+) -> Tuple[HistogramSeries, ...]:
+    key = (method, route, status)
+    series = _series.get(key)
+    if series is None:
+        series = _series[key] = (
+            request_duration.labels(method=method, route=route, status=status),
+            response_size.labels(method=method, route=route),
+            request_statements.labels(route=route),
+            request_sql_seconds.labels(route=route),
+        )
+    return series
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        # 응답을 시작하기 전에 예외가 나면 ServerErrorMiddleware가 500으로 응답
+        status_code = 500
+        size = 0
+
+        async def send_with_metrics(message):
+            nonlocal status_code, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        global _in_flight
+        _in_flight += 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            elapsed = time.perf_counter() - started
+            _in_flight -= 1
+            _current.reset(token)
+            duration, body_size, statements, sql_seconds = _request_series(
+                scope["method"], route_template(scope), str(status_code)
+            )
+            duration.observe(elapsed)
+            body_size.observe(size)
+            statements.observe(stats.statements)
+            sql_seconds.observe(stats.sql_seconds)
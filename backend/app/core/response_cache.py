@@ -0,0 +1,272 @@
+"""
+질문 조회 응답 캐시
+
+질문 상세(전체)/답변 목록/질문 목록 응답을 직렬화된 JSON bytes(+ ETag 등 헤더)로
+캐시해 같은 페이지를 다시 조회·직렬화하지 않도록 한다.
+
+- 상세/답변 목록/전체는 키에 질문별 세대(generation) 토큰을, 목록은 어떤 질문이
+  바뀌어도 달라질 수 있으므로 전체 목록 세대 토큰을 넣는다. 무효화 시 토큰만 바꿔
+  이전 세대 항목이 LRU/TTL로 빠지게 한다.
+- 핸들러는 DB를 읽기 전에 키를 만든다. 읽는 도중 무효화되면 읽은 응답은 이미
+  지나간 세대 키로 저장되므로 다시 조회되지 않는다.
+
+질문/답변을 바꾸는 crud 함수가 invalidate_question을 호출한다 (커밋 이후).
+조회수 반영(view_counter)과 작성자 프로필 변경처럼 간접적인 변경은 무효화하지 않으므로
+TTL 동안 반영이 늦을 수 있다.
+
+memory 백엔드는 워커마다 따로 있으므로, 무효화를 이벤트 브로커(EVENTS_BACKEND=redis)로
+다른 워커에도 보낸다. 워커가 여러 개인데 브로커도 memory면 다른 워커는 TTL 동안 이전
+응답을 줄 수 있다 (시작 시 경고).
+"""
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from fastapi import Request, Response
+
+from .cache import CacheBackend, MemoryCache, create_cache, run_cache
+from .config import settings
+from .events import EventBroker, create_broker
+from .http_cache import is_not_modified, not_modified_response
+from .metrics import registry
+
+logger = logging.getLogger(__name__)
+
+_LIST_GENERATION_KEY = "questions:generation"
+_QUESTION_GENERATION_KEY = "question:generation:{}"
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    headers: Dict[str, str]
+
+    def pack(self) -> bytes:
+        # 공유 저장소에도 그대로 넣을 수 있도록 "헤더 JSON \n 본문" 한 덩어리로 저장
+        return json.dumps(self.headers).encode("utf-8") + b"\n" + self.body
+
+    @classmethod
+    def unpack(cls, raw: bytes) -> "CachedResponse":
+        headers, _, body = raw.partition(b"\n")
+        return cls(body=body, headers=json.loads(headers))
+
+    def to_response(self, request: Request) -> Response:
+        """조건부 요청이면 304, 아니면 캐시된 본문 그대로"""
+        if self.headers and is_not_modified(request, self.headers):
+            return not_modified_response(self.headers)
+        return Response(
+            content=self.body, media_type="application/json", headers=self.headers
+        )
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        backend: CacheBackend,
+        enabled: bool = True,
+        broker: Optional[EventBroker] = None,
+    ):
+        self.backend = backend
+        self.enabled = enabled
+        # 워커 간 무효화 전달 - 자기가 보낸 메시지는 origin으로 걸러냄
+        self.broker = broker
+        self._origin = uuid.uuid4().hex.encode()
+        self._task: Optional[asyncio.Task] = None
+
+    def _generation(self, key: str) -> str:
+        generation = self.backend.get(key)
+        if generation is None:
+            # 세대 토큰이 축출/만료되면 새 토큰으로 시작 (이전 세대 항목은 버려짐)
+            generation = uuid.uuid4().hex
+            self.backend.set(key, generation)
+        return generation
+
+    def _question_key(self, kind: str, question_id: int) -> str:
+        if not self.enabled:
+            return ""
+        generation = self._generation(_QUESTION_GENERATION_KEY.format(question_id))
+        return f"{kind}:{question_id}:{generation}"
+
+    def question_key(self, question_id: int) -> str:
+        return self._question_key("question", question_id)
+
+    def answers_key(self, question_id: int) -> str:
+        return self._question_key("answers", question_id)
+
+    def full_key(self, question_id: int) -> str:
+        return self._question_key("full", question_id)
+
+    def list_key(self, **params) -> str:
+        if not self.enabled:
+            return ""
+        generation = self._generation(_LIST_GENERATION_KEY)
+        query = "&".join(f"{name}={params[name]}" for name in sorted(params))
+        return f"questions:{generation}:{query}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        if not self.enabled:
+            return None
+        raw = self.backend.get(key)
+        if raw is None:
+            response_cache_requests.inc(result="miss")
+            return None
+        response_cache_requests.inc(result="hit")
+        return CachedResponse.unpack(raw)
+
+    def set(
+        self,
+        key: str,
+        body: bytes,
+        headers: Optional[Dict[str, str]] = None,
+        ttl: Optional[float] = None,
+    ) -> CachedResponse:
+        """ttl을 주면 백엔드 기본 TTL 대신 사용 (복제본에서 읽은 응답 등)"""
+        entry = CachedResponse(body=body, headers=headers or {})
+        if self.enabled:
+            self.backend.set(key, entry.pack(), ttl=ttl)
+        return entry
+
+    async def lookup(
+        self,
+        make_key: Callable[..., str],
+        *args: Any,
+        readable: bool = True,
+        **kwargs: Any,
+    ) -> Tuple[str, Optional[CachedResponse]]:
+        """
+        핸들러용 - make_key로 키를 만들고 readable이면 캐시된 응답도 조회
+
+        공유 저장소(redis)면 두 호출을 스레드풀에서 한 번에 실행한다.
+        """
+
+        def _lookup() -> Tuple[str, Optional[CachedResponse]]:
+            key = make_key(*args, **kwargs)
+            return key, self.get(key) if readable else None
+
+        return await run_cache(self.backend, _lookup)
+
+    async def store(
+        self,
+        key: str,
+        body: bytes,
+        headers: Optional[Dict[str, str]] = None,
+        ttl: Optional[float] = None,
+    ) -> CachedResponse:
+        """핸들러용 set - 공유 저장소(redis)면 스레드풀에서 실행"""
+        return await run_cache(self.backend, self.set, key, body, headers, ttl)
+
+    def invalidate_lists(self) -> None:
+        self.invalidate_questions([])
+
+    def invalidate_questions(self, question_ids: Iterable[int]) -> None:
+        """질문들의 상세/답변 목록/전체와 모든 질문 목록 무효화"""
+        question_ids = list(question_ids)
+        self._invalidate(question_ids)
+        self._broadcast(
+            b"questions",
+            b",".join(b"%d" % question_id for question_id in question_ids),
+        )
+
+    def invalidate_question(self, question_id: int) -> None:
+        self.invalidate_questions([question_id])
+
+    def clear(self) -> None:
+        self.backend.clear()
+        self._broadcast(b"clear", b"")
+
+    def _invalidate(self, question_ids: List[int]) -> None:
+        for question_id in question_ids:
+            self.backend.set(
+                _QUESTION_GENERATION_KEY.format(question_id), uuid.uuid4().hex
+            )
+        self.backend.set(_LIST_GENERATION_KEY, uuid.uuid4().hex)
+
+    def _broadcast(self, action: bytes, payload: bytes) -> None:
+        if self.broker is not None:
+            self.broker.publish(b"\n".join((self._origin, action, payload)))
+
+    def _receive(self, message: bytes) -> None:
+        """다른 워커가 보낸 무효화를 이 워커의 캐시에 적용 (이벤트 루프 스레드)"""
+        origin, action, payload = message.split(b"\n", 2)
+        if origin == self._origin:
+            return
+        if action == b"clear":
+            self.backend.clear()
+            return
+        question_ids = [
+            int(question_id) for question_id in payload.split(b",") if question_id
+        ]
+        self._invalidate(question_ids)
+
+    async def start(self) -> None:
+        if self.broker is None:
+            if (
+                self.enabled
+                and isinstance(self.backend, MemoryCache)
+                and settings.WEB_CONCURRENCY > 1
+            ):
+                logger.warning(
+                    "워커가 %d개인데 응답 캐시 무효화를 다른 워커에 전달할 수 없습니다 - "
+                    "RESPONSE_CACHE_BACKEND=redis 또는 EVENTS_BACKEND=redis로 설정하세요.",
+                    settings.WEB_CONCURRENCY,
+                )
+            return
+        self._task = asyncio.create_task(self.broker.listen(self._receive))
+        await asyncio.sleep(0)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+def _invalidation_broker(backend: CacheBackend) -> Optional[EventBroker]:
+    """워커 내부(memory) 캐시일 때만 - 공유 저장소는 삭제가 이미 모든 워커에 보임"""
+    if not isinstance(backend, MemoryCache) or settings.EVENTS_BACKEND == "memory":
+        return None
+    return create_broker(
+        settings.EVENTS_BACKEND, channel="semicolon:response-cache-invalidations"
+    )
+
+
+_backend = create_cache(
+    settings.RESPONSE_CACHE_BACKEND,
+    namespace="response",
+    maxsize=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+    maxbytes=settings.RESPONSE_CACHE_MAX_BYTES,
+)
+response_cache = ResponseCache(
+    _backend,
+    enabled=settings.RESPONSE_CACHE_ENABLED,
+    broker=_invalidation_broker(_backend),
+)
+
+response_cache_requests = registry.counter(
+    "semicolon_response_cache_requests",
+    "Response cache lookups by result (hit/miss)",
+    labelnames=("result",),
+)
+
+
+def _memory_backend() -> Optional[MemoryCache]:
+    backend = response_cache.backend
+    return backend if isinstance(backend, MemoryCache) else None
+
+
+# 공유 저장소(redis)의 메모리는 저장소 쪽 지표로 본다
+registry.gauge(
+    "semicolon_response_cache_bytes",
+    "Bytes held by the in-process response cache",
+    fn=lambda: getattr(_memory_backend(), "nbytes", 0),
+)
+registry.gauge(
+    "semicolon_response_cache_entries",
+    "Entries held by the in-process response cache",
+    fn=lambda: len(_memory_backend() or ()),
+)
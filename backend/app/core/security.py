@@ -1,10 +1,21 @@
+import asyncio
+import hashlib
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Optional, Tuple, TypeVar
 
+from fastapi.concurrency import run_in_threadpool
 from jose import JWTError, jwt
 import bcrypt
 
+from ..core.cache import MemoryCache
 from ..core.config import settings
+from ..core.metrics import registry
+
+T = TypeVar("T")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -14,13 +25,110 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     )
 
 
-def get_password_hash(password: str) -> str:
+def get_password_hash(password: str, rounds: Optional[int] = None) -> str:
     return bcrypt.hashpw(
         password.encode('utf-8'), 
-        bcrypt.gensalt()
+        bcrypt.gensalt(rounds or settings.BCRYPT_ROUNDS)
     ).decode('utf-8')
 
 
+def password_hash_rounds(hashed_password: str) -> int:
+    """bcrypt 해시($2b$<cost>$...)에 기록된 cost factor"""
+    return int(hashed_password.split("$")[2])
+
+
+# bcrypt 자체에 걸린 시간 (해싱 프로세스 안에서 잰 값, 대기열 시간 제외)
+password_hash_seconds = registry.histogram(
+    "semicolon_password_hash_seconds",
+    "CPU time of a single bcrypt hash/verify",
+    labelnames=("operation",),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0),
+)
+
+
+def _timed(fn: Callable[..., T], *args) -> Tuple[T, float]:
+    # 프로세스 풀에서 실행되므로 메트릭은 결과와 함께 돌려받아 부모에서 기록
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+class PasswordHasherBusy(Exception):
+    """해싱 대기열이 가득 참 - 503으로 응답"""
+
+
+class PasswordHasher:
+    """
+    bcrypt 해싱/검증 전용 프로세스 풀
+
+    bcrypt 한 번에 수백 ms의 CPU를 쓰므로 요청을 처리하는 워커의 스레드풀에서
+    돌리면 로그인이 몰릴 때 다른 요청까지 밀린다. 별도 프로세스에서 실행하고,
+    대기 중인 작업이 max_pending을 넘으면 기다리지 않고 PasswordHasherBusy를 낸다.
+    workers=0이면 프로세스 없이 스레드풀에서 실행 (개발/테스트용).
+    """
+
+    def __init__(self, workers: int, max_pending: int, rounds: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.rounds = rounds
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    async def hash(self, password: str) -> str:
+        return await self._submit("hash", get_password_hash, password, self.rounds)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(
+            "verify", verify_password, plain_password, hashed_password
+        )
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """설정된 cost와 다른 해시인지 - 로그인 성공 시 새 cost로 재해싱"""
+        return password_hash_rounds(hashed_password) != self.rounds
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def _submit(self, operation: str, fn: Callable[..., T], *args) -> T:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise PasswordHasherBusy()
+            self._pending += 1
+        try:
+            if self.workers <= 0:
+                result, elapsed = await run_in_threadpool(_timed, fn, *args)
+            else:
+                loop = asyncio.get_running_loop()
+                result, elapsed = await loop.run_in_executor(
+                    self._get_executor(), _timed, fn, *args
+                )
+            password_hash_seconds.observe(elapsed, operation=operation)
+            return result
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # 스레드가 도는 프로세스에서 fork하지 않도록 spawn 사용
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    rounds=settings.BCRYPT_ROUNDS,
+)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -34,14 +142,47 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 
-def decode_access_token(token: str) -> Optional[str]:
+def _verify_token(token: str) -> Optional[dict]:
+    """서명/만료 검증 후 claims 반환 (실패 시 None)"""
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        username: str = payload.get("sub")
-        if username is None:
-            return None
-        return username
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
     except JWTError:
         return None
+
+
+# 검증된 토큰의 digest -> claims. 항목은 토큰 자신의 exp에 만료된다.
+token_cache = MemoryCache(maxsize=settings.TOKEN_CACHE_MAX_ENTRIES)
+token_cache_requests = registry.counter(
+    "semicolon_token_cache_requests",
+    "JWT verification cache lookups",
+    ["result"],
+)
+registry.gauge(
+    "semicolon_token_cache_entries",
+    "Verified JWTs currently cached",
+    fn=lambda: len(token_cache),
+)
+
+
+def decode_access_token(token: str) -> Optional[str]:
+    if settings.TOKEN_CACHE_MAX_ENTRIES <= 0:
+        payload = _verify_token(token)
+    else:
+        key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        payload = token_cache.get(key)
+        if payload is not None:
+            token_cache_requests.inc(result="hit")
+        else:
+            token_cache_requests.inc(result="miss")
+            payload = _verify_token(token)
+            # exp까지만 캐시 - 만료된 토큰은 다시 검증을 거쳐 거부됨
+            ttl = payload.get("exp", 0) - time.time() if payload else 0
+            if ttl > 0:
+                token_cache.set(key, payload, ttl=ttl)
+
+    if payload is None:
+        return None
+    username: str = payload.get("sub")
+    if username is None:
+        return None
+    return username
@@ -0,0 +1,227 @@
+"""
+요청 단위 SQL 프로파일링 (SQL_PROFILE_ENABLED, 기본 꺼짐)
+
+요청마다 실행된 SQL 문을 시간, 호출한 crud 함수와 함께 모아서
+
+- SQL_PROFILE_SLOW_REQUEST_MS를 넘긴 요청은 호출 함수별 내역을 경고 로그로
+- 같은 모양의 문장이 SQL_PROFILE_N_PLUS_ONE_THRESHOLD번을 넘게 반복되면
+  N+1 의심으로 경고 (관계 lazy 로드가 다시 생긴 경우를 잡기 위함)
+- SQL_PROFILE_SERVER_TIMING이면 Server-Timing 헤더로 DB 시간/문장 수를 응답
+
+문장마다 호출 스택을 거슬러 올라가므로 /metrics의 요청 메트릭보다 비싸다.
+운영에서는 특정 인스턴스나 짧은 기간에만 켠다.
+"""
+
+import logging
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .request_metrics import route_template
+
+logger = logging.getLogger(__name__)
+
+# IN (?, ?, ?)처럼 값 개수만 다른 문장을 같은 모양으로 묶음
+_PLACEHOLDER_LIST = re.compile(
+    r"\(\s*(?:\?|%\(\w+\)s|\$\d+)(?:\s*,\s*(?:\?|%\(\w+\)s|\$\d+))*\s*\)"
+)
+_WHITESPACE = re.compile(r"\s+")
+
+
+class StatementRecord(NamedTuple):
+    statement: str
+    seconds: float
+    caller: str
+
+
+def statement_shape(statement: str) -> str:
+    """파라미터 목록 길이와 공백 차이를 지운 문장 모양 (N+1 판정 키)"""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    return _PLACEHOLDER_LIST.sub("(?)", shape)
+
+
+def _caller() -> str:
+    """
+    문장을 실행한 앱 코드 위치 - app.crud 함수가 있으면 그것, 없으면 가장 가까운 app 코드
+
+    ORM lazy 로드로 실행된 문장이면 " (lazy load)"를 붙인다.
+    """
+    frame = sys._getframe(2)
+    nearest = None
+    lazy = False
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module == "sqlalchemy.orm.strategies":
+            lazy = True
+        elif module.startswith("app.") and module != __name__:
+            location = f"{module[4:]}.{frame.f_code.co_name}"
+            if module.startswith("app.crud"):
+                nearest = location
+                break
+            if nearest is None:
+                nearest = location
+        frame = frame.f_back
+    caller = nearest or "?"
+    return f"{caller} (lazy load)" if lazy else caller
+
+
+class SqlProfile:
+    """한 요청(또는 with sql_profile() 블록)에서 실행된 SQL 문 목록"""
+
+    def __init__(self):
+        self.statements: List[StatementRecord] = []
+
+    @property
+    def seconds(self) -> float:
+        return sum(record.seconds for record in self.statements)
+
+    def by_caller(self) -> List[Tuple[str, int, float]]:
+        """(호출 위치, 문장 수, 시간) - 시간이 긴 순"""
+        counts: Counter = Counter()
+        seconds: Dict[str, float] = defaultdict(float)
+        for record in self.statements:
+            counts[record.caller] += 1
+            seconds[record.caller] += record.seconds
+        return sorted(
+            ((caller, counts[caller], seconds[caller]) for caller in counts),
+            key=lambda item: item[2],
+            reverse=True,
+        )
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int, str]]:
+        """threshold번을 넘게 반복된 (문장 모양, 횟수, 처음 실행한 위치) - N+1 의심"""
+        shapes = Counter()
+        callers: Dict[str, str] = {}
+        for record in self.statements:
+            shape = statement_shape(record.statement)
+            shapes[shape] += 1
+            callers.setdefault(shape, record.caller)
+        return [
+            (shape, count, callers[shape])
+            for shape, count in shapes.most_common()
+            if count > threshold
+        ]
+
+
+_current: ContextVar[Optional[SqlProfile]] = ContextVar("sql_profile", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info["profile_started"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.pop("profile_started", None)
+    profile = _current.get()
+    if profile is not None and started is not None:
+        elapsed = time.perf_counter() - started
+        profile.statements.append(StatementRecord(statement, elapsed, _caller()))
+
+
+def instrument_sql() -> None:
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def sql_profile() -> Iterator[SqlProfile]:
+    """with sql_profile() as profile: 블록 안에서 실행된 SQL 수집 (스크립트/테스트용)"""
+    instrument_sql()
+    profile = SqlProfile()
+    token = _current.set(profile)
+    try:
+        yield profile
+    finally:
+        _current.reset(token)
+
+
+def _truncate(statement: str, limit: int = 200) -> str:
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    return statement if len(statement) <= limit else statement[:limit] + "..."
+
+
+class SqlProfilingMiddleware:
+    def __init__(
+        self,
+        app,
+        slow_request_ms: float,
+        n_plus_one_threshold: int,
+        server_timing: bool = False,
+    ):
+        self.app = app
+        self.slow_request_ms = slow_request_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.server_timing = server_timing
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start" and self.server_timing:
+                # JSON 응답은 본문을 만든 뒤 시작하므로 이 시점에 SQL은 모두 끝남
+                headers = list(message.get("headers", []))
+                headers.append(
+                    (b"server-timing", self._server_timing(profile, started))
+                )
+                message = {**message, "headers": headers}
+            await send(message)
+
+        with sql_profile() as profile:
+            await self.app(scope, receive, send_with_timing)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._report(scope, profile, elapsed_ms)
+
+    @staticmethod
+    def _server_timing(profile: SqlProfile, started: float) -> bytes:
+        app_ms = (time.perf_counter() - started) * 1000
+        db_ms = profile.seconds * 1000
+        count = len(profile.statements)
+        return (
+            f'db;dur={db_ms:.1f};desc="{count} queries", app;dur={app_ms:.1f}'
+        ).encode("latin-1")
+
+    def _report(self, scope, profile: SqlProfile, elapsed_ms: float) -> None:
+        request = f"{scope['method']} {route_template(scope)} ({scope['path']})"
+        for shape, count, caller in profile.repeated(self.n_plus_one_threshold):
+            logger.warning(
+                "N+1 의심: %s - 같은 문장 %d번 (%s): %s",
+                request,
+                count,
+                caller,
+                _truncate(shape),
+            )
+        if elapsed_ms < self.slow_request_ms:
+            return
+        lines = [
+            f"  {caller}: {count}개 {seconds * 1000:.1f}ms"
+            for caller, count, seconds in profile.by_caller()
+        ]
+        slowest = max(
+            profile.statements, key=lambda record: record.seconds, default=None
+        )
+        if slowest is not None:
+            lines.append(
+                f"  가장 느린 문장 {slowest.seconds * 1000:.1f}ms ({slowest.caller}): "
+                f"{_truncate(slowest.statement)}"
+            )
+        logger.warning(
+            "느린 요청: %s %.1fms, SQL %d개 %.1fms\n%s",
+            request,
+            elapsed_ms,
+            len(profile.statements),
+            profile.seconds * 1000,
+            "\n".join(lines),
+        )
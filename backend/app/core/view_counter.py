@@ -0,0 +1,93 @@
+"""
+질문 조회수 write-behind 카운터
+
+상세 조회마다 커밋하는 대신 워커 메모리에 질문별 증가량을 모아 두었다가
+주기적으로 `UPDATE ... SET views = views + n` 한 번으로 반영한다. 증가는 DB에서
+원자적으로 더해지므로 uvicorn 워커가 여러 개여도 서로의 값을 덮어쓰지 않는다.
+"""
+import logging
+import threading
+from collections import Counter
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounter:
+    def __init__(
+        self,
+        interval: float,
+        session_factory: Optional[Callable[[], Session]] = None,
+    ):
+        self.interval = interval
+        self.session_factory = session_factory
+        self._pending: Counter = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def record(self, question_id: int, n: int = 1) -> None:
+        """조회 1건 기록 - 메모리만 건드리므로 요청을 막지 않음"""
+        with self._lock:
+            self._pending[question_id] += n
+
+    def pending(self, question_id: int) -> int:
+        """아직 DB에 반영되지 않은 증가량"""
+        with self._lock:
+            return self._pending[question_id]
+
+    def flush(self) -> int:
+        """모아 둔 증가량을 한 트랜잭션으로 반영하고 반영한 질문 수를 반환"""
+        with self._lock:
+            counts, self._pending = self._pending, Counter()
+        if not counts:
+            return 0
+
+        from ..crud import add_question_views
+
+        session_factory = self.session_factory
+        if session_factory is None:
+            from .database import SessionLocal as session_factory
+
+        db = session_factory()
+        try:
+            add_question_views(db, counts)
+        except Exception:
+            db.rollback()
+            # 실패분은 다음 주기에 다시 시도
+            with self._lock:
+                self._pending.update(counts)
+            logger.exception("조회수 반영 실패 (%d개 질문)", len(counts))
+            return 0
+        finally:
+            db.close()
+        return len(counts)
+
+    def start(self) -> None:
+        """워커 프로세스 안에서 주기적 flush 스레드 시작 (fork 이후에 호출)"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="view-counter", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """flush 스레드를 멈추고 남은 증가량을 마지막으로 반영"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+
+view_counter = ViewCounter(interval=settings.VIEW_COUNT_FLUSH_INTERVAL_SECONDS)
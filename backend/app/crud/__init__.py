@@ -1,9 +1,27 @@
-from typing import List, Optional
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
+from sqlalchemy import (
+    bindparam,
+    exists,
+    func,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.interfaces import ORMOption
 
-from ..core.security import get_password_hash, verify_password
-from ..models import Answer, Question, Tag, User
+from ..core.events import question_events
+from ..core.http_cache import ResourceVersion
+from ..core.principals import invalidate_principal
+from ..core.response_cache import response_cache
+from ..models import Answer, Question, QuestionTag, Tag, User
+from ..schemas import Answer as AnswerSchema
 from ..schemas import (
     AnswerCreate,
     AnswerUpdate,
@@ -12,6 +30,7 @@ from ..schemas import (
     UserCreate,
     UserUpdate,
 )
+from . import loaders, search
 
 
 # User CRUD
@@ -19,6 +38,15 @@ def get_user(db: Session, user_id: int) -> Optional[User]:
     return db.query(User).filter(User.id == user_id).first()
 
 
+def get_users_by_ids(db: Session, user_ids: Sequence[int]) -> List[User]:
+    """id 목록의 사용자를 주어진 순서대로 (없는 id는 제외)"""
+    if not user_ids:
+        return []
+    users = db.query(User).filter(User.id.in_(user_ids)).all()
+    by_id = {user.id: user for user in users}
+    return [by_id[i] for i in user_ids if i in by_id]
+
+
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     return db.query(User).filter(User.email == email).first()
 
@@ -27,8 +55,26 @@ def get_user_by_username(db: Session, username: str) -> Optional[User]:
     return db.query(User).filter(User.username == username).first()
 
 
-def create_user(db: Session, user: UserCreate) -> User:
-    hashed_password = get_password_hash(user.password)
+def get_user_version(db: Session, user_id: int) -> Optional[ResourceVersion]:
+    """공개 프로필 응답의 검증자 - User 스키마에 나가는 컬럼만 조회"""
+    row = db.execute(
+        select(
+            User.id,
+            User.email,
+            User.username,
+            User.full_name,
+            User.is_active,
+            User.created_at,
+            User.updated_at,
+        ).where(User.id == user_id)
+    ).first()
+    if row is None:
+        return None
+    return ResourceVersion(key=("user", tuple(row)), last_modified=row.updated_at)
+
+
+def create_user(db: Session, user: UserCreate, hashed_password: str) -> User:
+    """사용자 생성 - 해싱은 호출하는 쪽에서 이벤트 루프 밖에서 미리 수행"""
     db_user = User(
         email=user.email,
         username=user.username,
@@ -41,30 +87,315 @@ def create_user(db: Session, user: UserCreate) -> User:
     return db_user
 
 
-def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
-    user = get_user_by_username(db, username)
-    if not user:
-        return None
-    if not verify_password(password, user.hashed_password):
-        return None
-    return user
+def update_user(
+    db: Session,
+    user_id: int,
+    user_update: UserUpdate,
+    hashed_password: Optional[str] = None,
+) -> Optional[User]:
+    """사용자 정보 수정 - password는 호출하는 쪽에서 해싱해 hashed_password로 전달"""
+    db_user = get_user(db, user_id)
+    if db_user:
+        old_username = db_user.username
+        update_data = user_update.dict(exclude_unset=True, exclude={"password"})
+        for key, value in update_data.items():
+            setattr(db_user, key, value)
+        if hashed_password is not None:
+            db_user.hashed_password = hashed_password
+        db.commit()
+        db.refresh(db_user)
+        invalidate_principal(old_username)
+    return db_user
+
+
+def set_user_active(db: Session, user_id: int, is_active: bool) -> Optional[User]:
+    """계정 활성/비활성화 - 캐시된 principal도 즉시 무효화"""
+    db_user = get_user(db, user_id)
+    if db_user:
+        db_user.is_active = is_active
+        db.commit()
+        db.refresh(db_user)
+        invalidate_principal(db_user.username)
+    return db_user
+
+
+def update_password_hash(db: Session, user_id: int, hashed_password: str) -> None:
+    """로그인 시 cost가 바뀐 해시를 새 해시로 교체"""
+    db.query(User).filter(User.id == user_id).update(
+        {User.hashed_password: hashed_password}, synchronize_session=False
+    )
+    db.commit()
 
 
 # Question CRUD
-def get_questions(db: Session, skip: int = 0, limit: int = 100) -> List[Question]:
-    return db.query(Question).offset(skip).limit(limit).all()
+# 목록 요약에 담을 본문 앞부분 길이 (문자 수)
+EXCERPT_LENGTH = 200
+
+
+# 정렬 모드 -> (정렬 키 속성, 커서 값 타입). 모두 (키, id) 내림차순이며
+# 모드마다 전용 인덱스가 있음 (app.models.Question.__table_args__)
+SORT_KEYS: Dict[str, Tuple[str, type]] = {
+    "newest": ("created_at", datetime),
+    "views": ("views", int),
+    "unanswered": ("created_at", datetime),
+    "active": ("last_activity_at", datetime),
+}
+
+
+def _sorted_page(
+    query,
+    sort: str,
+    skip: int,
+    limit: int,
+    cursor: Optional[Tuple[Any, int]],
+    tag_id: Optional[int] = None,
+):
+    """정렬 모드별 ORDER BY + cursor가 있으면 keyset, 없으면 offset 페이지네이션"""
+    sort_key, question_id = getattr(Question, SORT_KEYS[sort][0]), Question.id
+    if sort == "unanswered":
+        # 부분 인덱스의 WHERE와 글자 그대로 같아야 플래너가 인덱스를 고름 (바인딩 X)
+        query = query.where(Question.answer_count == literal_column("0"))
+    if tag_id is not None:
+        query = query.join(QuestionTag, QuestionTag.question_id == Question.id).where(
+            QuestionTag.tag_id == tag_id
+        )
+        if sort_key is Question.created_at:
+            # 최신순 태그 목록은 question_tags (tag_id, question_created_at,
+            # question_id) 인덱스를 정렬 순서대로 읽고 questions는 기본키로만 조인
+            sort_key, question_id = (
+                QuestionTag.question_created_at,
+                QuestionTag.question_id,
+            )
+    query = query.order_by(sort_key.desc(), question_id.desc())
+    if cursor is not None:
+        # 정렬 인덱스를 커서 위치부터 범위 스캔 - 페이지 깊이와 무관
+        query = query.where(tuple_(sort_key, question_id) < cursor)
+    else:
+        query = query.offset(skip)
+    return query.limit(limit)
+
+
+def sort_value(question: Any, sort: str) -> Any:
+    """목록 항목(ORM 객체 또는 요약 dict)의 정렬 키 값 - 다음 커서 발급용"""
+    name = SORT_KEYS[sort][0]
+    return question[name] if isinstance(question, dict) else getattr(question, name)
+
+
+def _tag_id(db: Session, name: str) -> Optional[int]:
+    return db.execute(
+        select(Tag.id).where(Tag.name == name.strip().lower())
+    ).scalar_one_or_none()
+
+
+def get_questions(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[Tuple[Any, int]] = None,
+    sort: str = "newest",
+    tag: Optional[str] = None,
+) -> List[Question]:
+    tag_id = _tag_id(db, tag) if tag is not None else None
+    if tag is not None and tag_id is None:
+        return []
+    query = db.query(Question).options(*loaders.QUESTION_LIST)
+    return _sorted_page(query, sort, skip, limit, cursor, tag_id).all()
+
+
+def _summary_select():
+    """목록 요약 SELECT - 관계를 로드하지 않고 필요한 컬럼만 (집계는 비정규화 컬럼)"""
+    return select(
+        Question.id,
+        Question.title,
+        func.substr(Question.content, 1, EXCERPT_LENGTH).label("excerpt"),
+        User.username.label("author_username"),
+        Question.created_at,
+        Question.views,
+        Question.is_solved,
+        Question.answer_count,
+        Question.has_accepted_answer,
+        Question.last_activity_at,
+    ).outerjoin(User, User.id == Question.author_id)
+
+
+def _summary_rows(db: Session, stmt) -> List[Dict[str, Any]]:
+    rows = [dict(row) for row in db.execute(stmt).mappings()]
+    if not rows:
+        return rows
+
+    # 태그 이름은 페이지 전체를 IN 쿼리 한 번으로
+    tags = defaultdict(list)
+    tag_rows = db.execute(
+        select(QuestionTag.question_id, Tag.name)
+        .join(Tag, Tag.id == QuestionTag.tag_id)
+        .where(QuestionTag.question_id.in_([row["id"] for row in rows]))
+        .order_by(Tag.name)
+    )
+    for question_id, name in tag_rows:
+        tags[question_id].append(name)
+    for row in rows:
+        row["tags"] = tags[row["id"]]
+    return rows
+
+
+def get_question_summaries(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[Tuple[Any, int]] = None,
+    sort: str = "newest",
+    tag: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """목록용 요약 - 관계를 로드하지 않고 필요한 컬럼과 집계만 SELECT"""
+    tag_id = _tag_id(db, tag) if tag is not None else None
+    if tag is not None and tag_id is None:
+        return []
+    stmt = _sorted_page(_summary_select(), sort, skip, limit, cursor, tag_id)
+    return _summary_rows(db, stmt)
+
+
+def get_question_summaries_by_ids(
+    db: Session, question_ids: Sequence[int]
+) -> List[Dict[str, Any]]:
+    """id 목록의 요약을 주어진 순서대로 (없는 id는 제외)"""
+    if not question_ids:
+        return []
+    rows = _summary_rows(db, _summary_select().where(Question.id.in_(question_ids)))
+    by_id = {row["id"]: row for row in rows}
+    return [by_id[i] for i in question_ids if i in by_id]
+
+
+def search_questions(
+    db: Session, q: str, skip: int = 0, limit: int = 20
+) -> List[Dict[str, Any]]:
+    """전문 검색 - 관련도 순 질문 요약"""
+    return get_question_summaries_by_ids(
+        db, search.search_question_ids(db, q, skip=skip, limit=limit)
+    )
+
+
+def get_question(
+    db: Session, question_id: int, options: Sequence[ORMOption] = ()
+) -> Optional[Question]:
+    """질문 단건 조회 - 응답으로 직렬화할 때는 loaders.QUESTION_DETAIL 전달"""
+    return (
+        db.query(Question).options(*options).filter(Question.id == question_id).first()
+    )
+
+
+def get_questions_by_ids(
+    db: Session, question_ids: Sequence[int], options: Sequence[ORMOption] = ()
+) -> List[Question]:
+    """id 목록의 질문을 주어진 순서대로 (없는 id는 제외)"""
+    if not question_ids:
+        return []
+    questions = (
+        db.query(Question).options(*options).filter(Question.id.in_(question_ids)).all()
+    )
+    by_id = {question.id: question for question in questions}
+    return [by_id[i] for i in question_ids if i in by_id]
+
+
+def get_question_full(db: Session, question_id: int) -> Optional[Dict[str, Any]]:
+    """
+    QuestionFull 데이터 - 질문(+태그), 답변, 작성자를 각각 한 번씩 조회
+
+    작성자는 질문 작성자, 답변 작성자 순(처음 나온 순서)으로 중복 없이 담는다.
+    """
+    question = get_question(db, question_id, options=loaders.QUESTION_FULL)
+    if question is None:
+        return None
+    answers = (
+        db.query(Answer)
+        .filter(Answer.question_id == question_id)
+        .order_by(Answer.id)
+        .all()
+    )
+    author_ids = list(
+        dict.fromkeys([question.author_id, *(a.author_id for a in answers)])
+    )
+    return {
+        "question": question,
+        "answers": answers,
+        "users": get_users_by_ids(db, author_ids),
+    }
+
+
+def _latest(*times: Optional[datetime]) -> Optional[datetime]:
+    return max((t for t in times if t is not None), default=None)
+
 
+def _answer_versions(db: Session, question_id: int) -> List[Tuple[Any, ...]]:
+    """답변별 (id, updated_at, author_id, 작성자 updated_at) - 작성자 프로필 변경도 반영"""
+    return [
+        tuple(row)
+        for row in db.execute(
+            select(Answer.id, Answer.updated_at, Answer.author_id, User.updated_at)
+            .outerjoin(User, User.id == Answer.author_id)
+            .where(Answer.question_id == question_id)
+            .order_by(Answer.id)
+        )
+    ]
 
-def get_question(db: Session, question_id: int) -> Optional[Question]:
-    return db.query(Question).filter(Question.id == question_id).first()
+
+def get_question_version(db: Session, question_id: int) -> Optional[ResourceVersion]:
+    """상세 응답의 검증자 - 질문 행, 포함된 답변, 작성자들의 수정 시각만 조회"""
+    question = db.execute(
+        select(
+            Question.id,
+            Question.updated_at,
+            Question.views,
+            Question.author_id,
+            Question.answer_count,
+            Question.has_accepted_answer,
+            Question.last_activity_at,
+            User.updated_at.label("author_updated_at"),
+        )
+        .outerjoin(User, User.id == Question.author_id)
+        .where(Question.id == question_id)
+    ).first()
+    if question is None:
+        return None
+    answers = _answer_versions(db, question_id)
+    last_modified = _latest(
+        question.updated_at,
+        question.author_updated_at,
+        *(a[1] for a in answers),
+        *(a[3] for a in answers),
+    )
+    return ResourceVersion(
+        key=("question", tuple(question), tuple(answers)),
+        last_modified=last_modified,
+    )
+
+
+def get_answers_version(db: Session, question_id: int) -> Optional[ResourceVersion]:
+    """답변 목록 응답의 검증자 (질문이 없으면 None)"""
+    found = db.execute(select(Question.id).where(Question.id == question_id)).first()
+    if found is None:
+        return None
+    answers = _answer_versions(db, question_id)
+    last_modified = _latest(*(a[1] for a in answers), *(a[3] for a in answers))
+    return ResourceVersion(
+        key=("answers", question_id, tuple(answers)), last_modified=last_modified
+    )
 
 
 def create_question(db: Session, question: QuestionCreate, author_id: int) -> Question:
-    db_question = Question(**question.dict(), author_id=author_id)
+    now = datetime.utcnow()
+    db_question = Question(
+        **question.dict(exclude={"tags"}),
+        author_id=author_id,
+        created_at=now,
+        last_activity_at=now,
+    )
     db.add(db_question)
+    db.flush()
+    set_question_tags(db, db_question, question.tags)
+    search.index_question(db, db_question.id)
     db.commit()
-    db.refresh(db_question)
-    return db_question
+    response_cache.invalidate_lists()
+    return get_question(db, db_question.id, options=loaders.QUESTION_DETAIL)
 
 
 def update_question(
@@ -73,30 +404,209 @@ def update_question(
     db_question = db.query(Question).filter(Question.id == question_id).first()
     if db_question:
         update_data = question_update.dict(exclude_unset=True)
+        tags = update_data.pop("tags", None)
         for key, value in update_data.items():
             setattr(db_question, key, value)
+        tags_changed = tags is not None and set_question_tags(db, db_question, tags)
+        if update_data or tags_changed:
+            now = datetime.utcnow()
+            db_question.last_activity_at = now
+            # 태그만 바뀌어도 질문 수정으로 보고 ETag/Last-Modified 갱신
+            db_question.updated_at = now
+        db.flush()
+        search.index_question(db, question_id)
         db.commit()
-        db.refresh(db_question)
+        response_cache.invalidate_question(question_id)
+        db_question = get_question(db, question_id, options=loaders.QUESTION_DETAIL)
     return db_question
 
 
-def increment_question_views(db: Session, question_id: int):
-    db_question = db.query(Question).filter(Question.id == question_id).first()
-    if db_question:
-        db_question.views += 1
-        db.commit()
+def add_question_views(db: Session, counts: Mapping[int, int]) -> None:
+    """질문별 조회수 증가량을 UPDATE ... SET views = views + n 으로 일괄 반영"""
+    if not counts:
+        return
+    table = Question.__table__
+    stmt = (
+        update(table).where(table.c.id == bindparam("question_id"))
+        # updated_at의 onupdate가 조회수 반영 때 돌지 않도록 현재 값 유지
+        .values(
+            views=table.c.views + bindparam("increment"),
+            updated_at=table.c.updated_at,
+        )
+    )
+    # id 순서로 잠가 여러 워커가 동시에 flush해도 교착 상태가 생기지 않게 함
+    db.execute(
+        stmt,
+        [
+            {"question_id": question_id, "increment": n}
+            for question_id, n in sorted(counts.items())
+        ],
+    )
+    db.commit()
+    # 몇 초마다 도는 반영이라 응답 캐시는 지우지 않음 - 캐시된 조회수는 TTL 동안 늦게 보임
+
+
+# Tag CRUD
+def normalize_tag_names(names: Sequence[str]) -> List[str]:
+    """공백 제거 + 소문자, 빈 값과 중복 제거 (입력 순서 유지)"""
+    normalized = (name.strip().lower() for name in names)
+    return list(dict.fromkeys(name for name in normalized if name))
+
+
+def get_tag_by_name(db: Session, name: str) -> Optional[Tag]:
+    return db.query(Tag).filter(Tag.name == name.strip().lower()).first()
+
+
+def get_tags(db: Session, skip: int = 0, limit: int = 100) -> List[Tag]:
+    """태그 목록 - 질문 수(비정규화 컬럼) 내림차순"""
+    return (
+        db.query(Tag)
+        .order_by(Tag.question_count.desc(), Tag.name)
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+
+
+def _adjust_tag_counts(db: Session, tag_ids: Sequence[int], delta: int) -> None:
+    if tag_ids:
+        table = Tag.__table__
+        db.execute(
+            update(table)
+            .where(table.c.id.in_(tag_ids))
+            .values(question_count=table.c.question_count + delta)
+        )
+
+
+# INSERT ... ON CONFLICT를 지원하는 방언별 insert
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def _insert_tags(db: Session, names: Sequence[str]) -> None:
+    """
+    없는 태그 생성 - 동시에 같은 새 태그를 만드는 쓰기가 있어도 실패하지 않음
+
+    ON CONFLICT (name) DO NOTHING이라 먼저 커밋한 쪽 행을 그대로 쓴다
+    (PostgreSQL은 상대 트랜잭션이 끝날 때까지 기다린 뒤 건너뜀).
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect not in _UPSERT_INSERTS:
+        db.add_all(Tag(name=name) for name in names)
+        db.flush()
+        return
+    db.execute(
+        _UPSERT_INSERTS[dialect](Tag)
+        .values([{"name": name} for name in names])
+        .on_conflict_do_nothing(index_elements=["name"])
+    )
+
+
+def set_question_tags(db: Session, question: Question, names: Sequence[str]) -> bool:
+    """
+    질문의 태그를 names로 맞춤 - 없는 태그는 만들고 태그별 질문 수도 함께 갱신
+
+    커밋은 호출하는 쪽 트랜잭션에서. 바뀐 것이 있으면 True.
+    """
+    names = normalize_tag_names(names)
+    tags = {tag.name: tag for tag in db.query(Tag).filter(Tag.name.in_(names))}
+    missing = [name for name in names if name not in tags]
+    if missing:
+        _insert_tags(db, missing)
+        tags.update(
+            (tag.name, tag) for tag in db.query(Tag).filter(Tag.name.in_(missing))
+        )
+    db.flush()
+
+    wanted = {tags[name].id for name in names}
+    current = {
+        question_tag.tag_id: question_tag
+        for question_tag in db.query(QuestionTag).filter(
+            QuestionTag.question_id == question.id
+        )
+    }
+    added = sorted(wanted - current.keys())
+    removed = sorted(current.keys() - wanted)
+    for tag_id in added:
+        db.add(
+            QuestionTag(
+                question_id=question.id,
+                tag_id=tag_id,
+                question_created_at=question.created_at,
+            )
+        )
+    for tag_id in removed:
+        db.delete(current[tag_id])
+    _adjust_tag_counts(db, added, 1)
+    _adjust_tag_counts(db, removed, -1)
+    return bool(added or removed)
 
 
 # Answer CRUD
+def get_answer(
+    db: Session, answer_id: int, options: Sequence[ORMOption] = ()
+) -> Optional[Answer]:
+    """답변 단건 조회 - 응답으로 직렬화할 때는 loaders.ANSWER 전달"""
+    return db.query(Answer).options(*options).filter(Answer.id == answer_id).first()
+
+
 def get_answers_by_question(db: Session, question_id: int) -> List[Answer]:
-    return db.query(Answer).filter(Answer.question_id == question_id).all()
+    return (
+        db.query(Answer)
+        .options(*loaders.ANSWER)
+        .filter(Answer.question_id == question_id)
+        .order_by(Answer.id)
+        .all()
+    )
+
+
+def _update_answer_stats(
+    db: Session,
+    question_id: int,
+    count_delta: int = 0,
+    accepted_changed: bool = False,
+    touch: bool = False,
+) -> None:
+    """
+    질문의 answer_count / has_accepted_answer / last_activity_at 갱신
+    (커밋은 호출하는 쪽 트랜잭션에서)
+
+    개수는 원자적 증감으로, 채택 여부는 답변 테이블에서 다시 계산한다.
+    touch면 답변 작성/수정을 질문의 마지막 활동으로 기록한다.
+    """
+    table = Question.__table__
+    # 답변 변경은 질문 자체의 수정이 아니므로 updated_at 유지
+    values = {"updated_at": table.c.updated_at}
+    if touch:
+        values["last_activity_at"] = datetime.utcnow()
+    if count_delta:
+        values["answer_count"] = table.c.answer_count + count_delta
+    if accepted_changed:
+        values["has_accepted_answer"] = _has_accepted_answer(table.c.id)
+    db.execute(update(table).where(table.c.id == question_id).values(**values))
+
+
+def _has_accepted_answer(question_id_column):
+    return exists().where(
+        Answer.question_id == question_id_column, Answer.is_accepted.is_(True)
+    )
+
+
+def _publish_answer(event: str, answer: Answer) -> None:
+    """질문 이벤트 스트림으로 답변 전체를 보냄 (커밋 이후, loaders.ANSWER로 읽은 답변)"""
+    data = AnswerSchema.model_validate(answer).model_dump_json().encode("utf-8")
+    question_events.publish(answer.question_id, event, data)
 
 
 def create_answer(db: Session, answer: AnswerCreate, author_id: int) -> Answer:
     db_answer = Answer(**answer.dict(), author_id=author_id)
     db.add(db_answer)
+    db.flush()
+    _update_answer_stats(db, answer.question_id, count_delta=1, touch=True)
+    search.index_question(db, answer.question_id)
     db.commit()
-    db.refresh(db_answer)
+    response_cache.invalidate_question(answer.question_id)
+    db_answer = get_answer(db, db_answer.id, options=loaders.ANSWER)
+    _publish_answer("answer.created", db_answer)
     return db_answer
 
 
@@ -105,18 +615,104 @@ def update_answer(
 ) -> Optional[Answer]:
     db_answer = db.query(Answer).filter(Answer.id == answer_id).first()
     if db_answer:
+        was_accepted = db_answer.is_accepted
         update_data = answer_update.dict(exclude_unset=True)
         for key, value in update_data.items():
             setattr(db_answer, key, value)
+        db.flush()
+        question_id = db_answer.question_id
+        if update_data:
+            _update_answer_stats(
+                db,
+                question_id,
+                accepted_changed=db_answer.is_accepted != was_accepted,
+                touch=True,
+            )
+        if "content" in update_data:
+            search.index_question(db, question_id)
         db.commit()
-        db.refresh(db_answer)
+        response_cache.invalidate_question(question_id)
+        db_answer = get_answer(db, answer_id, options=loaders.ANSWER)
+        if update_data:
+            accepted = db_answer.is_accepted and not was_accepted
+            _publish_answer(
+                "answer.accepted" if accepted else "answer.updated", db_answer
+            )
     return db_answer
 
 
 def delete_answer(db: Session, answer_id: int) -> bool:
     db_answer = db.query(Answer).filter(Answer.id == answer_id).first()
     if db_answer:
+        question_id = db_answer.question_id
+        was_accepted = db_answer.is_accepted
         db.delete(db_answer)
+        db.flush()
+        _update_answer_stats(
+            db, question_id, count_delta=-1, accepted_changed=was_accepted
+        )
+        search.index_question(db, question_id)
         db.commit()
+        response_cache.invalidate_question(question_id)
+        data = b'{"id":%d,"question_id":%d}' % (answer_id, question_id)
+        question_events.publish(question_id, "answer.deleted", data)
         return True
     return False
+
+
+def repair_answer_stats(db: Session, batch_size: int = 10_000) -> int:
+    """
+    answer_count / has_accepted_answer를 answers 테이블에서 일괄 재계산
+
+    id 구간별로 나눠 커밋해 긴 잠금을 피하고, 값이 어긋난 행만 갱신한다.
+    고친 질문 수를 반환한다.
+    """
+    table = Question.__table__
+    answer_count = (
+        select(func.count(Answer.id))
+        .where(Answer.question_id == table.c.id)
+        .scalar_subquery()
+    )
+    has_accepted = _has_accepted_answer(table.c.id)
+    max_id = db.execute(select(func.max(table.c.id))).scalar() or 0
+
+    repaired = 0
+    for start in range(0, max_id, batch_size):
+        result = db.execute(
+            update(table)
+            .where(
+                table.c.id > start,
+                table.c.id <= start + batch_size,
+                or_(
+                    table.c.answer_count != answer_count,
+                    table.c.has_accepted_answer != has_accepted,
+                ),
+            )
+            .values(
+                answer_count=answer_count,
+                has_accepted_answer=has_accepted,
+                updated_at=table.c.updated_at,
+            )
+        )
+        db.commit()
+        repaired += result.rowcount
+    if repaired:
+        response_cache.clear()
+    return repaired
+
+
+def repair_tag_counts(db: Session) -> int:
+    """tags.question_count를 question_tags에서 재계산 - 고친 태그 수 반환"""
+    table = Tag.__table__
+    question_count = (
+        select(func.count(QuestionTag.id))
+        .where(QuestionTag.tag_id == table.c.id)
+        .scalar_subquery()
+    )
+    result = db.execute(
+        update(table)
+        .where(table.c.question_count != question_count)
+        .values(question_count=question_count)
+    )
+    db.commit()
+    return result.rowcount
@@ -0,0 +1,27 @@
+"""
+엔드포인트별 관계 로딩 전략
+
+응답 스키마가 author / answers / answers.author를 중첩 직렬화하므로 기본 lazy
+로딩이면 행마다 SELECT가 추가로 나간다(N+1). 각 조회 함수는 자신이 채우는
+응답 스키마에 맞는 옵션을 써서 페이지 크기와 무관하게 쿼리 수를 고정한다.
+"""
+
+from sqlalchemy.orm import joinedload, selectinload
+
+from ..models import Answer, Question, QuestionTag
+
+# 질문 목록: 작성자는 같은 SELECT에서 JOIN, 답변(+작성자)과 태그(+이름)는 각각 IN 쿼리 1번
+QUESTION_LIST = (
+    joinedload(Question.author),
+    selectinload(Question.answers).joinedload(Answer.author),
+    selectinload(Question.tags).joinedload(QuestionTag.tag),
+)
+
+# 질문 상세: 목록과 같은 모양 (Question 스키마 전체)
+QUESTION_DETAIL = QUESTION_LIST
+
+# 답변 목록/단건: 작성자만 JOIN
+ANSWER = (joinedload(Answer.author),)
+
+# 질문 전체(/full): 질문에는 태그만 - 답변과 작성자는 각각 IN 쿼리로 따로 읽음
+QUESTION_FULL = (selectinload(Question.tags).joinedload(QuestionTag.tag),)
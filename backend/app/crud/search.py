@@ -0,0 +1,112 @@
+"""
+질문 전문 검색 - 제목, 본문, 답변 내용을 한 문서로 색인
+
+PostgreSQL은 questions.search_vector(tsvector, GIN 인덱스), SQLite는 FTS5
+섀도 테이블 questions_fts를 사용한다 (app.models.SEARCH_DDL). 질문 생성·수정과
+답변 생성·수정·삭제를 하는 crud 함수가 같은 트랜잭션 안에서 index_question을 호출해
+색인을 항상 최신으로 유지한다. 질문 삭제 경로는 없다.
+"""
+
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# 가중치: 제목 > 본문 > 답변
+_PG_DOCUMENT = """
+    setweight(to_tsvector('simple', coalesce(questions.title, '')), 'A')
+    || setweight(to_tsvector('simple', coalesce(questions.content, '')), 'B')
+    || setweight(to_tsvector('simple', coalesce((
+        SELECT string_agg(answers.content, ' ')
+        FROM answers WHERE answers.question_id = questions.id
+    ), '')), 'C')
+"""
+_SQLITE_DOCUMENT = """
+    SELECT questions.id, questions.title, questions.content, coalesce((
+        SELECT group_concat(answers.content, ' ')
+        FROM answers WHERE answers.question_id = questions.id
+    ), '')
+    FROM questions
+"""
+_SQLITE_WEIGHTS = "10.0, 5.0, 1.0"
+
+
+class SearchNotSupported(NotImplementedError):
+    """전문 검색 저장소가 없는 DB (PostgreSQL / SQLite 외)"""
+
+
+def _dialect(db: Session) -> str:
+    return db.get_bind().dialect.name
+
+
+def index_question(db: Session, question_id: int) -> None:
+    """질문 하나의 검색 문서를 다시 만든다 (커밋은 호출하는 쪽에서)"""
+    dialect = _dialect(db)
+    if dialect == "postgresql":
+        db.execute(
+            text(f"UPDATE questions SET search_vector = {_PG_DOCUMENT} WHERE id = :id"),
+            {"id": question_id},
+        )
+    elif dialect == "sqlite":
+        db.execute(
+            text("DELETE FROM questions_fts WHERE rowid = :id"), {"id": question_id}
+        )
+        db.execute(
+            text(
+                "INSERT INTO questions_fts (rowid, title, content, answers)"
+                f"{_SQLITE_DOCUMENT} WHERE questions.id = :id"
+            ),
+            {"id": question_id},
+        )
+
+
+def rebuild_index(db: Session) -> None:
+    """전체 색인 재구축 - 기존 DB에 검색을 처음 붙이거나 복구할 때"""
+    dialect = _dialect(db)
+    if dialect == "postgresql":
+        db.execute(text(f"UPDATE questions SET search_vector = {_PG_DOCUMENT}"))
+    elif dialect == "sqlite":
+        db.execute(text("DELETE FROM questions_fts"))
+        db.execute(
+            text(
+                "INSERT INTO questions_fts (rowid, title, content, answers)"
+                + _SQLITE_DOCUMENT
+            )
+        )
+    db.commit()
+
+
+def _fts5_query(q: str) -> str:
+    """사용자 입력을 FTS5 문법 오류가 나지 않는 AND 접두어 검색식으로 변환"""
+    terms = ['"{}"*'.format(term.replace('"', '""')) for term in q.split()]
+    return " ".join(terms)
+
+
+def search_question_ids(
+    db: Session, q: str, skip: int = 0, limit: int = 20
+) -> List[int]:
+    """관련도 순 질문 id - 색인만 읽고 questions 테이블은 스캔하지 않음"""
+    dialect = _dialect(db)
+    params = {"limit": limit, "skip": skip}
+    if dialect == "postgresql":
+        params["q"] = q
+        stmt = text(
+            "SELECT questions.id FROM questions, "
+            "websearch_to_tsquery('simple', :q) AS query "
+            "WHERE questions.search_vector @@ query "
+            "ORDER BY ts_rank_cd(questions.search_vector, query) DESC, "
+            "questions.id DESC "
+            "LIMIT :limit OFFSET :skip"
+        )
+    elif dialect == "sqlite":
+        params["q"] = _fts5_query(q)
+        if not params["q"]:
+            return []
+        stmt = text(
+            "SELECT rowid FROM questions_fts WHERE questions_fts MATCH :q "
+            f"ORDER BY bm25(questions_fts, {_SQLITE_WEIGHTS}), rowid DESC "
+            "LIMIT :limit OFFSET :skip"
+        )
+    else:
+        raise SearchNotSupported(f"Full-text search is not supported on {dialect}")
+    return [row[0] for row in db.execute(stmt, params)]
@@ -0,0 +1,207 @@
+"""
+포럼 데이터 스트리밍 내보내기/가져오기 (백업, DB 간 이전)
+
+테이블마다 파일 하나(<테이블>.ndjson 또는 <테이블>.csv)를 쓰고 읽는다.
+읽기는 yield_per(서버 사이드 커서)로, 쓰기는 batch_size 행씩 나눠 처리해
+테이블 크기와 무관하게 메모리 사용량이 일정하다.
+
+- PostgreSQL: CSV 내보내기/가져오기는 COPY ... TO STDOUT / FROM STDIN으로
+  파일을 그대로 흘려보내고, NDJSON 가져오기도 배치를 CSV로 바꿔 COPY
+- 그 외(SQLite): 배치 단위 executemany INSERT
+
+CSV는 PostgreSQL COPY(FORMAT csv)와 같은 규칙을 따른다 - NULL은 따옴표 없는
+빈 필드, 빈 문자열은 "". 그래서 두 DB의 CSV 파일을 서로 주고받을 수 있다.
+"""
+import csv
+import io
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List
+
+from sqlalchemy import Boolean, DateTime, Integer, Table, select, text
+from sqlalchemy.orm import Session
+
+from ..core.database import Base
+from . import search
+
+FORMATS = ("ndjson", "csv")
+
+
+def tables() -> List[Table]:
+    """외래 키 순서(부모 먼저)로 정렬한 전체 테이블"""
+    return list(Base.metadata.sorted_tables)
+
+
+def _dialect(db: Session) -> str:
+    return db.get_bind().dialect.name
+
+
+def _dbapi_cursor(db: Session):
+    return db.connection().connection.dbapi_connection.cursor()
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _decoder(column):
+    """파일에서 읽은 문자열을 컬럼 타입 값으로 (NDJSON의 숫자/불리언은 그대로)"""
+    if isinstance(column.type, DateTime):
+        return datetime.fromisoformat
+    if isinstance(column.type, Boolean):
+        return lambda value: value.lower() in ("true", "t", "1")
+    if isinstance(column.type, Integer):
+        return int
+    return None
+
+
+def _csv_writer(out: IO[str]):
+    return csv.writer(out, quoting=csv.QUOTE_NOTNULL, lineterminator="\n")
+
+
+def _stream_rows(db: Session, table: Table, batch_size: int) -> Iterator[tuple]:
+    stmt = select(table).order_by(*table.primary_key.columns)
+    yield from db.execute(stmt.execution_options(yield_per=batch_size))
+
+
+def export_table(
+    db: Session, table: Table, out: IO[str], fmt: str, batch_size: int = 10_000
+) -> int:
+    """테이블 전체를 out에 기록하고 행 수를 반환"""
+    names = [column.name for column in table.columns]
+    if fmt == "csv" and _dialect(db) == "postgresql":
+        query = f"SELECT {', '.join(names)} FROM {table.name} ORDER BY id"
+        cursor = _dbapi_cursor(db)
+        cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER)", out)
+        return cursor.rowcount
+
+    count = 0
+    if fmt == "csv":
+        writer = _csv_writer(out)
+        writer.writerow(names)
+        for row in _stream_rows(db, table, batch_size):
+            writer.writerow([_encode(value) for value in row])
+            count += 1
+    else:
+        for row in _stream_rows(db, table, batch_size):
+            record = {name: _encode(value) for name, value in zip(names, row)}
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count += 1
+    return count
+
+
+def _read_batches(
+    table: Table, src: IO[str], fmt: str, batch_size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    if fmt == "csv":
+        reader = csv.reader(src, quoting=csv.QUOTE_NOTNULL)
+        names = next(reader, [])
+        records = (dict(zip(names, values)) for values in reader)
+    else:
+        records = (json.loads(line) for line in src if line.strip())
+
+    decoders = [
+        (column.name, decode)
+        for column in table.columns
+        if (decode := _decoder(column)) is not None
+    ]
+    batch = []
+    for record in records:
+        for name, decode in decoders:
+            value = record.get(name)
+            if isinstance(value, str):
+                record[name] = decode(value)
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _copy_from(db: Session, table: Table, names: List[str], src: IO[str]) -> int:
+    cursor = _dbapi_cursor(db)
+    cursor.copy_expert(
+        f"COPY {table.name} ({', '.join(names)}) FROM STDIN WITH (FORMAT csv)", src
+    )
+    return cursor.rowcount
+
+
+def import_table(
+    db: Session, table: Table, src: IO[str], fmt: str, batch_size: int = 10_000
+) -> int:
+    """src의 행을 table에 추가하고 행 수를 반환 (커밋은 호출하는 쪽에서)"""
+    postgres = _dialect(db) == "postgresql"
+    if fmt == "csv" and postgres:
+        # 헤더만 읽고 나머지는 파일째 COPY로 - 행 단위 파싱 없음
+        names = next(csv.reader([src.readline()]), [])
+        return _copy_from(db, table, names, src) if names else 0
+
+    count = 0
+    for batch in _read_batches(table, src, fmt, batch_size):
+        if postgres:
+            names = list(batch[0])
+            buffer = io.StringIO()
+            writer = _csv_writer(buffer)
+            for record in batch:
+                writer.writerow([_encode(record.get(name)) for name in names])
+            buffer.seek(0)
+            _copy_from(db, table, names, buffer)
+        else:
+            db.execute(table.insert(), batch)
+        count += len(batch)
+    return count
+
+
+def _reset_sequences(db: Session) -> None:
+    """명시적 id로 넣은 뒤 PostgreSQL 시퀀스를 최댓값 다음으로 맞춤"""
+    for table in tables():
+        db.execute(
+            text(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                f"coalesce(max(id), 0) + 1, false) FROM {table.name}"
+            )
+        )
+
+
+def export_all(
+    db: Session, directory: Path, fmt: str, batch_size: int = 10_000
+) -> Dict[str, int]:
+    """전체 테이블을 directory/<테이블>.<fmt>로 내보내고 테이블별 행 수를 반환"""
+    directory.mkdir(parents=True, exist_ok=True)
+    counts = {}
+    for table in tables():
+        path = directory / f"{table.name}.{fmt}"
+        with path.open("w", encoding="utf-8", newline="") as out:
+            counts[table.name] = export_table(db, table, out, fmt, batch_size)
+    return counts
+
+
+def import_all(
+    db: Session, directory: Path, fmt: str, batch_size: int = 10_000
+) -> Dict[str, int]:
+    """
+    export_all로 만든 파일을 외래 키 순서대로 가져옴 (id 보존)
+
+    한 트랜잭션으로 넣고 커밋한 뒤 검색 색인을 재구축한다. 대상 DB는 스키마만
+    있는 빈 DB여야 한다 - 같은 id가 있으면 중복 키 오류로 전체가 롤백된다.
+    """
+    counts = {}
+    try:
+        for table in tables():
+            path = directory / f"{table.name}.{fmt}"
+            if not path.exists():
+                continue
+            with path.open(encoding="utf-8", newline="") as src:
+                counts[table.name] = import_table(db, table, src, fmt, batch_size)
+        if _dialect(db) == "postgresql":
+            _reset_sequences(db)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    search.rebuild_index(db)
+    return counts
@@ -1,12 +1,55 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
+from sqlalchemy.exc import TimeoutError as SQLAlchemyTimeoutError
 
-from .api import answers, auth, questions, users
+from .api import answers, auth, questions, search, tags, users
+from .core import metrics
 from .core.config import settings
-from .core.database import Base, engine
+from .core.database import Base, engine, replicas
+from .core.events import question_events
+from .core.migrations import check_schema
+from .core.rate_limit import RateLimitMiddleware, create_bucket_store
+from .core.request_metrics import MetricsMiddleware, instrument_sql
+from .core.response_cache import response_cache
+from .core.security import PasswordHasherBusy, password_hasher
+from .core.sql_profiler import SqlProfilingMiddleware
+from .core.view_counter import view_counter
+
+
+def prepare_schema() -> None:
+    """
+    시작 시 스키마 확인 - 테이블 생성은 배포 단계의 `alembic upgrade head`가 담당
+
+    revision은 alembic_version 한 행만 읽으므로 테이블마다 카탈로그를 조회하던
+    import 시점 create_all보다 워커 기동이 빠르다.
+    """
+    if settings.DATABASE_SCHEMA_CHECK == "revision":
+        check_schema(engine)
+    elif settings.DATABASE_SCHEMA_CHECK == "create":
+        Base.metadata.create_all(bind=engine)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await run_in_threadpool(prepare_schema)
+    # 워커 프로세스마다 조회수 flush 스레드 실행, 종료 시 남은 조회수 반영
+    view_counter.start()
+    replicas.start()
+    await question_events.start()
+    await response_cache.start()
+    try:
+        yield
+    finally:
+        await response_cache.stop()
+        await question_events.stop()
+        await replicas.stop()
+        await run_in_threadpool(view_counter.stop)
+        password_hasher.shutdown()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -21,6 +64,7 @@ app = FastAPI(
     * **사용자 (Users)**: 사용자 정보 조회 (공개 정보 / 마이페이지)
     * **질문 (Questions)**: 질문 작성, 조회, 수정 (작성자만)
     * **답변 (Answers)**: 답변 작성, 수정, 삭제 (작성자만)
+    * **검색 (Search)**: 질문 제목/본문/답변 전문 검색
     
     ### API 응답 형식
     
@@ -49,8 +93,27 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
+# CORS보다 안쪽 - 429/503 거절 응답에도 CORS 헤더가 붙어 브라우저가 읽을 수 있음
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        store=create_bucket_store(settings.RATE_LIMIT_BACKEND),
+        ip_rate=settings.RATE_LIMIT_IP_PER_SECOND,
+        ip_burst=settings.RATE_LIMIT_IP_BURST,
+        user_rate=settings.RATE_LIMIT_USER_PER_SECOND,
+        user_burst=settings.RATE_LIMIT_USER_BURST,
+        auth_rate=settings.RATE_LIMIT_AUTH_PER_MINUTE / 60,
+        auth_burst=settings.RATE_LIMIT_AUTH_BURST,
+        auth_paths=(
+            f"{settings.API_V1_STR}/auth/token",
+            f"{settings.API_V1_STR}/auth/register",
+        ),
+        max_in_flight=settings.MAX_IN_FLIGHT_REQUESTS,
+    )
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -60,6 +123,50 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.SQL_PROFILE_ENABLED:
+    app.add_middleware(
+        SqlProfilingMiddleware,
+        slow_request_ms=settings.SQL_PROFILE_SLOW_REQUEST_MS,
+        n_plus_one_threshold=settings.SQL_PROFILE_N_PLUS_ONE_THRESHOLD,
+        server_timing=settings.SQL_PROFILE_SERVER_TIMING,
+    )
+
+# 가장 바깥(CORS 포함)에서 요청 지연 시간/응답 크기/요청당 SQL 측정
+if settings.METRICS_ENABLED:
+    instrument_sql()
+    app.add_middleware(MetricsMiddleware)
+
+
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    # 해싱 대기열이 가득 차면 기다리게 하지 않고 바로 실패시켜 다른 요청을 보호
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "detail": {
+                "error": "SERVICE_BUSY",
+                "message": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요.",
+            }
+        },
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(SQLAlchemyTimeoutError)
+async def db_pool_timeout_handler(request: Request, exc: SQLAlchemyTimeoutError):
+    # 풀이 pool_timeout 동안 비지 않음 - 연결을 더 열지 않고 부하를 되돌려 보냄
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "detail": {
+                "error": "DATABASE_BUSY",
+                "message": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요.",
+            }
+        },
+        headers={"Retry-After": "1"},
+    )
+
+
 # Include routers
 app.include_router(auth.router, prefix=f"{settings.API_V1_STR}/auth", tags=["auth"])
 app.include_router(
@@ -69,6 +176,10 @@ app.include_router(
     answers.router, prefix=f"{settings.API_V1_STR}/answers", tags=["answers"]
 )
 app.include_router(users.router, prefix=f"{settings.API_V1_STR}/users", tags=["users"])
+app.include_router(
+    search.router, prefix=f"{settings.API_V1_STR}/search", tags=["search"]
+)
+app.include_router(tags.router, prefix=f"{settings.API_V1_STR}/tags", tags=["tags"])
 
 
 @app.get("/")
@@ -79,3 +190,9 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    """Prometheus 스크레이프용 메트릭 (워커 단위)"""
+    return PlainTextResponse(metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
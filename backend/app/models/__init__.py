@@ -1,6 +1,19 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    false,
+    text,
+)
 from sqlalchemy.orm import relationship
 
 from ..core.database import Base
@@ -16,6 +29,8 @@ class User(Base):
     full_name = Column(String)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # 프로필이 바뀐 시각 - 작성자 정보를 담는 질문/답변 응답의 검증자(ETag)에 포함
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     questions = relationship("Question", back_populates="author")
     answers = relationship("Answer", back_populates="author")
@@ -32,11 +47,71 @@ class Question(Base):
     author_id = Column(Integer, ForeignKey("users.id"))
     views = Column(Integer, default=0)
     is_solved = Column(Boolean, default=False)
+    # 비정규화 집계 - 답변 생성/수정/삭제 트랜잭션에서 crud가 함께 갱신
+    answer_count = Column(Integer, nullable=False, default=0, server_default="0")
+    has_accepted_answer = Column(
+        Boolean, nullable=False, default=False, server_default=false()
+    )
+    # 마지막 활동(질문 작성/수정, 답변 작성/수정) 시각 - sort=active 정렬 키
+    last_activity_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
     author = relationship("User", back_populates="questions")
-    answers = relationship("Answer", back_populates="question")
+    answers = relationship("Answer", back_populates="question", order_by="Answer.id")
     tags = relationship("QuestionTag", back_populates="question")
 
+    @property
+    def tag_names(self):
+        """응답용 태그 이름 목록 (loaders에서 tags.tag를 미리 로드)"""
+        return sorted(question_tag.tag.name for question_tag in self.tags)
+
+    # 목록 정렬 모드마다 (정렬 키, id) 인덱스 하나 - 역방향 범위 스캔으로
+    # ORDER BY ... DESC와 커서 조건을 정렬 단계 없이 처리 (app.crud.SORT_KEYS)
+    __table_args__ = (
+        # sort=newest
+        Index("ix_questions_created_at_id", "created_at", "id"),
+        # sort=views
+        Index("ix_questions_views_id", "views", "id"),
+        # sort=active
+        Index("ix_questions_last_activity_at_id", "last_activity_at", "id"),
+        # sort=unanswered: 미답변 질문만 담는 부분 인덱스 (답변이 달리면 빠짐)
+        Index(
+            "ix_questions_unanswered_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("answer_count = 0"),
+            sqlite_where=text("answer_count = 0"),
+        ),
+    )
+
+
+# 전문 검색 저장소 - ORM에는 매핑하지 않고 app.crud.search가 직접 갱신/조회
+# PostgreSQL: questions.search_vector(tsvector) + GIN 인덱스
+# SQLite: questions_fts FTS5 섀도 테이블 (rowid = questions.id)
+SEARCH_DDL = {
+    "postgresql": [
+        "ALTER TABLE questions ADD COLUMN IF NOT EXISTS search_vector tsvector",
+        "CREATE INDEX IF NOT EXISTS ix_questions_search_vector "
+        "ON questions USING GIN (search_vector)",
+    ],
+    "sqlite": [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS questions_fts USING fts5("
+        "title, content, answers, "
+        "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')",
+    ],
+}
+for _dialect, _statements in SEARCH_DDL.items():
+    for _statement in _statements:
+        event.listen(
+            Question.__table__,
+            "after_create",
+            DDL(_statement).execute_if(dialect=_dialect),
+        )
+event.listen(
+    Question.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS questions_fts").execute_if(dialect="sqlite"),
+)
+
 
 class Answer(Base):
     __tablename__ = "answers"
@@ -52,6 +127,11 @@ class Answer(Base):
     author = relationship("User", back_populates="answers")
     question = relationship("Question", back_populates="answers")
 
+    __table_args__ = (
+        # 질문 -> 답변 (답변 목록, 집계 갱신, 검색 문서의 답변 모으기)
+        Index("ix_answers_question_id", "question_id"),
+    )
+
 
 class Tag(Base):
     __tablename__ = "tags"
@@ -59,16 +139,41 @@ class Tag(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, nullable=False)
     description = Column(Text)
+    # 태그가 붙은 질문 수 - 태그 부착/해제 트랜잭션에서 crud가 함께 갱신
+    question_count = Column(Integer, nullable=False, default=0, server_default="0")
 
     questions = relationship("QuestionTag", back_populates="tag")
 
+    __table_args__ = (
+        # GET /tags 인기순 정렬용
+        Index("ix_tags_question_count", "question_count"),
+    )
+
 
 class QuestionTag(Base):
     __tablename__ = "question_tags"
 
     id = Column(Integer, primary_key=True, index=True)
-    question_id = Column(Integer, ForeignKey("questions.id"))
-    tag_id = Column(Integer, ForeignKey("tags.id"))
+    question_id = Column(Integer, ForeignKey("questions.id"), nullable=False)
+    tag_id = Column(Integer, ForeignKey("tags.id"), nullable=False)
+    # 질문 작성 시각 사본 (변하지 않음) - 태그별 최신순 목록을 이 테이블 인덱스만으로 정렬
+    question_created_at = Column(DateTime, nullable=False)
 
     question = relationship("Question", back_populates="tags")
     tag = relationship("Tag", back_populates="questions")
+
+    __table_args__ = (
+        # 같은 태그 중복 부착 방지 + 태그 -> 질문 조회
+        Index(
+            "ux_question_tags_tag_id_question_id", "tag_id", "question_id", unique=True
+        ),
+        # 질문 -> 태그 (목록/상세의 태그 이름 로드)
+        Index("ix_question_tags_question_id", "question_id"),
+        # GET /questions?tag= 최신순 + 커서: tag_id 구간을 정렬 순서대로 범위 스캔
+        Index(
+            "ix_question_tags_tag_id_created_at",
+            "tag_id",
+            "question_created_at",
+            "question_id",
+        ),
+    )
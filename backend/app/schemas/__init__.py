@@ -1,9 +1,15 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import AliasChoices, BaseModel, EmailStr, Field
 
-from .response import ApiResponse, ErrorResponse, error_response, success_response
+from .response import (
+    ApiResponse,
+    ErrorResponse,
+    error_response,
+    render_success,
+    success_response,
+)
 
 
 # User schemas
@@ -25,6 +31,8 @@ class UserUpdate(BaseModel):
 
 
 class User(UserBase):
+    # 저장된 이메일은 가입/수정 때 이미 검증됨 - 응답마다 EmailStr 검증을 다시 하지 않음
+    email: str
     id: int
     is_active: bool
     created_at: datetime
@@ -39,23 +47,42 @@ class QuestionBase(BaseModel):
     content: str
 
 
+MAX_TAGS_PER_QUESTION = 5
+
+
 class QuestionCreate(QuestionBase):
-    pass
+    tags: List[str] = Field(default_factory=list, max_length=MAX_TAGS_PER_QUESTION)
 
 
 class QuestionUpdate(BaseModel):
     title: Optional[str] = None
     content: Optional[str] = None
     is_solved: Optional[bool] = None
+    # None이면 태그 유지, 리스트면 그 목록으로 교체
+    tags: Optional[List[str]] = Field(default=None, max_length=MAX_TAGS_PER_QUESTION)
+
 
+class QuestionCore(QuestionBase):
+    """작성자/답변을 중첩하지 않은 질문 (QuestionFull에서 사용)"""
 
-class Question(QuestionBase):
     id: int
     created_at: datetime
     updated_at: datetime
     author_id: int
     views: int
     is_solved: bool
+    answer_count: int = 0
+    has_accepted_answer: bool = False
+    last_activity_at: datetime
+    tags: List[str] = Field(
+        default=[], validation_alias=AliasChoices("tag_names", "tags")
+    )
+
+    class Config:
+        from_attributes = True
+
+
+class Question(QuestionCore):
     author: User
     answers: List["Answer"] = []
 
@@ -63,6 +90,25 @@ class Question(QuestionBase):
         from_attributes = True
 
 
+class QuestionSummary(BaseModel):
+    """목록용 경량 질문 - 본문 전체와 답변 대신 발췌와 집계만 포함"""
+
+    id: int
+    title: str
+    excerpt: str
+    author_username: Optional[str] = None
+    created_at: datetime
+    views: int
+    is_solved: bool
+    answer_count: int
+    has_accepted_answer: bool = False
+    last_activity_at: datetime
+    tags: List[str] = []
+
+    class Config:
+        from_attributes = True
+
+
 # Answer schemas
 class AnswerBase(BaseModel):
     content: str
@@ -77,19 +123,39 @@ class AnswerUpdate(BaseModel):
     is_accepted: Optional[bool] = None
 
 
-class Answer(AnswerBase):
+class AnswerCore(AnswerBase):
+    """작성자를 중첩하지 않은 답변 (QuestionFull에서 사용)"""
+
     id: int
     created_at: datetime
     updated_at: datetime
     author_id: int
     question_id: int
     is_accepted: bool
+
+    class Config:
+        from_attributes = True
+
+
+class Answer(AnswerCore):
     author: User
 
     class Config:
         from_attributes = True
 
 
+class QuestionFull(BaseModel):
+    """
+    질문 페이지 한 번에 - 질문, 답변, 둘이 참조하는 작성자
+
+    작성자는 author_id로 찾도록 users에 한 번씩만 담는다 (답변마다 반복하지 않음).
+    """
+
+    question: QuestionCore
+    answers: List[AnswerCore]
+    users: List[User]
+
+
 # Tag schemas
 class TagBase(BaseModel):
     name: str
@@ -102,6 +168,7 @@ class TagCreate(TagBase):
 
 class Tag(TagBase):
     id: int
+    question_count: int = 0
 
     class Config:
         from_attributes = True
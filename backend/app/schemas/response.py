@@ -1,9 +1,9 @@
 """
 통일된 API 응답 형식을 위한 스키마
 """
-from typing import Any, Generic, Optional, TypeVar
+from typing import Any, Dict, Generic, Optional, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 T = TypeVar("T")
 
@@ -19,6 +19,14 @@ class ApiResponse(BaseModel, Generic[T]):
             "data": {...},
             "message": "Operation successful"
         }
+
+        커서 페이지네이션 응답 (다음 페이지가 있을 때):
+        {
+            "success": true,
+            "data": [...],
+            "message": "Operation successful",
+            "next_cursor": "WyIyMDI1LTAxLTAxVDAwOjAwOjAwIiw0Ml0"
+        }
         
         실패 응답:
         {
@@ -32,6 +40,7 @@ class ApiResponse(BaseModel, Generic[T]):
     data: Optional[T] = None
     message: Optional[str] = None
     error: Optional[str] = None
+    next_cursor: Optional[str] = None
 
     class Config:
         from_attributes = True
@@ -47,10 +56,14 @@ class ErrorResponse(BaseModel):
 
 
 def success_response(
-    data: Any = None, message: str = "Operation successful"
+    data: Any = None,
+    message: str = "Operation successful",
+    next_cursor: Optional[str] = None,
 ) -> ApiResponse:
     """성공 응답 생성 헬퍼 함수"""
-    return ApiResponse(success=True, data=data, message=message)
+    return ApiResponse(
+        success=True, data=data, message=message, next_cursor=next_cursor
+    )
 
 
 def error_response(
@@ -58,3 +71,27 @@ def error_response(
 ) -> ErrorResponse:
     """에러 응답 생성 헬퍼 함수"""
     return ErrorResponse(error=error, message=message, detail=detail)
+
+
+_response_adapters: Dict[Any, TypeAdapter] = {}
+
+
+def render_success(
+    data_type: Any,
+    data: Any = None,
+    message: str = "Operation successful",
+    next_cursor: Optional[str] = None,
+) -> bytes:
+    """
+    ApiResponse[data_type] 성공 응답을 JSON bytes로 직렬화
+
+    ORM 객체를 한 번만 검증/직렬화하므로 결과를 그대로 캐시하거나 Response로 보낼 수 있다.
+    """
+    adapter = _response_adapters.get(data_type)
+    if adapter is None:
+        adapter = _response_adapters[data_type] = TypeAdapter(ApiResponse[data_type])
+    payload = adapter.validate_python(
+        {"success": True, "data": data, "message": message, "next_cursor": next_cursor},
+        from_attributes=True,
+    )
+    return adapter.dump_json(payload)
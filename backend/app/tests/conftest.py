@@ -0,0 +1,132 @@
+import os
+from contextlib import contextmanager
+
+# app 임포트 전에 테스트용 DB를 지정해야 .env의 PostgreSQL 설정을 타지 않음
+os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
+# 테스트 속도를 위해 최소 bcrypt cost, 해싱은 프로세스 풀 대신 스레드풀
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ.setdefault("PASSWORD_HASH_WORKERS", "0")
+# 모든 요청이 같은 클라이언트(testclient)라 요청 수 제한은 해당 테스트에서만 켬
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base, get_db, get_read_db
+from app.core.principals import principal_cache
+from app.core.response_cache import response_cache
+from app.main import app
+from app.models import Answer, Question, User
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def db():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+        # id가 재사용되므로 테스트 간 캐시를 비움
+        principal_cache.clear()
+        response_cache.clear()
+
+
+@pytest.fixture
+def client(db):
+    def override_get_db():
+        session = TestingSessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_read_db, None)
+
+
+class QueryCounter:
+    """블록 안에서 실행된 SQL 문장을 모으는 카운터"""
+
+    def __init__(self):
+        self.statements = []
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+
+@pytest.fixture
+def count_queries():
+    """with count_queries() as counter: ... 형태로 테스트 엔진의 쿼리 수 측정"""
+
+    @contextmanager
+    def counting():
+        counter = QueryCounter()
+        event.listen(engine, "before_cursor_execute", counter._record)
+        try:
+            yield counter
+        finally:
+            event.remove(engine, "before_cursor_execute", counter._record)
+
+    return counting
+
+
+@pytest.fixture
+def author(db):
+    user = User(email="author@example.com", username="author", hashed_password="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def make_questions(db, author):
+    """author 명의의 질문(과 답변)을 count개 생성하는 팩토리"""
+
+    def factory(count, answers_per_question=0):
+        questions = []
+        for i in range(count):
+            question = Question(
+                title=f"질문 {i}",
+                content=f"내용 {i}",
+                author_id=author.id,
+                answer_count=answers_per_question,
+            )
+            db.add(question)
+            questions.append(question)
+        db.flush()
+        for question in questions:
+            for j in range(answers_per_question):
+                db.add(
+                    Answer(
+                        content=f"답변 {j}",
+                        question_id=question.id,
+                        author_id=author.id,
+                    )
+                )
+        db.commit()
+        # crud를 거치지 않은 쓰기라 응답 캐시 무효화도 직접
+        response_cache.clear()
+        return questions
+
+    return factory
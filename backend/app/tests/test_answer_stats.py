@@ -0,0 +1,45 @@
+from app.crud import create_answer, delete_answer, repair_answer_stats, update_answer
+from app.models import Question
+from app.schemas import AnswerCreate, AnswerUpdate
+
+
+def _stats(db, question_id):
+    db.expire_all()
+    question = db.get(Question, question_id)
+    return question.answer_count, question.has_accepted_answer
+
+
+def test_answer_writes_maintain_counts_in_same_transaction(db, author, make_questions):
+    question_id = make_questions(1)[0].id
+    updated_at = db.get(Question, question_id).updated_at
+
+    first = create_answer(
+        db, AnswerCreate(content="a", question_id=question_id), author.id
+    )
+    second = create_answer(
+        db, AnswerCreate(content="b", question_id=question_id), author.id
+    )
+    assert _stats(db, question_id) == (2, False)
+
+    update_answer(db, first.id, AnswerUpdate(is_accepted=True))
+    assert _stats(db, question_id) == (2, True)
+
+    delete_answer(db, second.id)
+    assert _stats(db, question_id) == (1, True)
+
+    delete_answer(db, first.id)
+    assert _stats(db, question_id) == (0, False)
+    assert db.get(Question, question_id).updated_at == updated_at
+
+
+def test_repair_recomputes_drifted_counts(db, make_questions):
+    questions = make_questions(3, answers_per_question=2)
+    drifted_id = questions[1].id
+    db.query(Question).filter(Question.id == drifted_id).update(
+        {"answer_count": 7, "has_accepted_answer": True}
+    )
+    db.commit()
+
+    assert repair_answer_stats(db, batch_size=2) == 1
+    assert _stats(db, drifted_id) == (2, False)
+    assert repair_answer_stats(db) == 0
@@ -0,0 +1,83 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.database import Base, async_database_url, get_db, get_read_db
+from app.main import app
+
+pytest.importorskip("aiosqlite")
+asyncio_ext = pytest.importorskip("sqlalchemy.ext.asyncio")
+
+
+@pytest.fixture
+def async_client(tmp_path):
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    Base.metadata.create_all(bind=create_engine(url))
+
+    # TestClient는 요청마다 이벤트 루프가 달라질 수 있으므로 커넥션을 재사용하지 않음
+    engine = asyncio_ext.create_async_engine(
+        async_database_url(url), poolclass=NullPool
+    )
+    session_factory = asyncio_ext.async_sessionmaker(engine, expire_on_commit=False)
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_read_db, None)
+
+
+def test_async_database_url_swaps_drivers():
+    assert async_database_url("sqlite:///./a.db").drivername == "sqlite+aiosqlite"
+    assert (
+        async_database_url("postgresql://u:p@h/db").drivername == "postgresql+asyncpg"
+    )
+
+
+def test_request_path_works_end_to_end_on_async_session(async_client):
+    client = async_client
+    response = client.post(
+        "/api/v1/auth/register",
+        json={"email": "a@example.com", "username": "alice", "password": "pw"},
+    )
+    assert response.status_code == 200
+
+    token = client.post(
+        "/api/v1/auth/token", data={"username": "alice", "password": "pw"}
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    question = client.post(
+        "/api/v1/questions/", json={"title": "t", "content": "c"}, headers=headers
+    ).json()["data"]
+    assert question["author"]["username"] == "alice"
+
+    answer = client.post(
+        "/api/v1/answers/",
+        json={"content": "a", "question_id": question["id"]},
+        headers=headers,
+    ).json()["data"]
+    assert answer["author"]["username"] == "alice"
+
+    updated = client.put(
+        f"/api/v1/questions/{question['id']}",
+        json={"is_solved": True},
+        headers=headers,
+    ).json()["data"]
+    assert updated["is_solved"] is True
+    assert [a["id"] for a in updated["answers"]] == [answer["id"]]
+
+    listing = client.get("/api/v1/questions/").json()["data"]
+    assert listing[0]["answers"][0]["author"]["username"] == "alice"
+    assert client.get(f"/api/v1/questions/{question['id']}").status_code == 200
+
+    deleted = client.delete(f"/api/v1/answers/{answer['id']}", headers=headers)
+    assert deleted.status_code == 200
+    assert client.get("/api/v1/users/me", headers=headers).json()["data"]["id"]
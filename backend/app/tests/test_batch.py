@@ -0,0 +1,76 @@
+from app.core.config import settings
+from app.models import Answer, User
+
+
+def test_users_batch_keeps_request_order(client, db, author):
+    other = User(email="other@example.com", username="other", hashed_password="x")
+    db.add(other)
+    db.commit()
+
+    response = client.get(f"/api/v1/users/?ids={other.id},999,{author.id},{other.id}")
+
+    assert response.status_code == 200
+    assert [user["username"] for user in response.json()["data"]] == [
+        "other",
+        "author",
+    ]
+
+
+def test_batch_rejects_bad_or_too_many_ids(client, monkeypatch):
+    monkeypatch.setattr(settings, "BATCH_MAX_IDS", 2)
+
+    too_many = client.get("/api/v1/questions/?ids=1,2,3")
+    invalid = client.get("/api/v1/users/?ids=1,abc")
+
+    assert too_many.status_code == 400
+    assert too_many.json()["detail"]["error"] == "TOO_MANY_IDS"
+    assert invalid.status_code == 400
+    assert invalid.json()["detail"]["error"] == "INVALID_IDS"
+
+
+def test_questions_batch_keeps_request_order(client, make_questions):
+    first, second, third = make_questions(3)
+
+    ids = f"{third.id},{first.id},999"
+    full = client.get(f"/api/v1/questions/?ids={ids}").json()["data"]
+    summary = client.get(f"/api/v1/questions/?ids={ids}&view=summary").json()["data"]
+
+    assert [q["id"] for q in full] == [third.id, first.id]
+    assert [q["id"] for q in summary] == [third.id, first.id]
+    assert full[0]["author"]["username"] == "author"
+
+
+def test_question_full_returns_deduped_users(
+    client, db, author, make_questions, count_queries
+):
+    (question,) = make_questions(1, answers_per_question=2)
+    other = User(email="other@example.com", username="other", hashed_password="x")
+    db.add(other)
+    db.flush()
+    db.add(Answer(content="다른 답변", question_id=question.id, author_id=other.id))
+    db.commit()
+
+    with count_queries() as counter:
+        response = client.get(f"/api/v1/questions/{question.id}/full")
+    data = response.json()["data"]
+
+    assert response.status_code == 200
+    assert data["question"]["id"] == question.id
+    assert len(data["answers"]) == 3
+    assert [user["username"] for user in data["users"]] == ["author", "other"]
+    # 조회수 + 버전 확인 + 질문/태그/답변/사용자 - 답변 수와 무관
+    assert counter.count <= 7
+
+    etag = response.headers["ETag"]
+    assert etag != client.get(f"/api/v1/questions/{question.id}").headers["ETag"]
+    not_modified = client.get(
+        f"/api/v1/questions/{question.id}/full", headers={"If-None-Match": etag}
+    )
+    assert not_modified.status_code == 304
+
+
+def test_question_full_missing_returns_404(client):
+    response = client.get("/api/v1/questions/999/full")
+
+    assert response.status_code == 404
+    assert response.json()["detail"]["error"] == "QUESTION_NOT_FOUND"
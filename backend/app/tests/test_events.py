@@ -0,0 +1,100 @@
+import asyncio
+
+from app.core import events
+from app.core.events import MemoryBroker, QuestionEventHub
+from app.core.security import create_access_token
+from app.models import Answer, Question, User
+
+
+def test_hub_fans_out_events_for_the_subscribed_question():
+    async def scenario():
+        hub = QuestionEventHub(MemoryBroker(), queue_size=8, keepalive=5)
+        await hub.start()
+        stream = hub.stream(1)
+        assert await anext(stream) == b"retry: 3000\n\n"
+        # crud처럼 다른 스레드에서 발행
+        await asyncio.to_thread(hub.publish, 2, "answer.created", b'{"id":7}')
+        await asyncio.to_thread(hub.publish, 1, "answer.created", b'{"id":8}')
+        frame = await asyncio.wait_for(anext(stream), 1)
+        assert hub.connections == 1
+        await hub.stop()
+        assert [chunk async for chunk in stream] == []
+        return frame, hub.connections
+
+    frame, connections = asyncio.run(scenario())
+    assert frame == b'event: answer.created\ndata: {"id":8}\n\n'
+    assert connections == 0
+
+
+def test_slow_subscriber_is_disconnected():
+    async def scenario():
+        hub = QuestionEventHub(MemoryBroker(), queue_size=1, keepalive=5)
+        await hub.start()
+        stream = hub.stream(1)
+        await anext(stream)
+        hub.publish(1, "answer.created", b"{}")
+        hub.publish(1, "answer.updated", b"{}")
+        await asyncio.sleep(0)
+        chunks = [chunk async for chunk in stream]
+        await hub.stop()
+        return chunks
+
+    assert asyncio.run(scenario()) == []
+
+
+def test_idle_stream_sends_keepalive_comments():
+    async def scenario():
+        hub = QuestionEventHub(MemoryBroker(), queue_size=8, keepalive=0.01)
+        stream = hub.stream(1)
+        await anext(stream)
+        chunk = await anext(stream)
+        await stream.aclose()
+        return chunk
+
+    assert asyncio.run(scenario()) == b": keepalive\n\n"
+
+
+def test_answer_changes_publish_events(client, db, monkeypatch):
+    published = []
+    monkeypatch.setattr(
+        events.question_events,
+        "publish",
+        lambda question_id, event, data: published.append((question_id, event, data)),
+    )
+    author = User(email="a@example.com", username="author", hashed_password="x")
+    db.add(author)
+    db.flush()
+    question = Question(title="질문", content="내용", author_id=author.id)
+    db.add(question)
+    db.commit()
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'author'})}"}
+
+    answer_id = client.post(
+        "/api/v1/answers/",
+        json={"content": "답변", "question_id": question.id},
+        headers=headers,
+    ).json()["data"]["id"]
+    client.put(
+        f"/api/v1/answers/{answer_id}", json={"is_accepted": True}, headers=headers
+    )
+    client.put(
+        f"/api/v1/answers/{answer_id}", json={"content": "수정"}, headers=headers
+    )
+    client.delete(f"/api/v1/answers/{answer_id}", headers=headers)
+
+    assert [(qid, event) for qid, event, _ in published] == [
+        (question.id, "answer.created"),
+        (question.id, "answer.accepted"),
+        (question.id, "answer.updated"),
+        (question.id, "answer.deleted"),
+    ]
+    assert '"content":"수정"'.encode() in published[2][2]
+    assert published[3][2] == b'{"id":%d,"question_id":%d}' % (answer_id, question.id)
+    assert db.query(Answer).count() == 0
+
+
+def test_events_stream_for_missing_question_returns_404(client):
+    response = client.get("/api/v1/questions/999/events")
+
+    assert response.status_code == 404
+    assert response.json()["detail"]["error"] == "QUESTION_NOT_FOUND"
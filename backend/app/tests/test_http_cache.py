@@ -0,0 +1,91 @@
+from app.core.response_cache import response_cache
+from app.crud import create_answer, update_user
+from app.schemas import AnswerCreate, UserUpdate
+
+
+def test_question_detail_returns_304_for_matching_etag(
+    client, make_questions, count_queries
+):
+    question_id = make_questions(1, answers_per_question=2)[0].id
+    url = f"/api/v1/questions/{question_id}"
+
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert "s-maxage=" in first.headers["cache-control"]
+    assert "last-modified" in first.headers
+
+    # 응답 캐시 없이 검증자 쿼리만으로 304를 내는 경로
+    response_cache.clear()
+    with count_queries() as counter:
+        second = client.get(url, headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    # 질문 행 + 답변 (id, updated_at) 두 쿼리만, 본문 로드 없음
+    assert counter.count == 2
+
+
+def test_question_etag_changes_when_answer_added(client, db, author, make_questions):
+    question_id = make_questions(1)[0].id
+    url = f"/api/v1/questions/{question_id}"
+    etag = client.get(url).headers["etag"]
+    answers_etag = client.get(f"{url}/answers").headers["etag"]
+
+    create_answer(
+        db, AnswerCreate(content="새 답변", question_id=question_id), author.id
+    )
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert len(response.json()["data"]["answers"]) == 1
+
+    answers = client.get(f"{url}/answers", headers={"If-None-Match": answers_etag})
+    assert answers.status_code == 200
+    assert answers.headers["etag"] != answers_etag
+
+
+def test_etags_change_when_author_profile_changes(client, db, author, make_questions):
+    question_id = make_questions(1, answers_per_question=1)[0].id
+    urls = [
+        f"/api/v1/questions/{question_id}",
+        f"/api/v1/questions/{question_id}/answers",
+        f"/api/v1/questions/{question_id}/full",
+        f"/api/v1/users/{author.id}",
+    ]
+    etags = [client.get(url).headers["etag"] for url in urls]
+
+    update_user(db, author.id, UserUpdate(full_name="새 이름"))
+    # 응답 캐시에 남은 본문은 TTL 동안 유지되므로 검증자만 확인
+    response_cache.clear()
+
+    for url, etag in zip(urls, etags):
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200, url
+        assert response.headers["etag"] != etag
+
+
+def test_if_modified_since(client, make_questions):
+    question_id = make_questions(1)[0].id
+    url = f"/api/v1/questions/{question_id}"
+    last_modified = client.get(url).headers["last-modified"]
+
+    fresh = client.get(url, headers={"If-Modified-Since": last_modified})
+    assert fresh.status_code == 304
+
+    stale = client.get(
+        url, headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"}
+    )
+    assert stale.status_code == 200
+
+
+def test_user_profile_etag(client, author):
+    url = f"/api/v1/users/{author.id}"
+    first = client.get(url)
+    assert first.status_code == 200
+
+    second = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 304
+
+    assert client.get("/api/v1/users/9999").status_code == 404
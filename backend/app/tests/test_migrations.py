@@ -0,0 +1,108 @@
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, inspect, text
+
+from app.core.database import Base
+from app.core.migrations import (
+    SCHEMA_REVISION,
+    SchemaOutOfDate,
+    alembic_config,
+    check_schema,
+    head_revision,
+    include_object,
+)
+
+
+@pytest.fixture
+def migrated(tmp_path):
+    url = f"sqlite:///{tmp_path / 'migrated.db'}"
+    engine = create_engine(url)
+    command.upgrade(alembic_config(url), "head")
+    yield url, engine
+    engine.dispose()
+
+
+def test_migrations_match_models(migrated):
+    _, engine = migrated
+    with engine.connect() as connection:
+        context = MigrationContext.configure(
+            connection,
+            opts={"include_object": include_object, "compare_server_default": True},
+        )
+        assert compare_metadata(context, Base.metadata) == []
+        # 검색 저장소(FTS5)도 마이그레이션이 만듦
+        assert "questions_fts" in inspect(connection).get_table_names()
+
+
+def test_check_schema_compares_revision_only(migrated, tmp_path):
+    assert SCHEMA_REVISION == head_revision()
+    url, engine = migrated
+    check_schema(engine)
+
+    command.downgrade(alembic_config(url), "base")
+    with pytest.raises(SchemaOutOfDate):
+        check_schema(engine)
+
+    empty = create_engine(f"sqlite:///{tmp_path / 'empty.db'}")
+    with pytest.raises(SchemaOutOfDate):
+        check_schema(empty)
+    empty.dispose()
+
+
+def test_upgrade_backfills_baseline_database(tmp_path):
+    # 마이그레이션 도입 전 create_all로 만든 DB와 같은 0001 스키마에 데이터를 넣고 올림
+    url = f"sqlite:///{tmp_path / 'baseline.db'}"
+    engine = create_engine(url)
+    command.upgrade(alembic_config(url), "0001")
+    with engine.begin() as connection:
+        for statement in (
+            "INSERT INTO users (id, email, username, hashed_password) "
+            "VALUES (1, 'a@example.com', 'author', 'x')",
+            "INSERT INTO questions (id, title, content, created_at, updated_at, "
+            "author_id) VALUES (1, '파이썬 질문', '내용', '2024-01-01 00:00:00', "
+            "'2024-01-03 00:00:00', 1), (2, '두 번째', '내용', "
+            "'2024-01-02 00:00:00', NULL, 1)",
+            "INSERT INTO answers (content, question_id, author_id, is_accepted) "
+            "VALUES ('답변 하나', 1, 1, 1), ('답변 둘', 1, 1, 0)",
+            "INSERT INTO tags (id, name) VALUES (1, 'python')",
+            "INSERT INTO question_tags (question_id, tag_id) "
+            "VALUES (1, 1), (1, 1), (2, 1), (NULL, 1)",
+        ):
+            connection.execute(text(statement))
+
+    command.upgrade(alembic_config(url), "head")
+
+    with engine.connect() as connection:
+        questions = connection.execute(
+            text(
+                "SELECT id, answer_count, has_accepted_answer, last_activity_at "
+                "FROM questions ORDER BY id"
+            )
+        ).all()
+        question_tags = connection.execute(
+            text(
+                "SELECT question_id, question_created_at FROM question_tags "
+                "ORDER BY question_id"
+            )
+        ).all()
+        question_count = connection.execute(
+            text("SELECT question_count FROM tags")
+        ).scalar()
+        searchable = connection.execute(
+            text("SELECT rowid FROM questions_fts WHERE questions_fts MATCH '답변*'")
+        ).all()
+    check_schema(engine)
+    engine.dispose()
+
+    assert questions == [
+        (1, 2, 1, "2024-01-03 00:00:00"),
+        (2, 0, 0, "2024-01-02 00:00:00"),
+    ]
+    assert question_tags == [
+        (1, "2024-01-01 00:00:00"),
+        (2, "2024-01-02 00:00:00"),
+    ]
+    assert question_count == 2
+    assert searchable == [(1,)]
@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from app.models import Question
+
+
+def _spread_created_at(db, questions):
+    base = datetime(2025, 1, 1)
+    for i, question in enumerate(questions):
+        # 일부는 같은 created_at을 공유해 id 타이브레이커도 검증
+        question.created_at = base + timedelta(minutes=i // 2)
+    db.commit()
+
+
+def test_cursor_pagination_walks_every_question_once(client, db, make_questions):
+    questions = make_questions(7)
+    _spread_created_at(db, questions)
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get("/api/v1/questions/", params=params).json()
+        seen.extend(q["id"] for q in body["data"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    expected = [
+        q.id
+        for q in sorted(questions, key=lambda q: (q.created_at, q.id), reverse=True)
+    ]
+    assert seen == expected
+
+
+def test_cursor_is_stable_under_inserts(client, db, author, make_questions):
+    make_questions(4)
+    first = client.get("/api/v1/questions/", params={"limit": 2}).json()
+
+    # 첫 페이지 이후 새 질문이 생겨도 다음 페이지가 밀리지 않아야 함
+    db.add(Question(title="new", content="new", author_id=author.id))
+    db.commit()
+
+    second = client.get(
+        "/api/v1/questions/", params={"limit": 2, "cursor": first["next_cursor"]}
+    ).json()
+    first_ids = [q["id"] for q in first["data"]]
+    second_ids = [q["id"] for q in second["data"]]
+    assert not set(first_ids) & set(second_ids)
+    assert len(first_ids + second_ids) == 4
+
+
+def test_invalid_cursor_is_rejected(client, db):
+    response = client.get("/api/v1/questions/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+    assert response.json()["detail"]["error"] == "INVALID_CURSOR"
+
+
+def test_cursor_query_uses_composite_index(db, make_questions):
+    make_questions(3)
+    plan = db.execute(
+        text(
+            "EXPLAIN QUERY PLAN SELECT id FROM questions "
+            "WHERE (created_at, id) < (:c, :i) ORDER BY created_at DESC, id DESC"
+        ),
+        {"c": "2030-01-01 00:00:00", "i": 1},
+    ).fetchall()
+    detail = " ".join(row[-1] for row in plan)
+    assert "ix_questions_created_at_id" in detail
+    assert "TEMP B-TREE" not in detail
+
+
+def test_summary_view_paginates_with_the_same_cursor(client, make_questions):
+    make_questions(5, answers_per_question=1)
+
+    full = client.get("/api/v1/questions/", params={"limit": 2}).json()
+    summary = client.get(
+        "/api/v1/questions/", params={"limit": 2, "view": "summary"}
+    ).json()
+    assert [q["id"] for q in summary["data"]] == [q["id"] for q in full["data"]]
+    assert summary["next_cursor"] == full["next_cursor"]
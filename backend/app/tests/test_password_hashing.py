@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from app.core.security import (
+    PasswordHasher,
+    PasswordHasherBusy,
+    get_password_hash,
+    password_hash_rounds,
+    password_hasher,
+)
+from app.models import User
+
+
+def test_process_pool_hashes_and_verifies():
+    hasher = PasswordHasher(workers=1, max_pending=4, rounds=4)
+    try:
+        hashed = asyncio.run(hasher.hash("secret"))
+        assert password_hash_rounds(hashed) == 4
+        assert asyncio.run(hasher.verify("secret", hashed)) is True
+        assert asyncio.run(hasher.verify("wrong", hashed)) is False
+    finally:
+        hasher.shutdown()
+
+
+def test_saturated_hasher_fails_fast():
+    hasher = PasswordHasher(workers=0, max_pending=0, rounds=4)
+    with pytest.raises(PasswordHasherBusy):
+        asyncio.run(hasher.hash("secret"))
+
+
+def test_login_returns_503_when_hashing_pool_is_full(client, db, monkeypatch):
+    db.add(
+        User(
+            email="busy@example.com",
+            username="busy",
+            hashed_password=get_password_hash("pw", rounds=4),
+        )
+    )
+    db.commit()
+    monkeypatch.setattr(password_hasher, "max_pending", 0)
+
+    response = client.post(
+        "/api/v1/auth/token", data={"username": "busy", "password": "pw"}
+    )
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert response.json()["detail"]["error"] == "SERVICE_BUSY"
+
+
+def test_login_rehashes_when_cost_changes(client, db, monkeypatch):
+    user = User(
+        email="old@example.com",
+        username="old",
+        hashed_password=get_password_hash("pw", rounds=5),
+    )
+    db.add(user)
+    db.commit()
+    monkeypatch.setattr(password_hasher, "rounds", 4)
+
+    response = client.post(
+        "/api/v1/auth/token", data={"username": "old", "password": "pw"}
+    )
+    assert response.status_code == 200
+
+    db.refresh(user)
+    assert password_hash_rounds(user.hashed_password) == 4
@@ -0,0 +1,66 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc, text
+
+from app.core import metrics
+from app.core.database import get_read_db
+from app.core.pool import (
+    InstrumentedQueuePool,
+    instrument_engine,
+    pool_checkout_wait,
+    pool_sizes,
+    pool_timeouts,
+)
+from app.main import app
+
+
+def test_pool_sizes_split_budget_across_workers():
+    assert pool_sizes(100, 4) == (25, 0)
+    assert pool_sizes(10, 32) == (1, 0)
+    # 명시한 pool_size를 넘는 워커 몫은 overflow로
+    assert pool_sizes(100, 4, pool_size=10) == (10, 15)
+    assert pool_sizes(100, 4, pool_size=10, max_overflow=2) == (10, 2)
+
+
+@pytest.fixture
+def small_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01,
+        pool_logging_name="test-pool",
+    )
+    instrument_engine("test-pool", engine)
+    yield engine
+    engine.dispose()
+
+
+def test_pool_metrics_and_timeout(small_engine):
+    checkouts = pool_checkout_wait.count(pool="test-pool")
+    held = small_engine.connect()
+    held.execute(text("SELECT 1"))
+    with pytest.raises(exc.TimeoutError):
+        small_engine.connect()
+
+    assert pool_checkout_wait.count(pool="test-pool") == checkouts + 2
+    assert pool_timeouts.value(pool="test-pool") >= 1
+    rendered = metrics.registry.render()
+    assert 'semicolon_db_pool_checked_out{pool="test-pool"} 1' in rendered
+    held.close()
+
+
+def test_pool_timeout_returns_503():
+    def exhausted_db():
+        raise exc.TimeoutError("QueuePool limit reached")
+        yield
+
+    app.dependency_overrides[get_read_db] = exhausted_db
+    try:
+        response = TestClient(app).get("/api/v1/questions/1")
+    finally:
+        app.dependency_overrides.pop(get_read_db, None)
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert response.json()["detail"]["error"] == "DATABASE_BUSY"
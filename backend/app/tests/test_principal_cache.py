@@ -0,0 +1,77 @@
+import time
+
+from app.core.cache import LocalSharedStore, MemoryCache, SharedCache
+from app.core.security import create_access_token
+from app.crud import set_user_active, update_user
+from app.models import User
+from app.schemas import UserUpdate
+
+
+def _auth_headers(username):
+    return {"Authorization": f"Bearer {create_access_token({'sub': username})}"}
+
+
+def _user_selects(statements):
+    return [s for s in statements if "FROM users" in s]
+
+
+def test_authenticated_writes_reuse_cached_principal(
+    client, author, make_questions, count_queries
+):
+    question_id = make_questions(1)[0].id
+    headers = _auth_headers("author")
+    payload = {"content": "답변", "question_id": question_id}
+
+    client.post("/api/v1/answers/", json=payload, headers=headers)
+    with count_queries() as counter:
+        response = client.post("/api/v1/answers/", json=payload, headers=headers)
+
+    assert response.status_code == 200
+    # 응답의 author JOIN 외에 사용자 단독 조회가 없어야 함
+    assert not [s for s in _user_selects(counter.statements) if "JOIN" not in s]
+
+
+def test_deactivation_invalidates_cached_principal(client, db, author):
+    headers = _auth_headers("author")
+    assert client.get("/api/v1/users/me", headers=headers).status_code == 200
+
+    set_user_active(db, author.id, False)
+    response = client.get("/api/v1/users/me", headers=headers)
+    assert response.status_code == 400
+
+
+def test_username_change_invalidates_old_subject(client, db, author):
+    headers = _auth_headers("author")
+    assert client.get("/api/v1/users/me", headers=headers).status_code == 200
+
+    update_user(db, author.id, UserUpdate(username="renamed"))
+    assert client.get("/api/v1/users/me", headers=headers).status_code == 401
+
+
+def test_memory_cache_evicts_least_recently_used_and_expired():
+    cache = MemoryCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+    cache.set("short", 1, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("short") is None
+
+
+def test_shared_cache_round_trips_through_local_store():
+    store = LocalSharedStore()
+    first = SharedCache(store, namespace="principal", ttl=60)
+    second = SharedCache(store, namespace="principal", ttl=60)
+
+    first.set("alice", {"id": 1, "username": "alice", "is_active": True})
+    first.set("raw", b"\x00bytes")
+    assert second.get("alice") == {"id": 1, "username": "alice", "is_active": True}
+    assert second.get("raw") == b"\x00bytes"
+
+    second.delete("alice")
+    assert first.get("alice") is None
+    first.clear()
+    assert second.get("raw") is None
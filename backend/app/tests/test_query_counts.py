@@ -0,0 +1,48 @@
+def _list_query_count(client, count_queries):
+    with count_queries() as counter:
+        response = client.get("/api/v1/questions/", params={"limit": 100})
+    assert response.status_code == 200
+    return counter.count, len(response.json()["data"])
+
+
+def test_question_list_query_count_does_not_grow_with_page_size(
+    client, make_questions, count_queries
+):
+    make_questions(3, answers_per_question=2)
+    small_count, small_size = _list_query_count(client, count_queries)
+
+    make_questions(20, answers_per_question=3)
+    large_count, large_size = _list_query_count(client, count_queries)
+
+    assert (small_size, large_size) == (3, 23)
+    assert large_count == small_count
+    # 질문(+작성자) 1번, 답변(+작성자) 1번, 태그(+이름) 1번
+    assert large_count <= 3
+
+
+def test_question_detail_query_count_does_not_grow_with_answers(
+    client, make_questions, count_queries
+):
+    few = make_questions(2, answers_per_question=1)[0].id
+    many = make_questions(1, answers_per_question=15)[0].id
+
+    counts = []
+    for question_id in (few, many):
+        with count_queries() as counter:
+            response = client.get(f"/api/v1/questions/{question_id}")
+        assert response.status_code == 200
+        counts.append(counter.count)
+
+    assert counts[0] == counts[1]
+
+
+def test_answer_list_query_count_does_not_grow_with_answers(
+    client, make_questions, count_queries
+):
+    question_id = make_questions(1, answers_per_question=12)[0].id
+
+    with count_queries() as counter:
+        response = client.get(f"/api/v1/questions/{question_id}/answers")
+    assert len(response.json()["data"]) == 12
+    # ETag 검증자(존재 확인 + 답변 버전) 2번 + 답변(작성자 JOIN) 1번
+    assert counter.count == 3
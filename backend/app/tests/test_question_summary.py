@@ -0,0 +1,50 @@
+from app.crud import EXCERPT_LENGTH
+from app.models import QuestionTag, Tag
+
+
+def test_summary_view_returns_projection_only(client, db, make_questions):
+    question = make_questions(1, answers_per_question=3)[0]
+    question.content = "가" * (EXCERPT_LENGTH + 50)
+    tag = Tag(name="python")
+    db.add(tag)
+    db.flush()
+    db.add(
+        QuestionTag(
+            question_id=question.id,
+            tag_id=tag.id,
+            question_created_at=question.created_at,
+        )
+    )
+    db.commit()
+
+    response = client.get("/api/v1/questions/", params={"view": "summary"})
+    assert response.status_code == 200
+    item = response.json()["data"][0]
+
+    assert set(item) == {
+        "id",
+        "title",
+        "excerpt",
+        "author_username",
+        "created_at",
+        "views",
+        "is_solved",
+        "answer_count",
+        "has_accepted_answer",
+        "last_activity_at",
+        "tags",
+    }
+    assert item["excerpt"] == "가" * EXCERPT_LENGTH
+    assert item["author_username"] == "author"
+    assert item["answer_count"] == 3
+    assert item["tags"] == ["python"]
+
+
+def test_summary_view_query_count_is_constant(client, make_questions, count_queries):
+    make_questions(30, answers_per_question=4)
+
+    with count_queries() as counter:
+        response = client.get("/api/v1/questions/", params={"view": "summary"})
+    assert len(response.json()["data"]) == 30
+    # 요약 SELECT 1번 + 태그 IN 쿼리 1번
+    assert counter.count == 2
@@ -0,0 +1,114 @@
+import asyncio
+
+import httpx
+from fastapi.testclient import TestClient
+
+from app.core import rate_limit
+from app.core.rate_limit import MemoryBucketStore, RateLimitMiddleware
+from app.core.security import create_access_token
+from app.main import app
+
+
+def limited(**overrides):
+    options = dict(
+        store=MemoryBucketStore(),
+        ip_rate=1.0,
+        ip_burst=3,
+        user_rate=1.0,
+        user_burst=5,
+        auth_rate=1 / 60,
+        auth_burst=2,
+        auth_paths=("/api/v1/auth/token", "/api/v1/auth/register"),
+    )
+    options.update(overrides)
+    return TestClient(RateLimitMiddleware(app, **options))
+
+
+def test_bucket_refills_over_time(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    store = MemoryBucketStore()
+
+    waits = [asyncio.run(store.take("k", rate=2.0, burst=2)) for _ in range(3)]
+    assert waits == [0.0, 0.0, 0.5]
+    now[0] += 0.5
+    assert asyncio.run(store.take("k", rate=2.0, burst=2)) == 0.0
+
+
+def test_ip_limit_returns_429_with_retry_after(client):
+    limited_client = limited()
+
+    statuses = [limited_client.get("/api/v1/questions/").status_code for _ in range(4)]
+    response = limited_client.get("/api/v1/questions/")
+
+    assert statuses == [200, 200, 200, 429]
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+    assert response.json()["detail"]["error"] == "RATE_LIMITED"
+    # 헬스 체크는 제한하지 않음
+    assert limited_client.get("/health").status_code == 200
+
+
+def test_auth_routes_use_stricter_bucket(client):
+    limited_client = limited(ip_burst=100)
+    form = {"username": "nobody", "password": "wrong"}
+
+    statuses = [
+        limited_client.post("/api/v1/auth/token", data=form).status_code
+        for _ in range(3)
+    ]
+    response = limited_client.post("/api/v1/auth/token", data=form)
+
+    assert statuses == [401, 401, 429]
+    assert int(response.headers["Retry-After"]) == 60
+    assert limited_client.get("/api/v1/questions/").status_code == 200
+
+
+def test_authenticated_users_get_their_own_bucket(client):
+    limited_client = limited()
+    for _ in range(3):
+        limited_client.get("/api/v1/questions/")
+    assert limited_client.get("/api/v1/questions/").status_code == 429
+
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'alice'})}"}
+    statuses = [
+        limited_client.get("/api/v1/questions/", headers=headers).status_code
+        for _ in range(6)
+    ]
+    assert statuses == [200] * 5 + [429]
+
+
+def test_in_flight_cap_sheds_with_503():
+    release = asyncio.Event()
+
+    async def slow_app(scope, receive, send):
+        await release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    middleware = RateLimitMiddleware(
+        slow_app,
+        store=MemoryBucketStore(),
+        ip_rate=0,
+        ip_burst=0,
+        user_rate=0,
+        user_burst=0,
+        auth_rate=0,
+        auth_burst=0,
+        max_in_flight=1,
+    )
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=middleware)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            first = asyncio.create_task(c.get("/slow"))
+            await asyncio.sleep(0.05)
+            shed = await c.get("/slow")
+            release.set()
+            return (await first), shed
+
+    first, shed = asyncio.run(scenario())
+    assert first.status_code == 200
+    assert shed.status_code == 503
+    assert shed.headers["Retry-After"] == "1"
+    assert shed.json()["detail"]["error"] == "SERVICE_BUSY"
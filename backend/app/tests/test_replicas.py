@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import database
+from app.core.database import Base
+from app.core.principals import principal_cache
+from app.core.replicas import Replica, ReplicaRouter, recent_writers
+from app.core.response_cache import response_cache
+from app.core.security import create_access_token
+from app.main import app
+from app.models import Question, User
+
+
+def _database(path):
+    engine = create_engine(
+        f"sqlite:///{path}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    # 복제가 끝난 상태: 두 DB에 같은 사용자/질문
+    with factory() as db:
+        db.add(
+            User(id=1, email="a@example.com", username="author", hashed_password="x")
+        )
+        db.add(Question(id=1, title="복제된 질문", content="c", author_id=1))
+        db.commit()
+    return engine, factory
+
+
+def _router(*replicas):
+    return ReplicaRouter(list(replicas), interval=60)
+
+
+@pytest.fixture
+def primary_and_replica(tmp_path, monkeypatch):
+    primary_engine, primary = _database(tmp_path / "primary.db")
+    replica_engine, replica_sessions = _database(tmp_path / "replica.db")
+    replica = Replica("replica-0", replica_engine, replica_sessions)
+    monkeypatch.setattr(database, "SessionLocal", primary)
+    monkeypatch.setattr(database, "replicas", _router(replica))
+    yield replica
+    response_cache.clear()
+    principal_cache.clear()
+    recent_writers.clear()
+    primary_engine.dispose()
+    replica_engine.dispose()
+
+
+def _titles(client, limit, headers=None):
+    response = client.get(
+        "/api/v1/questions/", params={"limit": limit}, headers=headers
+    )
+    assert response.status_code == 200
+    return [question["title"] for question in response.json()["data"]]
+
+
+def test_reads_use_replica_until_writer_reads_back(primary_and_replica):
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'author'})}"}
+    assert _titles(client, 10) == ["복제된 질문"]
+
+    # 쓰기는 primary로 - 복제본에는 아직 반영되지 않은 상태
+    response = client.post(
+        "/api/v1/questions/", json={"title": "새 질문", "content": "c"}, headers=headers
+    )
+    assert response.status_code == 200
+
+    # 쓴 사용자는 primary에서 읽고, 다른 사용자는 계속 복제본에서 읽음
+    assert _titles(client, 20, headers) == ["새 질문", "복제된 질문"]
+    assert _titles(client, 30) == ["복제된 질문"]
+
+    # 복제본이 빠지면 모든 읽기가 primary로
+    primary_and_replica.mark(False)
+    assert _titles(client, 40) == ["새 질문", "복제된 질문"]
+
+
+def test_writer_skips_cache_refilled_from_lagging_replica(primary_and_replica):
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'author'})}"}
+
+    response = client.put(
+        "/api/v1/questions/1", json={"title": "수정한 질문"}, headers=headers
+    )
+    assert response.status_code == 200
+    # 다른 사용자가 아직 복제되지 않은 복제본에서 읽어 캐시를 다시 채움
+    anonymous = client.get("/api/v1/questions/1").json()["data"]["title"]
+    writer = client.get("/api/v1/questions/1", headers=headers).json()["data"]["title"]
+
+    assert anonymous == "복제된 질문"
+    assert writer == "수정한 질문"
+
+
+def test_round_robin_skips_unhealthy_replicas(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'r.db'}")
+    first = Replica("replica-0", engine, None)
+    second = Replica("replica-1", engine, None)
+    router = _router(first, second)
+    assert {router.pick().name for _ in range(4)} == {"replica-0", "replica-1"}
+
+    first.mark(False)
+    assert {router.pick().name for _ in range(4)} == {"replica-1"}
+    second.mark(False)
+    assert router.pick() is None
+
+    # 헬스 체크가 통과하면 다시 포함
+    assert asyncio.run(router.check()) == 2
+    assert first.healthy and second.healthy
+
+
+def test_health_check_marks_unreachable_replica_down(tmp_path):
+    missing = create_engine(f"sqlite:///{tmp_path / 'missing' / 'r.db'}")
+    replica = Replica("replica-0", missing, None)
+    assert asyncio.run(_router(replica).check()) == 0
+    assert not replica.healthy
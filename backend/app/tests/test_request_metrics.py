@@ -0,0 +1,80 @@
+from app.core.metrics import Histogram
+from app.core.request_metrics import (
+    request_duration,
+    request_statements,
+    requests_in_flight,
+    response_size,
+)
+from app.core.security import password_hash_seconds
+
+DETAIL_ROUTE = "/api/v1/questions/{question_id}"
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("test_latency_seconds", "test", ("route",), (0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, route="/a")
+
+    lines = histogram.render()
+    assert 'test_latency_seconds_bucket{route="/a",le="0.1"} 2' in lines
+    assert 'test_latency_seconds_bucket{route="/a",le="1.0"} 3' in lines
+    assert 'test_latency_seconds_bucket{route="/a",le="+Inf"} 4' in lines
+    assert 'test_latency_seconds_count{route="/a"} 4' in lines
+    assert histogram.sum(route="/a") == 3.65
+
+
+def test_request_metrics_use_route_template_and_count_sql(client, make_questions):
+    question_id = make_questions(1, answers_per_question=2)[0].id
+    before = request_duration.count(method="GET", route=DETAIL_ROUTE, status="200")
+    statements_before = request_statements.sum(route=DETAIL_ROUTE)
+
+    response = client.get(f"/api/v1/questions/{question_id}")
+    assert response.status_code == 200
+
+    assert (
+        request_duration.count(method="GET", route=DETAIL_ROUTE, status="200")
+        == before + 1
+    )
+    # 응답 캐시가 비어 있으므로 질문/답변 조회 SQL이 실행됨
+    assert request_statements.sum(route=DETAIL_ROUTE) > statements_before
+    assert response_size.sum(method="GET", route=DETAIL_ROUTE) >= len(response.content)
+    assert requests_in_flight.value() == 0
+
+
+def test_router_roots_keep_their_prefix(client):
+    # 라우터마다 "/"인 라우트가 한 라벨로 합쳐지지 않아야 함
+    routes = ("/api/v1/questions/", "/api/v1/tags/")
+    before = [
+        request_duration.count(method="GET", route=r, status="200") for r in routes
+    ]
+    for route in routes:
+        client.get(route)
+    after = [
+        request_duration.count(method="GET", route=r, status="200") for r in routes
+    ]
+    assert after == [count + 1 for count in before]
+
+
+def test_unmatched_paths_share_one_series(client):
+    before = request_duration.count(method="GET", route="unmatched", status="404")
+    client.get("/no/such/path/1")
+    client.get("/no/such/path/2")
+    assert (
+        request_duration.count(method="GET", route="unmatched", status="404")
+        == before + 2
+    )
+
+
+def test_metrics_endpoint_exports_request_and_bcrypt_metrics(client):
+    before = password_hash_seconds.count(operation="hash")
+    client.post(
+        "/api/v1/auth/register",
+        json={"email": "m@example.com", "username": "metrics", "password": "pw123456"},
+    )
+    assert password_hash_seconds.count(operation="hash") == before + 1
+
+    text = client.get("/metrics").text
+    assert "# TYPE semicolon_http_request_duration_seconds histogram" in text
+    assert "# TYPE semicolon_db_statements_per_request histogram" in text
+    assert "semicolon_http_requests_in_flight 1" in text
+    assert 'semicolon_password_hash_seconds_count{operation="hash"}' in text
@@ -0,0 +1,205 @@
+import asyncio
+import threading
+
+from conftest import TestingSessionLocal
+
+from app.core.cache import MemoryCache, SharedCache, create_cache
+from app.core.events import EventBroker
+from app.core.response_cache import ResponseCache, response_cache_requests
+from app.core.view_counter import ViewCounter
+from app.crud import create_answer, delete_answer, get_question, update_question
+from app.schemas import AnswerCreate, QuestionUpdate
+
+
+def test_repeated_detail_is_served_from_cache(client, make_questions, count_queries):
+    question_id = make_questions(1, answers_per_question=3)[0].id
+    url = f"/api/v1/questions/{question_id}"
+    first = client.get(url)
+    hits = response_cache_requests.value(result="hit")
+
+    with count_queries() as counter:
+        second = client.get(url)
+        revalidated = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+
+    assert counter.count == 0
+    assert second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+    assert revalidated.status_code == 304
+    assert response_cache_requests.value(result="hit") == hits + 2
+
+
+def test_answer_writes_invalidate_detail_answers_and_lists(
+    client, db, author, make_questions
+):
+    question_id = make_questions(1)[0].id
+    urls = [
+        f"/api/v1/questions/{question_id}",
+        f"/api/v1/questions/{question_id}/answers",
+        "/api/v1/questions/?view=summary",
+    ]
+    for url in urls:
+        client.get(url)
+
+    answer = create_answer(
+        db, AnswerCreate(content="새 답변", question_id=question_id), author.id
+    )
+    detail, answers, summaries = (client.get(url).json()["data"] for url in urls)
+    assert len(detail["answers"]) == 1
+    assert len(answers) == 1
+    assert summaries[0]["answer_count"] == 1
+
+    delete_answer(db, answer.id)
+    assert client.get(urls[1]).json()["data"] == []
+
+
+def test_question_update_invalidates(client, db, make_questions):
+    question_id = make_questions(1)[0].id
+    client.get("/api/v1/questions/")
+    client.get(f"/api/v1/questions/{question_id}")
+
+    update_question(db, question_id, QuestionUpdate(title="바뀐 제목"))
+    assert client.get("/api/v1/questions/").json()["data"][0]["title"] == "바뀐 제목"
+
+
+def test_write_during_cache_fill_is_not_served(client, db, make_questions, monkeypatch):
+    question_id = make_questions(1)[0].id
+    url = f"/api/v1/questions/{question_id}"
+
+    def read_then_update(session, **kwargs):
+        question = get_question(session, **kwargs)
+        # 읽은 직후(캐시 저장 전)에 다른 요청이 질문을 수정
+        update_question(db, question_id, QuestionUpdate(title="바뀐 제목"))
+        return question
+
+    monkeypatch.setattr("app.api.questions.get_question", read_then_update)
+    stale = client.get(url)
+    monkeypatch.undo()
+
+    fresh = client.get(url)
+    assert fresh.json()["data"]["title"] == "바뀐 제목"
+    assert fresh.headers["etag"] != stale.headers["etag"]
+
+
+def test_view_flush_keeps_cached_responses(client, make_questions):
+    question_id = make_questions(1)[0].id
+    urls = ("/api/v1/questions/", f"/api/v1/questions/{question_id}")
+    etags = [client.get(url).headers.get("ETag") for url in urls]
+
+    counter = ViewCounter(interval=60, session_factory=TestingSessionLocal)
+    counter.record(question_id, n=7)
+    counter.flush()
+    # 조회수만 바뀐 경우 캐시된 응답을 TTL 동안 그대로 사용
+    assert [client.get(url).headers.get("ETag") for url in urls] == etags
+    assert client.get(urls[1]).json()["data"]["views"] == 0
+
+
+def test_memory_backend_is_bounded_by_bytes():
+    cache = MemoryCache(maxsize=100, maxbytes=10)
+    cache.set("a", b"12345")
+    cache.set("b", b"12345")
+    cache.set("c", b"123")
+    assert cache.get("a") is None
+    assert cache.nbytes == 8
+    # 한도보다 큰 값은 저장하지 않음
+    cache.set("d", b"x" * 11)
+    assert cache.get("d") is None
+    assert cache.nbytes == 8
+
+
+def test_shared_backend_round_trip_and_list_generation():
+    cache = ResponseCache(create_cache("local", namespace="test-response", maxsize=10))
+    cache.clear()
+    list_key = cache.list_key(skip=0, limit=10)
+    cache.set(list_key, b'{"data":[]}')
+    cache.set(cache.question_key(1), b"{}", {"ETag": '"v1"'})
+
+    entry = cache.get(cache.question_key(1))
+    assert entry.body == b"{}"
+    assert entry.headers == {"ETag": '"v1"'}
+    assert cache.get(list_key).body == b'{"data":[]}'
+
+    cache.invalidate_question(1)
+    assert cache.get(cache.question_key(1)) is None
+    assert cache.list_key(skip=0, limit=10) != list_key
+
+
+class ThreadRecordingCache(SharedCache):
+    def __init__(self, backend):
+        super().__init__(backend.client, namespace=backend.namespace)
+        self.threads = set()
+
+    def get(self, key):
+        self.threads.add(threading.get_ident())
+        return super().get(key)
+
+    def set(self, key, value, ttl=None):
+        self.threads.add(threading.get_ident())
+        super().set(key, value, ttl=ttl)
+
+
+def test_shared_backend_calls_run_off_the_event_loop():
+    backend = ThreadRecordingCache(
+        create_cache("local", namespace="test-loop", maxsize=10)
+    )
+    cache = ResponseCache(backend)
+
+    async def scenario():
+        key, cached = await cache.lookup(cache.question_key, 1)
+        await cache.store(key, b"{}")
+        return cached, await cache.lookup(cache.list_key, skip=0, limit=10)
+
+    cached, (list_key, _) = asyncio.run(scenario())
+    # 이벤트 루프(이 스레드)에서는 저장소를 호출하지 않음
+    assert backend.threads and threading.get_ident() not in backend.threads
+    assert cached is None
+    assert list_key.startswith("questions:")
+    assert cache.get(cache.question_key(1)).body == b"{}"
+
+
+class FanoutBroker(EventBroker):
+    """redis pub/sub 대역 - 구독한 모든 워커(자기 포함)에 전달"""
+
+    def __init__(self):
+        self.listeners = []
+
+    def publish(self, message):
+        for deliver in self.listeners:
+            deliver(message)
+
+    async def listen(self, deliver):
+        self.listeners.append(deliver)
+        await asyncio.Event().wait()
+
+
+def test_invalidation_reaches_other_workers():
+    broker = FanoutBroker()
+    workers = [ResponseCache(MemoryCache(maxsize=10), broker=broker) for _ in range(2)]
+
+    async def scenario():
+        for worker in workers:
+            await worker.start()
+        list_keys = []
+        for worker in workers:
+            worker.set(worker.question_key(1), b"{}")
+            worker.set(worker.answers_key(1), b"[]")
+            list_keys.append(worker.list_key(skip=0, limit=10))
+
+        workers[0].invalidate_question(1)
+        after_invalidate = [
+            (
+                worker.get(worker.question_key(1)),
+                worker.get(worker.answers_key(1)),
+                worker.list_key(skip=0, limit=10) != list_key,
+            )
+            for worker, list_key in zip(workers, list_keys)
+        ]
+        workers[1].set(workers[1].question_key(2), b"{}")
+        workers[0].clear()
+        after_clear = workers[1].get(workers[1].question_key(2))
+        for worker in workers:
+            await worker.stop()
+        return after_invalidate, after_clear
+
+    after_invalidate, after_clear = asyncio.run(scenario())
+    assert after_invalidate == [(None, None, True), (None, None, True)]
+    assert after_clear is None
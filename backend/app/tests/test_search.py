@@ -0,0 +1,88 @@
+from sqlalchemy import text
+
+from app.crud import create_answer, create_question, delete_answer, update_question
+from app.crud.search import rebuild_index
+from app.schemas import AnswerCreate, QuestionCreate, QuestionUpdate
+
+
+def _search(client, q):
+    response = client.get("/api/v1/search", params={"q": q})
+    assert response.status_code == 200
+    return [item["id"] for item in response.json()["data"]]
+
+
+def test_search_ranks_title_matches_above_content_and_answers(client, db, author):
+    in_answer = create_question(
+        db, QuestionCreate(title="배포 질문", content="서버 설정"), author.id
+    )
+    create_answer(
+        db, AnswerCreate(content="fastapi 문서를 보세요", question_id=in_answer.id), author.id
+    )
+    in_content = create_question(
+        db, QuestionCreate(title="라우팅", content="fastapi 라우터 질문"), author.id
+    )
+    in_title = create_question(
+        db, QuestionCreate(title="fastapi 의존성", content="질문입니다"), author.id
+    )
+
+    assert _search(client, "fastapi") == [in_title.id, in_content.id, in_answer.id]
+
+
+def test_search_index_follows_updates_and_deletes(client, db, author):
+    question = create_question(
+        db, QuestionCreate(title="처음 제목", content="본문"), author.id
+    )
+    answer = create_answer(
+        db, AnswerCreate(content="sqlalchemy", question_id=question.id), author.id
+    )
+    assert _search(client, "sqlalchemy") == [question.id]
+
+    update_question(db, question.id, QuestionUpdate(title="바뀐 제목"))
+    assert _search(client, "바뀐") == [question.id]
+    assert _search(client, "처음") == []
+
+    delete_answer(db, answer.id)
+    assert _search(client, "sqlalchemy") == []
+
+
+def test_search_matches_prefixes_and_tolerates_query_syntax(client, db, author):
+    question = create_question(
+        db, QuestionCreate(title="파이썬에서 비동기", content="asyncio"), author.id
+    )
+    assert _search(client, "파이썬") == [question.id]
+    assert _search(client, 'async" OR (') == []
+    assert client.get("/api/v1/search", params={"q": ""}).status_code == 422
+
+
+def test_search_reads_the_index_not_the_questions_table(db, author):
+    create_question(db, QuestionCreate(title="t", content="c"), author.id)
+    plan = db.execute(
+        text(
+            "EXPLAIN QUERY PLAN SELECT rowid FROM questions_fts "
+            "WHERE questions_fts MATCH '\"t\"*'"
+        )
+    ).fetchall()
+    detail = " ".join(row[-1] for row in plan)
+    assert "VIRTUAL TABLE INDEX" in detail
+    assert "questions " not in detail
+
+
+def test_rebuild_index_restores_missing_documents(client, db, author):
+    question = create_question(
+        db, QuestionCreate(title="복구 대상", content="본문"), author.id
+    )
+    db.execute(text("DELETE FROM questions_fts"))
+    db.commit()
+    assert _search(client, "복구") == []
+
+    rebuild_index(db)
+    assert _search(client, "복구") == [question.id]
+
+
+def test_search_on_unsupported_database_returns_501(client, monkeypatch):
+    monkeypatch.setattr("app.crud.search._dialect", lambda db: "mysql")
+
+    response = client.get("/api/v1/search", params={"q": "fastapi"})
+
+    assert response.status_code == 501
+    assert response.json()["detail"]["error"] == "SEARCH_NOT_SUPPORTED"
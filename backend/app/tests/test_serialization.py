@@ -0,0 +1,23 @@
+import json
+
+from app.models import User as UserModel
+from app.schemas import User, render_success
+
+
+def test_stored_email_is_not_revalidated_on_output(client, db):
+    # 검증 규칙이 바뀌기 전에 저장된 주소도 응답 직렬화에서 500이 나지 않아야 함
+    user = UserModel(email="admin@localhost", username="admin", hashed_password="x")
+    db.add(user)
+    db.commit()
+
+    response = client.get(f"/api/v1/users/{user.id}")
+    assert response.status_code == 200
+    assert response.json()["data"]["email"] == "admin@localhost"
+
+
+def test_render_success_matches_response_model_output(client, author):
+    from_route = client.get(f"/api/v1/users/{author.id}").json()
+    rendered = json.loads(
+        render_success(User, author, message="사용자 정보를 불러왔습니다.")
+    )
+    assert rendered == from_route
@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.crud import SORT_KEYS, _sorted_page, _summary_select, create_answer
+from app.models import Question
+from app.schemas import AnswerCreate
+
+SORT_INDEXES = {
+    "newest": "ix_questions_created_at_id",
+    "views": "ix_questions_views_id",
+    "unanswered": "ix_questions_unanswered_created_at_id",
+    "active": "ix_questions_last_activity_at_id",
+}
+
+
+@pytest.fixture
+def sorted_questions(db, author, make_questions):
+    questions = make_questions(7)
+    base = datetime(2025, 1, 1)
+    for i, question in enumerate(questions):
+        question.created_at = base + timedelta(minutes=i)
+        question.last_activity_at = base + timedelta(minutes=i)
+        # 같은 조회수를 섞어 id 타이브레이커도 검증
+        question.views = (i * 3) % 4
+    db.commit()
+    # 오래된 질문에 답변이 달리면 active 순서 맨 앞으로
+    create_answer(
+        db, AnswerCreate(content="답변", question_id=questions[1].id), author.id
+    )
+    db.expire_all()
+    return db.query(Question).all()
+
+
+def _walk(client, sort, view):
+    seen, cursor = [], None
+    while True:
+        params = {"sort": sort, "view": view, "limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/questions/", params=params)
+        assert response.status_code == 200
+        body = response.json()
+        seen += [item["id"] for item in body["data"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return seen
+
+
+@pytest.mark.parametrize("sort", list(SORT_KEYS))
+@pytest.mark.parametrize("view", ["full", "summary"])
+def test_sort_modes_walk_with_cursor(client, sorted_questions, sort, view):
+    rows = sorted_questions
+    if sort == "unanswered":
+        rows = [q for q in rows if q.answer_count == 0]
+    key = SORT_KEYS[sort][0]
+    expected = [
+        q.id for q in sorted(rows, key=lambda q: (getattr(q, key), q.id), reverse=True)
+    ]
+    assert _walk(client, sort, view) == expected
+
+
+def test_cursor_from_another_sort_is_rejected(client, sorted_questions):
+    body = client.get("/api/v1/questions/", params={"sort": "views", "limit": 2}).json()
+    response = client.get(
+        "/api/v1/questions/",
+        params={"sort": "newest", "cursor": body["next_cursor"]},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("sort", list(SORT_KEYS))
+@pytest.mark.parametrize("with_cursor", [False, True])
+def test_sort_modes_are_index_range_scans(db, sort, with_cursor):
+    value = 0 if SORT_KEYS[sort][1] is int else datetime(2025, 1, 1)
+    cursor = (value, 10) if with_cursor else None
+    stmt = _sorted_page(_summary_select(), sort, 0, 20, cursor)
+    compiled = stmt.compile(dialect=db.get_bind().dialect)
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+
+    plan = " ".join(
+        row[-1]
+        for row in db.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {compiled}", params
+        )
+    )
+    assert SORT_INDEXES[sort] in plan
+    assert "TEMP B-TREE" not in plan
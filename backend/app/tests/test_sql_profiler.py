@@ -0,0 +1,65 @@
+import logging
+
+from fastapi.testclient import TestClient
+
+from app import crud
+from app.core.sql_profiler import SqlProfilingMiddleware, sql_profile, statement_shape
+from app.main import app
+from app.models import Question
+
+
+def test_statement_shape_ignores_in_list_length_and_whitespace():
+    assert statement_shape("SELECT * FROM t WHERE id IN (?, ?, ?)") == statement_shape(
+        "SELECT *\n  FROM t WHERE id IN (?)"
+    )
+
+
+def test_profile_records_crud_caller_and_lazy_loads(db, make_questions):
+    make_questions(4, answers_per_question=1)
+    db.expunge_all()
+
+    with sql_profile() as profile:
+        questions = crud.get_questions(db, limit=10)
+        for question in db.query(Question).all():
+            question.author.username
+
+    callers = {record.caller for record in profile.statements}
+    assert "crud.get_questions" in callers
+    assert any(caller.endswith("(lazy load)") for caller in callers)
+    assert len(questions) == 4
+
+
+def test_profile_flags_repeated_statements(db, make_questions):
+    question_ids = [question.id for question in make_questions(6)]
+
+    with sql_profile() as profile:
+        for question_id in question_ids:
+            crud.get_question(db, question_id)
+
+    [(shape, count, caller)] = profile.repeated(threshold=5)
+    assert count == 6
+    assert caller == "crud.get_question"
+    assert "FROM questions" in shape
+    assert profile.repeated(threshold=6) == []
+
+
+def test_middleware_logs_slow_requests_and_sets_server_timing(
+    client, make_questions, caplog
+):
+    question_id = make_questions(1, answers_per_question=2)[0].id
+    profiled = TestClient(
+        SqlProfilingMiddleware(
+            app, slow_request_ms=0, n_plus_one_threshold=10, server_timing=True
+        )
+    )
+
+    with caplog.at_level(logging.WARNING, logger="app.core.sql_profiler"):
+        response = profiled.get(f"/api/v1/questions/{question_id}")
+
+    assert response.status_code == 200
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert "queries" in response.headers["server-timing"]
+    [record] = [r for r in caplog.records if "느린 요청" in r.getMessage()]
+    message = record.getMessage()
+    assert "GET /api/v1/questions/{question_id}" in message
+    assert "crud." in message
@@ -0,0 +1,112 @@
+from conftest import TestingSessionLocal
+from sqlalchemy import text
+
+from app import crud
+from app.core.security import create_access_token
+from app.crud import create_question, repair_tag_counts, update_question
+from app.models import Tag
+from app.schemas import QuestionCreate, QuestionUpdate
+
+
+def _tag_counts(client):
+    response = client.get("/api/v1/tags/")
+    assert response.status_code == 200
+    return {tag["name"]: tag["question_count"] for tag in response.json()["data"]}
+
+
+def test_create_and_update_question_tags(client, db, author):
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'author'})}"}
+    payload = {"title": "t", "content": "c", "tags": ["Python", " fastapi ", "python"]}
+    response = client.post("/api/v1/questions/", json=payload, headers=headers)
+    assert response.status_code == 200
+    question = response.json()["data"]
+    assert question["tags"] == ["fastapi", "python"]
+    assert _tag_counts(client) == {"fastapi": 1, "python": 1}
+
+    etag = client.get(f"/api/v1/questions/{question['id']}").headers["etag"]
+    response = client.put(
+        f"/api/v1/questions/{question['id']}",
+        json={"tags": ["python", "sqlalchemy"]},
+        headers=headers,
+    )
+    assert response.json()["data"]["tags"] == ["python", "sqlalchemy"]
+    assert _tag_counts(client) == {"python": 1, "sqlalchemy": 1, "fastapi": 0}
+    detail = client.get(
+        f"/api/v1/questions/{question['id']}", headers={"If-None-Match": etag}
+    )
+    assert detail.status_code == 200
+
+
+def test_tag_filter_with_cursor_pagination(client, db, author):
+    tagged = [
+        create_question(
+            db, QuestionCreate(title=f"q{i}", content="c", tags=["python"]), author.id
+        ).id
+        for i in range(5)
+    ]
+    create_question(db, QuestionCreate(title="other", content="c"), author.id)
+
+    for view in ("full", "summary"):
+        seen, cursor = [], None
+        while True:
+            params = {"tag": "Python", "limit": 2, "view": view}
+            if cursor:
+                params["cursor"] = cursor
+            body = client.get("/api/v1/questions/", params=params).json()
+            seen += [item["id"] for item in body["data"]]
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+        assert seen == tagged[::-1]
+
+    response = client.get("/api/v1/questions/", params={"tag": "missing"})
+    assert response.json()["data"] == []
+
+
+def test_tag_listing_reads_tag_index_in_order(db):
+    plan = " ".join(
+        row[-1]
+        for row in db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT questions.id FROM questions "
+                "JOIN question_tags ON question_tags.question_id = questions.id "
+                "WHERE question_tags.tag_id = 1 "
+                "ORDER BY question_tags.question_created_at DESC, "
+                "question_tags.question_id DESC LIMIT 20"
+            )
+        )
+    )
+    assert "ix_question_tags_tag_id_created_at" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_repair_tag_counts(db, author):
+    question = create_question(
+        db, QuestionCreate(title="t", content="c", tags=["a", "b"]), author.id
+    )
+    update_question(db, question.id, QuestionUpdate(tags=["a"]))
+    db.query(Tag).filter(Tag.name == "a").update({"question_count": 9})
+    db.commit()
+
+    assert repair_tag_counts(db) == 1
+    db.expire_all()
+    counts = {tag.name: tag.question_count for tag in db.query(Tag)}
+    assert counts == {"a": 1, "b": 0}
+
+
+def test_concurrently_created_tag_is_reused(db, author, monkeypatch):
+    question = create_question(db, QuestionCreate(title="t", content="c"), author.id)
+    insert_tags = crud._insert_tags
+
+    def racing_insert(session, names):
+        # 태그가 없다고 읽은 직후 다른 요청이 같은 태그를 먼저 만들어 커밋
+        with TestingSessionLocal() as other:
+            other.add(Tag(name="race"))
+            other.commit()
+        insert_tags(session, names)
+
+    monkeypatch.setattr(crud, "_insert_tags", racing_insert)
+    update_question(db, question.id, QuestionUpdate(tags=["race"]))
+
+    tags = db.query(Tag).filter(Tag.name == "race").all()
+    assert [(tag.name, tag.question_count) for tag in tags] == [("race", 1)]
@@ -0,0 +1,39 @@
+from datetime import timedelta
+
+from app.core.security import (
+    create_access_token,
+    decode_access_token,
+    token_cache,
+    token_cache_requests,
+)
+
+
+def test_verified_token_is_served_from_cache():
+    token = create_access_token({"sub": "alice"}, expires_delta=timedelta(minutes=5))
+    hits = token_cache_requests.value(result="hit")
+    misses = token_cache_requests.value(result="miss")
+
+    assert decode_access_token(token) == "alice"
+    assert decode_access_token(token) == "alice"
+
+    assert token_cache_requests.value(result="miss") == misses + 1
+    assert token_cache_requests.value(result="hit") == hits + 1
+
+
+def test_invalid_and_expired_tokens_are_not_cached():
+    expired = create_access_token({"sub": "bob"}, expires_delta=timedelta(seconds=-1))
+    size = len(token_cache)
+
+    assert decode_access_token(expired) is None
+    assert decode_access_token("not.a.jwt") is None
+    assert len(token_cache) == size
+
+
+def test_metrics_endpoint_exports_token_cache_counters(client):
+    decode_access_token(create_access_token({"sub": "carol"}))
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'semicolon_token_cache_requests_total{result="miss"}' in response.text
+    assert "# TYPE semicolon_token_cache_entries gauge" in response.text
@@ -0,0 +1,38 @@
+import pytest
+from sqlalchemy import select
+
+from app.core.database import Base
+from app.crud import create_answer, create_question
+from app.crud.search import search_question_ids
+from app.crud.transfer import export_all, import_all, tables
+from app.models import User
+from app.schemas import AnswerCreate, QuestionCreate
+
+
+def _snapshot(db):
+    return {table.name: db.execute(select(table)).all() for table in tables()}
+
+
+@pytest.mark.parametrize("fmt", ["ndjson", "csv"])
+def test_export_import_round_trip(db, author, tmp_path, fmt):
+    db.add(User(email="n@example.com", username="n", hashed_password="x"))
+    question_id = create_question(
+        db,
+        QuestionCreate(title='쉼표, "따옴표"', content="줄\n바꿈", tags=["python"]),
+        author.id,
+    ).id
+    create_answer(db, AnswerCreate(content="", question_id=question_id), author.id)
+    before = _snapshot(db)
+
+    counts = export_all(db, tmp_path, fmt, batch_size=2)
+    assert counts["users"] == 2 and counts["answers"] == 1
+
+    engine = db.get_bind()
+    db.close()
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    assert import_all(db, tmp_path, fmt, batch_size=2) == counts
+
+    # NULL(full_name)과 빈 문자열(답변 내용)을 구분해 복원
+    assert _snapshot(db) == before
+    assert search_question_ids(db, "바꿈") == [question_id]
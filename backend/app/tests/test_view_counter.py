@@ -0,0 +1,49 @@
+from conftest import TestingSessionLocal
+
+from app.core.view_counter import ViewCounter, view_counter
+from app.models import Question
+
+
+def test_detail_view_does_not_write(client, make_questions, count_queries):
+    question_id = make_questions(1)[0].id
+    before = view_counter.pending(question_id)
+
+    with count_queries() as counter:
+        response = client.get(f"/api/v1/questions/{question_id}")
+    assert response.status_code == 200
+    assert not any(s.lstrip().upper().startswith("UPDATE") for s in counter.statements)
+    assert view_counter.pending(question_id) == before + 1
+
+
+def test_flush_applies_batched_increments_atomically(db, make_questions):
+    first, second = make_questions(2)
+    first_id, second_id = first.id, second.id
+
+    counter = ViewCounter(interval=60, session_factory=TestingSessionLocal)
+    for _ in range(3):
+        counter.record(first_id)
+    counter.record(second_id, n=5)
+
+    # 다른 워커가 먼저 반영한 값 위에 더해져야 함
+    db.query(Question).filter(Question.id == first_id).update({"views": 10})
+    db.commit()
+    updated_at = db.get(Question, first_id).updated_at
+
+    assert counter.flush() == 2
+    assert counter.pending(first_id) == 0
+
+    db.expire_all()
+    assert db.get(Question, first_id).views == 13
+    assert db.get(Question, second_id).views == 5
+    assert db.get(Question, first_id).updated_at == updated_at
+
+
+def test_stop_flushes_remaining_views(db, make_questions):
+    question_id = make_questions(1)[0].id
+    counter = ViewCounter(interval=60, session_factory=TestingSessionLocal)
+    counter.start()
+    counter.record(question_id)
+    counter.stop()
+
+    db.expire_all()
+    assert db.get(Question, question_id).views == 1
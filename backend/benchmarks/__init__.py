@@ -0,0 +1 @@
+"""성능 측정용 벤치마크 스크립트 모음 (python -m benchmarks.<name>)"""
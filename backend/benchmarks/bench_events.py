@@ -0,0 +1,73 @@
+"""
+SSE 허브 - 유휴 연결당 메모리와 한 질문의 구독자 N명에게 이벤트 하나를 전달하는 시간
+
+    python -m benchmarks.bench_events --connections 10000
+
+HTTP 없이 QuestionEventHub.stream 제너레이터를 connections개 띄워 첫 줄(retry)까지
+읽은 유휴 상태로 두고 tracemalloc으로 늘어난 메모리를 잰다. 이어서 다른 스레드에서
+이벤트를 발행해 모든 구독자가 프레임을 받을 때까지 걸린 시간을 잰다 (소켓 쓰기는 제외).
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+
+async def measure(connections: int, events: int) -> dict:
+    from app.core.events import MemoryBroker, QuestionEventHub
+
+    hub = QuestionEventHub(MemoryBroker(), queue_size=64, keepalive=3600)
+    await hub.start()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    streams = [hub.stream(1) for _ in range(connections)]
+    for stream in streams:
+        await anext(stream)
+    received = 0
+    done = asyncio.Event()
+
+    async def consume(stream):
+        nonlocal received
+        # 구독자마다 대기 중인 태스크 하나 - 실제 연결의 응답 태스크와 같은 모양
+        async for _ in stream:
+            received += 1
+            if received == connections * events:
+                done.set()
+
+    tasks = [asyncio.create_task(consume(stream)) for stream in streams]
+    await asyncio.sleep(0)
+    per_connection = (tracemalloc.get_traced_memory()[0] - before) / connections
+    tracemalloc.stop()
+
+    data = b'{"id":1,"content":"' + b"x" * 200 + b'"}'
+    started = time.perf_counter()
+    for _ in range(events):
+        await asyncio.to_thread(hub.publish, 1, "answer.created", data)
+    await done.wait()
+    elapsed = time.perf_counter() - started
+
+    await hub.stop()
+    await asyncio.gather(*tasks)
+    return {
+        "bytes_per_connection": per_connection,
+        "fanout_ms_per_event": elapsed / events * 1000,
+        "us_per_delivery": elapsed / (connections * events) * 1_000_000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--connections", type=int, default=10_000)
+    parser.add_argument("--events", type=int, default=20)
+    args = parser.parse_args()
+
+    result = asyncio.run(measure(args.connections, args.events))
+    print(f"connections={args.connections} events={args.events}")
+    print(f"유휴 연결당 메모리: {result['bytes_per_connection'] / 1024:.1f} KiB")
+    print(f"이벤트 1개 전체 전달: {result['fanout_ms_per_event']:.2f} ms")
+    print(f"구독자 1명 전달: {result['us_per_delivery']:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+요청 메트릭 오버헤드 - MetricsMiddleware와 SQL 계측을 거친 요청 / 건너뛴 요청 비교
+
+    python -m benchmarks.bench_metrics --requests 5000
+    python -m benchmarks.bench_metrics --database-url postgresql://.../semicolon
+
+시드 데이터를 넣은 DB에 대해 한 프로세스 안에서 같은 경로를 미들웨어 스택
+전체(켬)와 MetricsMiddleware 안쪽 앱(끔)으로 block개씩 번갈아 호출한다.
+끔 블록 동안에는 SQL 이벤트 리스너도 떼어 SQLAlchemy 이벤트 디스패치 비용까지
+오버헤드에 포함한다. 네트워크가
+없으므로 실제 서버보다 오버헤드 비율이 크게 나오는 보수적인 측정이고, 캐시
+적중(목록/상세)처럼 가벼운 요청일수록 비율이 커지므로 경로별로 출력한다.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from alembic import command
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+PATHS = (
+    "/api/v1/questions/?limit=20",
+    "/api/v1/questions/1",
+    "/api/v1/questions/1/answers",
+    "/api/v1/tags/",
+    "/health",
+)
+
+
+def seed(url: str, questions: int = 200, answers: int = 5) -> None:
+    from app.models import Answer, Question, User
+
+    engine = create_engine(url)
+    with Session(engine) as db:
+        author = User(email="bench@example.com", username="bench", hashed_password="x")
+        db.add(author)
+        db.flush()
+        for i in range(questions):
+            question = Question(
+                title=f"질문 {i}",
+                content=f"내용 {i}" * 20,
+                author_id=author.id,
+                answer_count=answers,
+            )
+            db.add(question)
+            db.flush()
+            db.add_all(
+                Answer(
+                    content=f"답변 {j}", question_id=question.id, author_id=author.id
+                )
+                for j in range(answers)
+            )
+        db.commit()
+    engine.dispose()
+
+
+def metrics_layer(app):
+    """빌드된 미들웨어 스택에서 MetricsMiddleware를 찾음"""
+    from app.core.request_metrics import MetricsMiddleware
+
+    if app.middleware_stack is None:
+        app.middleware_stack = app.build_middleware_stack()
+    layer = app.middleware_stack
+    while not isinstance(layer, MetricsMiddleware):
+        layer = layer.app
+    return layer
+
+
+async def measure(paths, requests: int, block: int) -> dict:
+    """경로별 (끔, 켬) 요청당 us - block개씩 번갈아 보내 잡음을 양쪽에 고르게 나눔"""
+    from app.core.request_metrics import instrument_sql, uninstrument_sql
+    from app.main import app
+
+    results = {}
+    async with app.router.lifespan_context(app):
+        layer = metrics_layer(app)
+        clients = {
+            enabled: httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=layer if enabled else layer.app),
+                base_url="http://bench",
+            )
+            for enabled in (False, True)
+        }
+        for path in paths:
+            for client in clients.values():
+                for _ in range(block):
+                    (await client.get(path)).raise_for_status()
+            rounds = {False: [], True: []}
+            for _ in range(requests // block):
+                for enabled, client in clients.items():
+                    if enabled:
+                        instrument_sql()
+                    else:
+                        uninstrument_sql()
+                    started = time.perf_counter()
+                    for _ in range(block):
+                        await client.get(path)
+                    elapsed = time.perf_counter() - started
+                    rounds[enabled].append(elapsed / block * 1_000_000)
+            # 라운드별 (켬 - 끔)의 중앙값 - 한쪽 블록에만 걸린 일시적 지연을 걸러냄
+            off = statistics.median(rounds[False])
+            delta = statistics.median(
+                on - off for off, on in zip(rounds[False], rounds[True])
+            )
+            results[path] = (off, off + delta)
+        for client in clients.values():
+            await client.aclose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--block", type=int, default=20)
+    parser.add_argument("--database-url", help="기본값: 임시 SQLite 파일")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.database_url or f"sqlite:///{Path(tmp) / 'metrics.db'}"
+        # app의 엔진은 import 시점 설정으로 만들어지므로 app 모듈보다 먼저 지정
+        os.environ["DATABASE_URL"] = url
+        # 모든 요청이 같은 IP라 요청 수 제한이 켜져 있으면 워밍업부터 429
+        os.environ["RATE_LIMIT_ENABLED"] = "false"
+        os.environ.setdefault("PASSWORD_HASH_WORKERS", "0")
+        from app.core.migrations import alembic_config
+
+        command.upgrade(alembic_config(url), "head")
+        seed(url)
+        results = asyncio.run(measure(PATHS, args.requests, args.block))
+
+    print(f"{'path':<32} {'off us':>9} {'on us':>9} {'overhead':>9}")
+    for path, (off, on) in results.items():
+        print(f"{path:<32} {off:>9.1f} {on:>9.1f} {(on - off) / off:>8.1%}")
+
+
+if __name__ == "__main__":
+    main()
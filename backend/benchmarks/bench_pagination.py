@@ -0,0 +1,108 @@
+"""
+offset vs 커서 페이지네이션 지연시간 비교
+
+    python -m benchmarks.bench_pagination --rows 1000000
+
+기본값은 임시 SQLite 파일에 질문을 시드합니다. --database-url로 PostgreSQL 등
+다른 DB를 지정할 수 있으며, 이미 rows개 이상 있으면 시드를 건너뜁니다.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.crud import get_questions
+from app.models import Question, User
+
+BATCH_SIZE = 50_000
+
+
+def seed(engine, rows: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        existing = conn.execute(select(func.count(Question.id))).scalar_one()
+        if existing >= rows:
+            return
+        author_id = conn.execute(select(User.id).limit(1)).scalar()
+        if author_id is None:
+            author_id = conn.execute(
+                insert(User).values(
+                    email="bench@example.com", username="bench", hashed_password="x"
+                )
+            ).inserted_primary_key[0]
+
+    base = datetime(2020, 1, 1)
+    started = time.perf_counter()
+    for offset in range(existing, rows, BATCH_SIZE):
+        batch = [
+            {
+                "title": f"question {i}",
+                "content": "lorem ipsum",
+                "author_id": author_id,
+                "views": 0,
+                "is_solved": False,
+                # 초 단위 중복을 일부 만들어 id 타이브레이커가 쓰이도록 함
+                "created_at": base + timedelta(seconds=i // 3),
+                "updated_at": base + timedelta(seconds=i // 3),
+            }
+            for i in range(offset, min(offset + BATCH_SIZE, rows))
+        ]
+        with engine.begin() as conn:
+            conn.execute(insert(Question), batch)
+    print(f"seeded {rows - existing} questions in {time.perf_counter() - started:.1f}s")
+
+
+def timed(fn, repeat: int) -> float:
+    """repeat회 실행한 중앙값 (ms)"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    url = args.database_url or "sqlite:///" + os.path.join(
+        tempfile.gettempdir(), f"semicolon_bench_{args.rows}.db"
+    )
+    engine = create_engine(url)
+    seed(engine, args.rows)
+    Session = sessionmaker(bind=engine)
+
+    depths = [0, 1_000, 10_000, 100_000, args.rows // 2, args.rows - args.limit]
+    print(f"{'depth':>10} {'offset ms':>12} {'cursor ms':>12}")
+    with Session() as db:
+        for depth in sorted({d for d in depths if 0 <= d < args.rows}):
+            # 커서는 해당 깊이 바로 앞 행에서 만든 것과 동일 (측정 대상 아님)
+            cursor = None
+            if depth:
+                anchor = get_questions(db, skip=depth - 1, limit=1)[0]
+                cursor = (anchor.created_at, anchor.id)
+
+            offset_ms = timed(
+                lambda: get_questions(db, skip=depth, limit=args.limit), args.repeat
+            )
+            cursor_ms = timed(
+                lambda: get_questions(db, limit=args.limit, cursor=cursor),
+                args.repeat,
+            )
+            db.expunge_all()
+            print(f"{depth:>10} {offset_ms:>12.2f} {cursor_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+요청 수 제한 오버헤드 - 버킷 저장소 1회 호출 시간과 RateLimitMiddleware를 거친 요청 비교
+
+    python -m benchmarks.bench_rate_limit --requests 5000
+    python -m benchmarks.bench_rate_limit --redis-url redis://localhost:6379/15
+
+시드 데이터를 넣은 임시 SQLite에 대해 한 프로세스 안에서 같은 경로를 미들웨어를
+씌운 앱(켬)과 씌우지 않은 앱(끔)으로 block개씩 번갈아 호출하고, 라운드별 차이의
+중앙값을 오버헤드로 본다. 한도는 충분히 크게 잡아 거절 없이 버킷 확인 비용만 잰다.
+익명 요청은 IP 버킷, 토큰 요청은 (검증 캐시를 거친) 사용자 버킷을 쓴다.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from alembic import command
+
+from benchmarks.bench_metrics import seed
+
+PATHS = (
+    "/api/v1/questions/?limit=20",
+    "/api/v1/questions/1",
+    "/health",
+)
+
+
+async def store_call_us(store, number: int) -> float:
+    started = time.perf_counter()
+    for i in range(number):
+        await store.take(f"ip:10.0.{i % 256}.{i % 100}", rate=1e9, burst=1e9)
+    return (time.perf_counter() - started) / number * 1_000_000
+
+
+async def measure(requests: int, block: int) -> dict:
+    """(경로, 인증 여부)별 (끔, 켬) 요청당 us"""
+    from app.core.rate_limit import MemoryBucketStore, RateLimitMiddleware
+    from app.core.security import create_access_token
+    from app.main import app
+
+    limited = RateLimitMiddleware(
+        app,
+        store=MemoryBucketStore(),
+        ip_rate=1e9,
+        ip_burst=1e9,
+        user_rate=1e9,
+        user_burst=1e9,
+        auth_rate=1e9,
+        auth_burst=1e9,
+        max_in_flight=10_000,
+    )
+    token = create_access_token({"sub": "bench"})
+    results = {}
+    async with app.router.lifespan_context(app):
+        clients = {
+            enabled: httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=limited if enabled else app),
+                base_url="http://bench",
+            )
+            for enabled in (False, True)
+        }
+        for path in PATHS:
+            for authenticated in (False, True):
+                headers = {"Authorization": f"Bearer {token}"} if authenticated else {}
+                for client in clients.values():
+                    for _ in range(block):
+                        (await client.get(path, headers=headers)).raise_for_status()
+                rounds = {False: [], True: []}
+                for _ in range(requests // block):
+                    for enabled, client in clients.items():
+                        started = time.perf_counter()
+                        for _ in range(block):
+                            await client.get(path, headers=headers)
+                        elapsed = time.perf_counter() - started
+                        rounds[enabled].append(elapsed / block * 1_000_000)
+                off = statistics.median(rounds[False])
+                delta = statistics.median(
+                    on - off for off, on in zip(rounds[False], rounds[True])
+                )
+                results[(path, authenticated)] = (off, off + delta)
+        for client in clients.values():
+            await client.aclose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--block", type=int, default=20)
+    parser.add_argument("--store-calls", type=int, default=100_000)
+    parser.add_argument("--redis-url", help="주면 redis 저장소 1회 호출 시간도 측정")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'rate_limit.db'}"
+        # app의 엔진/미들웨어는 import 시점 설정으로 만들어지므로 app 모듈보다 먼저 지정
+        os.environ["DATABASE_URL"] = url
+        os.environ["RATE_LIMIT_ENABLED"] = "false"
+        os.environ.setdefault("PASSWORD_HASH_WORKERS", "0")
+        from app.core.migrations import alembic_config
+        from app.core.rate_limit import MemoryBucketStore, RedisBucketStore
+
+        command.upgrade(alembic_config(url), "head")
+        seed(url)
+
+        memory_us = asyncio.run(store_call_us(MemoryBucketStore(), args.store_calls))
+        print(f"memory store take: {memory_us:.2f} us/call")
+        if args.redis_url:
+            import redis.asyncio
+
+            async def redis_us():
+                client = redis.asyncio.Redis.from_url(args.redis_url)
+                try:
+                    store = RedisBucketStore(client, namespace="bench-rate-limit")
+                    return await store_call_us(store, min(args.store_calls, 10_000))
+                finally:
+                    await client.aclose()
+
+            print(f"redis store take:  {asyncio.run(redis_us()):.2f} us/call")
+
+        results = asyncio.run(measure(args.requests, args.block))
+
+    print(f"\n{'path':<32} {'auth':<5} {'off us':>9} {'on us':>9} {'overhead':>9}")
+    for (path, authenticated), (off, on) in results.items():
+        auth = "yes" if authenticated else "no"
+        print(f"{path:<32} {auth:<5} {off:>9.1f} {on:>9.1f} {(on - off) / off:>8.1%}")
+
+
+if __name__ == "__main__":
+    main()
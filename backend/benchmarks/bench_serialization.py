@@ -0,0 +1,170 @@
+"""
+응답 직렬화 CPU 시간 - 기존 스키마/인코더 경로 vs 현재 경로
+
+    python -m benchmarks.bench_serialization --questions 100 --answers 3
+
+메모리 SQLite에 질문/답변을 시드하고 엔드포인트별 응답 본문을 만드는 데 드는
+시간만 측정합니다 (DB 조회 시간 제외).
+
+- encoder: 변경 전 스키마(EmailStr 재검증) + jsonable_encoder + json.dumps
+- before: 변경 전 스키마 + FastAPI 기본 경로 (TypeAdapter 검증 1회 + dump_json)
+- after: 현재 스키마 + FastAPI 기본 경로
+- render: 응답 캐시가 쓰는 경로 (schemas.response.render_success)
+"""
+import argparse
+import json
+import time
+from typing import Any, Callable, List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import EmailStr, TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.questions import QUESTION_LIST_TYPES
+from app.core.database import Base
+from app.crud import (
+    get_answers_by_question,
+    get_question,
+    get_question_summaries,
+    get_questions,
+    loaders,
+)
+from app.models import Answer as AnswerModel
+from app.models import Question as QuestionModel
+from app.models import User as UserModel
+from app.schemas import (
+    Answer,
+    ApiResponse,
+    Question,
+    QuestionSummary,
+    User,
+    render_success,
+    success_response,
+)
+
+
+# 변경 전 응답 스키마 (이메일을 응답마다 다시 검증)
+class _BaselineUser(User):
+    email: EmailStr
+
+
+class _BaselineAnswer(Answer):
+    author: _BaselineUser
+
+
+class _BaselineQuestion(Question):
+    author: _BaselineUser
+    answers: List[_BaselineAnswer] = []
+
+
+def seed(session, questions: int, answers: int) -> None:
+    author = UserModel(email="bench@example.com", username="bench", hashed_password="x")
+    session.add(author)
+    session.flush()
+    for i in range(questions):
+        question = QuestionModel(
+            title=f"question {i}", content="lorem ipsum " * 40, author_id=author.id
+        )
+        session.add(question)
+        session.flush()
+        for j in range(answers):
+            session.add(
+                AnswerModel(
+                    content="dolor sit amet " * 20,
+                    question_id=question.id,
+                    author_id=author.id,
+                )
+            )
+    session.commit()
+
+
+def per_call_ms(fn: Callable[[], Any], iterations: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1000
+
+
+def paths(data: Any, data_type: Any, baseline_type: Any):
+    baseline = TypeAdapter(ApiResponse[baseline_type])
+    current = TypeAdapter(ApiResponse[data_type])
+
+    def encoder_path():
+        value = baseline.validate_python(success_response(data=data))
+        return json.dumps(jsonable_encoder(value)).encode("utf-8")
+
+    def before_path():
+        return baseline.dump_json(baseline.validate_python(success_response(data=data)))
+
+    def response_model_path():
+        return current.dump_json(current.validate_python(success_response(data=data)))
+
+    def render_success_path():
+        return render_success(data_type, data)
+
+    return encoder_path, before_path, response_model_path, render_success_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--questions", type=int, default=100)
+    parser.add_argument("--answers", type=int, default=3)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    seed(session, args.questions, args.answers)
+
+    limit = min(args.questions, 100)
+    scenarios = [
+        (
+            "list (full)",
+            get_questions(session, limit=limit),
+            QUESTION_LIST_TYPES["full"],
+            List[_BaselineQuestion],
+        ),
+        (
+            "list (summary)",
+            get_question_summaries(session, limit=limit),
+            QUESTION_LIST_TYPES["summary"],
+            List[QuestionSummary],
+        ),
+        (
+            "question detail",
+            get_question(session, 1, options=loaders.QUESTION_DETAIL),
+            Question,
+            _BaselineQuestion,
+        ),
+        (
+            "answer list",
+            get_answers_by_question(session, 1),
+            List[Answer],
+            List[_BaselineAnswer],
+        ),
+    ]
+
+    columns = ("encoder", "before", "after", "render")
+    print(f"{'scenario':<18}" + "".join(f"{c:>10}" for c in columns) + "   speedup")
+    for name, data, data_type, baseline_type in scenarios:
+        timings = [
+            per_call_ms(path, args.iterations)
+            for path in paths(data, data_type, baseline_type)
+        ]
+        print(
+            f"{name:<18}"
+            + "".join(f"{ms:>8.2f}ms" for ms in timings)
+            + f"   x{timings[1] / timings[2]:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
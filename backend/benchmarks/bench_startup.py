@@ -0,0 +1,110 @@
+"""
+워커 콜드 스타트 - 시작 시 스키마 처리 방식별 첫 요청 응답까지 걸리는 시간
+
+    python -m benchmarks.bench_startup --runs 10
+    python -m benchmarks.bench_startup --database-url postgresql://.../semicolon
+
+마이그레이션을 head까지 적용한 DB에 대해 DATABASE_SCHEMA_CHECK 모드별로
+새 프로세스에서 app을 띄우고(import + lifespan) GET /api/v1/questions/ 가
+200을 돌려줄 때까지 잰다.
+'create'가 예전의 import 시점 create_all과 같은 작업(테이블마다 존재 확인)이고
+'revision'이 alembic_version 한 행만 읽는 현재 기본값이다. 스키마 단계만 따로
+잰 값(schema ms)도 함께 출력한다 - 원격 PostgreSQL일수록 차이가 커진다.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from alembic import command
+from sqlalchemy import create_engine
+
+from app import models  # noqa: F401
+from app.core.database import Base
+from app.core.migrations import alembic_config, check_schema
+
+MODES = ("create", "revision", "off")
+
+
+def schema_step_ms(mode: str, url: str, iterations: int) -> float:
+    """새 엔진(=새 연결)으로 스키마 단계만 실행한 시간의 중앙값"""
+    samples = []
+    for _ in range(iterations):
+        engine = create_engine(url)
+        started = time.perf_counter()
+        if mode == "create":
+            Base.metadata.create_all(bind=engine)
+        elif mode == "revision":
+            check_schema(engine)
+        samples.append((time.perf_counter() - started) * 1000)
+        engine.dispose()
+    return statistics.median(samples)
+
+
+# 새 인터프리터에서 app을 import하고 lifespan 시작 후 첫 요청까지 - 응답 시각을 출력
+_CHILD = """
+import asyncio, time
+import httpx
+from app.main import app
+
+async def first_request():
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://x") as c:
+            response = await c.get("/api/v1/questions/?limit=1")
+            print(time.time(), response.status_code, flush=True)
+
+asyncio.run(first_request())
+"""
+
+
+def cold_start_ms(mode: str, url: str) -> float:
+    """프로세스 시작부터 첫 질문 목록 응답까지 (벽시계 기준)"""
+    env = {
+        **os.environ,
+        "DATABASE_URL": url,
+        "DATABASE_SCHEMA_CHECK": mode,
+        "PASSWORD_HASH_WORKERS": "0",
+    }
+    started = time.time()
+    output = subprocess.run(
+        [sys.executable, "-c", _CHILD],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    answered, status = output.split()
+    if status != "200":
+        raise RuntimeError(f"{mode}: 첫 요청이 {status}로 실패했습니다")
+    return (float(answered) - started) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--schema-iterations", type=int, default=50)
+    parser.add_argument("--database-url", help="기본값: 임시 SQLite 파일")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.database_url or f"sqlite:///{Path(tmp) / 'startup.db'}"
+        command.upgrade(alembic_config(url), "head")
+
+        print(f"{'mode':<10} {'schema ms':>10} {'cold start ms':>14} {'p90':>8}")
+        for mode in MODES:
+            schema = schema_step_ms(mode, url, args.schema_iterations)
+            samples = sorted(cold_start_ms(mode, url) for _ in range(args.runs))
+            p90 = samples[int(len(samples) * 0.9) - 1] if len(samples) > 1 else 0.0
+            print(
+                f"{mode:<10} {schema:>10.2f} "
+                f"{statistics.median(samples):>14.1f} {p90:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+벤치마크용 합성 포럼 데이터 생성기 (시드 고정 - 같은 인자면 같은 데이터)
+
+    python -m benchmarks.datagen --users 1000 --questions 20000 --answers 3 --tags 50
+    python -m benchmarks.datagen --database-url sqlite:///./bench.db --questions 5000
+
+`alembic upgrade head`까지 적용한 빈 DB에 app.models 테이블로 배치 단위
+INSERT(executemany)한다. 답변 수/채택/태그 질문 수/마지막 활동 시각 같은
+비정규화 컬럼도 crud가 유지하는 값과 똑같이 채우고, 끝에 검색 색인을 재구축한다.
+
+모든 사용자 비밀번호는 BENCH_PASSWORD (로그인 시나리오용, 해시는 한 번만 계산).
+사용자명은 user0 ~ user{N-1}.
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from sqlalchemy import create_engine, insert, update
+from sqlalchemy.orm import Session
+
+BENCH_PASSWORD = "bench-password"
+
+_WORDS = (
+    "python fastapi sqlalchemy postgresql 인덱스 쿼리 성능 비동기 캐시 배포 도커 "
+    "테스트 타입 오류 메모리 스레드 트랜잭션 마이그레이션 api 인증 토큰 로그 "
+    "react typescript 빌드 설정 서버 클라이언트 응답 요청 데이터 모델 함수"
+).split()
+_TAGS = (
+    "python fastapi sqlalchemy postgresql sqlite docker react typescript "
+    "javascript async testing performance security deployment database"
+).split()
+
+
+def username(index: int) -> str:
+    return f"user{index}"
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _tag_names(count: int) -> List[str]:
+    names = list(_TAGS[:count])
+    names.extend(f"topic-{i}" for i in range(len(names), count))
+    return names
+
+
+def _insert_returning_ids(db: Session, model, rows: List[Dict]) -> List[int]:
+    """배치 INSERT 후 rows 순서대로 생성된 id"""
+    stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+    return list(db.scalars(stmt, rows))
+
+
+def generate(
+    db: Session,
+    users: int,
+    questions: int,
+    answers: int,
+    tags: int,
+    seed: int = 42,
+    batch_size: int = 5_000,
+    days: int = 365,
+) -> Dict[str, int]:
+    """
+    빈 DB에 데이터를 만들고 테이블별 행 수를 반환
+
+    answers는 질문당 평균 답변 수 (0 ~ 2*answers 균등 분포), 태그는 질문당
+    1~3개를 인기 태그 쪽으로 치우치게(1/순위 가중치) 붙인다.
+    """
+    # app은 import 시점에 DATABASE_URL로 엔진을 만듦 - 원격 부하 테스트(load)는
+    # BENCH_PASSWORD만 쓰므로 app 설정 없이도 import되도록 여기서 가져옴
+    from app.core.security import get_password_hash
+    from app.crud import search
+    from app.models import Answer, Question, QuestionTag, Tag, User
+
+    rng = random.Random(seed)
+    now = datetime(2026, 1, 1)
+    password_hash = get_password_hash(BENCH_PASSWORD)
+    counts = dict.fromkeys(
+        ("users", "tags", "questions", "answers", "question_tags"), 0
+    )
+
+    user_ids: List[int] = []
+    for start in range(0, users, batch_size):
+        rows = [
+            {
+                "email": f"{username(i)}@bench.example.com",
+                "username": username(i),
+                "hashed_password": password_hash,
+                "full_name": f"User {i}",
+                "is_active": True,
+                "created_at": now - timedelta(days=rng.uniform(days, days * 2)),
+            }
+            for i in range(start, min(start + batch_size, users))
+        ]
+        user_ids.extend(_insert_returning_ids(db, User, rows))
+    counts["users"] = len(user_ids)
+
+    tag_rows = [
+        {"name": name, "description": f"{name} 관련 질문"} for name in _tag_names(tags)
+    ]
+    tag_ids = _insert_returning_ids(db, Tag, tag_rows) if tag_rows else []
+    tag_weights = [1 / (rank + 1) for rank in range(len(tag_ids))]
+    tag_question_counts = dict.fromkeys(tag_ids, 0)
+    counts["tags"] = len(tag_ids)
+
+    for start in range(0, questions, batch_size):
+        batch = range(start, min(start + batch_size, questions))
+        question_rows, answer_plans = [], []
+        for _ in batch:
+            created_at = now - timedelta(seconds=rng.uniform(0, days * 86400))
+            answer_count = rng.randint(0, 2 * answers) if answers else 0
+            answer_times = sorted(
+                created_at + timedelta(seconds=rng.uniform(60, 7 * 86400))
+                for _ in range(answer_count)
+            )
+            accepted = (
+                rng.randrange(answer_count)
+                if answer_count and rng.random() < 0.3
+                else None
+            )
+            question_rows.append(
+                {
+                    "title": _sentence(rng, rng.randint(4, 10)),
+                    "content": _sentence(rng, rng.randint(30, 120)),
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                    "author_id": rng.choice(user_ids),
+                    "views": int(rng.paretovariate(1.2) * 10),
+                    "is_solved": accepted is not None,
+                    "answer_count": answer_count,
+                    "has_accepted_answer": accepted is not None,
+                    "last_activity_at": max([created_at, *answer_times]),
+                }
+            )
+            answer_plans.append((answer_times, accepted))
+
+        question_ids = _insert_returning_ids(db, Question, question_rows)
+        answer_rows, question_tag_rows = [], []
+        for question_id, row, (answer_times, accepted) in zip(
+            question_ids, question_rows, answer_plans
+        ):
+            for index, answered_at in enumerate(answer_times):
+                answer_rows.append(
+                    {
+                        "content": _sentence(rng, rng.randint(15, 60)),
+                        "created_at": answered_at,
+                        "updated_at": answered_at,
+                        "author_id": rng.choice(user_ids),
+                        "question_id": question_id,
+                        "is_accepted": index == accepted,
+                    }
+                )
+            if not tag_ids:
+                continue
+            picked = set(rng.choices(tag_ids, tag_weights, k=rng.randint(1, 3)))
+            for tag_id in sorted(picked):
+                tag_question_counts[tag_id] += 1
+                question_tag_rows.append(
+                    {
+                        "question_id": question_id,
+                        "tag_id": tag_id,
+                        "question_created_at": row["created_at"],
+                    }
+                )
+        if answer_rows:
+            db.execute(insert(Answer), answer_rows)
+        if question_tag_rows:
+            db.execute(insert(QuestionTag), question_tag_rows)
+        counts["questions"] += len(question_ids)
+        counts["answers"] += len(answer_rows)
+        counts["question_tags"] += len(question_tag_rows)
+
+    if tag_ids:
+        db.execute(
+            update(Tag),
+            [
+                {"id": tag_id, "question_count": n}
+                for tag_id, n in tag_question_counts.items()
+            ],
+        )
+    db.commit()
+    search.rebuild_index(db)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--questions", type=int, default=10_000)
+    parser.add_argument("--answers", type=int, default=3, help="질문당 평균 답변 수")
+    parser.add_argument("--tags", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--database-url", help="기본값: 설정의 DATABASE_URL")
+    args = parser.parse_args()
+
+    if args.database_url:
+        engine = create_engine(args.database_url)
+    else:
+        from app.core.database import engine
+
+    started = time.perf_counter()
+    with Session(engine) as db:
+        counts = generate(
+            db,
+            args.users,
+            args.questions,
+            args.answers,
+            args.tags,
+            seed=args.seed,
+            batch_size=args.batch_size,
+        )
+    for table, count in counts.items():
+        print(f"  {table}: {count}행")
+    print(f"✓ 완료 ({time.perf_counter() - started:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
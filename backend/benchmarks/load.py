@@ -0,0 +1,224 @@
+"""
+시나리오 기반 HTTP 부하 테스트 (benchmarks.datagen으로 만든 데이터 기준)
+
+    python -m benchmarks.datagen --users 1000 --questions 10000
+    RATE_LIMIT_ENABLED=false uvicorn app.main:app --workers 4 --port 8000
+    python -m benchmarks.load --url http://localhost:8000 \\
+        --concurrency 50 --duration 30 --mix list=70,detail=25,login=3,answer=2 \\
+        --output results/load.json
+    python -m benchmarks.load ... --compare results/load.json
+
+시나리오
+- list: GET /questions/ (정렬 모드 무작위, 20개)
+- detail: GET /questions/{id} (id는 1..--questions 균등)
+- login: POST /auth/token (user0..user{--users-1}, datagen.BENCH_PASSWORD)
+- answer: POST /answers/ (가상 사용자마다 처음 한 번 로그인한 토큰으로 작성)
+
+가상 사용자(--concurrency)마다 --seed에서 파생한 난수로 시나리오와 대상을
+고르므로 같은 인자면 같은 요청 순서가 재현된다. --in-process면 서버 없이
+현재 환경변수 설정의 app에 ASGI로 직접 요청한다 (요청 수 제한은 끔).
+
+부하 발생기 한 대의 요청은 모두 같은 IP/소수 사용자로 잡히므로, 측정 대상 서버는
+RATE_LIMIT_ENABLED=false로 띄우거나 RATE_LIMIT_* 한도를 부하보다 크게 올려야 한다
+(아니면 대부분이 429 오류로 집계됨).
+"""
+import argparse
+import asyncio
+import os
+import random
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+from benchmarks import results
+from benchmarks.datagen import BENCH_PASSWORD, username
+
+SCENARIOS = ("list", "detail", "login", "answer")
+SORTS = ("newest", "active", "views", "unanswered")
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"알 수 없는 시나리오: {name}")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+class VirtualUser:
+    def __init__(self, client: httpx.AsyncClient, rng: random.Random, args):
+        self.client = client
+        self.rng = rng
+        self.args = args
+        self.token: Optional[str] = None
+
+    def _username(self) -> str:
+        return username(self.rng.randrange(self.args.users))
+
+    async def _login(self) -> httpx.Response:
+        return await self.client.post(
+            "/api/v1/auth/token",
+            data={"username": self._username(), "password": BENCH_PASSWORD},
+        )
+
+    async def list(self) -> httpx.Response:
+        sort = self.rng.choice(SORTS)
+        return await self.client.get(f"/api/v1/questions/?limit=20&sort={sort}")
+
+    async def detail(self) -> httpx.Response:
+        question_id = self.rng.randint(1, self.args.questions)
+        return await self.client.get(f"/api/v1/questions/{question_id}")
+
+    async def login(self) -> httpx.Response:
+        return await self._login()
+
+    async def answer(self) -> httpx.Response:
+        if self.token is None:
+            response = await self._login()
+            if response.status_code != 200:
+                return response
+            self.token = response.json()["access_token"]
+        return await self.client.post(
+            "/api/v1/answers/",
+            json={
+                "content": f"부하 테스트 답변 {self.rng.random():.6f}",
+                "question_id": self.rng.randint(1, self.args.questions),
+            },
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+
+
+async def run_user(
+    user: VirtualUser,
+    mix: Dict[str, int],
+    deadline: float,
+    latencies: Dict[str, List[float]],
+    errors: Dict[str, int],
+) -> None:
+    names, weights = list(mix), list(mix.values())
+    while time.perf_counter() < deadline:
+        scenario = user.rng.choices(names, weights)[0]
+        started = time.perf_counter()
+        try:
+            response = await getattr(user, scenario)()
+            failed = response.status_code >= 400
+        except httpx.HTTPError:
+            failed = True
+        if failed:
+            errors[scenario] += 1
+        else:
+            latencies[scenario].append((time.perf_counter() - started) * 1000)
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, float]:
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": len(latencies) / elapsed,
+        "p50_ms": results.percentile(latencies, 50),
+        "p95_ms": results.percentile(latencies, 95),
+        "p99_ms": results.percentile(latencies, 99),
+    }
+
+
+async def run(args) -> Dict[str, Dict[str, float]]:
+    if args.in_process:
+        # 미들웨어는 app import 시점 설정으로 붙으므로 그 전에 지정
+        os.environ["RATE_LIMIT_ENABLED"] = "false"
+        from app.main import app
+
+        transport = httpx.ASGITransport(app=app)
+        client = httpx.AsyncClient(transport=transport, base_url="http://bench")
+    else:
+        limits = httpx.Limits(max_connections=args.concurrency)
+        client = httpx.AsyncClient(base_url=args.url, limits=limits, timeout=30)
+
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    async with client:
+        # 워밍업 (커넥션 풀, 캐시) - 집계에서 제외
+        warmup = VirtualUser(client, random.Random(args.seed), args)
+        for _ in range(args.warmup):
+            await warmup.list()
+            await warmup.detail()
+
+        users = [
+            VirtualUser(client, random.Random(f"{args.seed}-{i}"), args)
+            for i in range(args.concurrency)
+        ]
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(
+            *(run_user(user, args.mix, deadline, latencies, errors) for user in users)
+        )
+        elapsed = time.perf_counter() - started
+
+    summary = {
+        scenario: summarize(latencies[scenario], errors[scenario], elapsed)
+        for scenario in args.mix
+    }
+    summary["all"] = summarize(
+        [ms for values in latencies.values() for ms in values],
+        sum(errors.values()),
+        elapsed,
+    )
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--in-process", action="store_true")
+    parser.add_argument(
+        "--mix", type=parse_mix, default=parse_mix("list=70,detail=25,login=3,answer=2")
+    )
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--users", type=int, default=1_000, help="datagen --users")
+    parser.add_argument(
+        "--questions", type=int, default=10_000, help="datagen --questions"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="회귀 판정 변화율"
+    )
+    args = parser.parse_args()
+
+    summary = asyncio.run(run(args))
+
+    print(f"concurrency={args.concurrency} duration={args.duration:.0f}s")
+    print(
+        f"{'scenario':<10} {'requests':>9} {'errors':>7} {'req/s':>9} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    )
+    for scenario, row in summary.items():
+        print(
+            f"{scenario:<10} {row['requests']:>9} {row['errors']:>7} "
+            f"{row['throughput_rps']:>9.1f} {row['p50_ms']:>8.1f} "
+            f"{row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f}"
+        )
+
+    params = {
+        key: value
+        for key, value in vars(args).items()
+        if key not in ("output", "compare", "threshold")
+    }
+    params["url"] = "in-process" if args.in_process else args.url
+    if args.output:
+        results.save(args.output, "load", summary, params)
+    if args.compare:
+        baseline = results.load(args.compare)
+        rows = results.compare(baseline["results"], summary, args.threshold)
+        results.print_comparison(rows, baseline.get("commit"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+동기/비동기 DB 모드 동시성 비교용 부하 테스트
+
+스레드풀(기본 40개)보다 많은 동시 요청을 보내 요청 경로가 스레드풀에 묶이는지
+확인합니다. 같은 DB를 바라보는 서버를 모드별로 띄운 뒤 각각 측정하세요.
+
+    DATABASE_ASYNC=false uvicorn app.main:app --port 8000
+    DATABASE_ASYNC=true uvicorn app.main:app --port 8001
+    python -m benchmarks.load_async --url http://localhost:8000 --concurrency 200
+    python -m benchmarks.load_async --url http://localhost:8001 --concurrency 200
+
+--in-process를 주면 서버 없이 현재 환경변수 설정의 app에 ASGI로 직접 요청합니다.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def worker(
+    client: httpx.AsyncClient, paths, deadline: float, latencies, errors
+):
+    i = 0
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        started = time.perf_counter()
+        try:
+            response = await client.get(path)
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+                continue
+        except httpx.HTTPError as exc:
+            errors.append(type(exc).__name__)
+            continue
+        latencies.append((time.perf_counter() - started) * 1000)
+
+
+def percentile(values, pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+async def run(args) -> None:
+    paths = args.path or ["/api/v1/questions/?limit=20&view=summary"]
+    limits = httpx.Limits(max_connections=args.concurrency)
+    if args.in_process:
+        from app.main import app
+
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://bench"
+        )
+    else:
+        client = httpx.AsyncClient(base_url=args.url, limits=limits, timeout=30)
+
+    latencies, errors = [], []
+    async with client:
+        # 워밍업 (커넥션 풀, 캐시)
+        await client.get(paths[0])
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(
+            *(
+                worker(client, paths, deadline, latencies, errors)
+                for _ in range(args.concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - started
+
+    print(f"concurrency={args.concurrency} duration={elapsed:.1f}s")
+    print(f"requests={len(latencies)} errors={len(errors)}")
+    print(f"throughput={len(latencies) / elapsed:.1f} req/s")
+    if latencies:
+        print(
+            f"latency ms p50={statistics.median(latencies):.1f} "
+            f"p95={percentile(latencies, 95):.1f} p99={percentile(latencies, 99):.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--path", action="append", help="요청 경로 (여러 번 지정 가능)")
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--in-process", action="store_true")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
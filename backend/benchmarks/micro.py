@@ -0,0 +1,184 @@
+"""
+crud 함수 / 응답 직렬화 마이크로벤치마크 - 결과를 JSON으로 남겨 커밋 간 비교
+
+    python -m benchmarks.micro --output results/micro-$(git rev-parse --short HEAD).json
+    python -m benchmarks.micro --compare results/micro-abc1234.json --fail-on-regression
+    python -m benchmarks.micro --database-url postgresql://.../bench --filter crud.
+
+임시 SQLite(또는 --database-url, 빈 DB)에 마이그레이션을 적용하고 benchmarks.datagen으로
+같은 시드의 데이터를 만든 뒤 측정한다. crud 항목은 요청처럼 호출마다 새 세션을 열고
+닫는 시간까지 포함하고, serialize 항목은 미리 읽어 둔 데이터를 응답 bytes로 만드는
+시간만 잰다. 항목마다 --repeat번 반복해 호출당 시간의 중앙값/최솟값(us)을 기록한다.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from alembic import command
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from benchmarks import results
+
+
+def per_call_us(fn: Callable[[], Any], number: int, repeat: int) -> Dict[str, float]:
+    fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - started) / number * 1_000_000)
+    return {"median_us": statistics.median(samples), "min_us": min(samples)}
+
+
+def cases(engine, question_id: int) -> List[Tuple[str, Callable[[], Any]]]:
+    from app import crud
+    from app.api.questions import QUESTION_LIST_TYPES
+    from app.crud import loaders
+    from app.schemas import Answer, Question, render_success
+
+    def with_session(fn: Callable[[Session], Any]) -> Callable[[], Any]:
+        def call():
+            with Session(engine) as db:
+                return fn(db)
+
+        return call
+
+    with Session(engine) as db:
+        summaries = crud.get_question_summaries(db, limit=20)
+        full_list = crud.get_questions(db, limit=20)
+        detail = crud.get_question(db, question_id, options=loaders.QUESTION_DETAIL)
+        answers = crud.get_answers_by_question(db, question_id)
+        # 세션을 닫은 뒤 직렬화할 때 lazy 로드가 일어나지 않도록 값을 미리 읽어 둠
+        render_success(QUESTION_LIST_TYPES["full"], full_list)
+        render_success(Question, detail)
+        render_success(List[Answer], answers)
+        db.expunge_all()
+
+    return [
+        (
+            "crud.get_question_summaries",
+            with_session(lambda db: crud.get_question_summaries(db, limit=20)),
+        ),
+        (
+            "crud.get_question_summaries[tag]",
+            with_session(
+                lambda db: crud.get_question_summaries(db, limit=20, tag="python")
+            ),
+        ),
+        (
+            "crud.get_question_summaries[active]",
+            with_session(
+                lambda db: crud.get_question_summaries(db, limit=20, sort="active")
+            ),
+        ),
+        (
+            "crud.get_questions",
+            with_session(lambda db: crud.get_questions(db, limit=20)),
+        ),
+        (
+            "crud.get_question[detail]",
+            with_session(
+                lambda db: crud.get_question(
+                    db, question_id, options=loaders.QUESTION_DETAIL
+                )
+            ),
+        ),
+        (
+            "crud.get_answers_by_question",
+            with_session(lambda db: crud.get_answers_by_question(db, question_id)),
+        ),
+        (
+            "crud.get_question_version",
+            with_session(lambda db: crud.get_question_version(db, question_id)),
+        ),
+        ("crud.get_tags", with_session(lambda db: crud.get_tags(db, limit=50))),
+        (
+            "crud.search_questions",
+            with_session(lambda db: crud.search_questions(db, "python 인덱스")),
+        ),
+        (
+            "serialize.question_summaries",
+            lambda: render_success(QUESTION_LIST_TYPES["summary"], summaries),
+        ),
+        (
+            "serialize.question_list",
+            lambda: render_success(QUESTION_LIST_TYPES["full"], full_list),
+        ),
+        ("serialize.question_detail", lambda: render_success(Question, detail)),
+        ("serialize.answer_list", lambda: render_success(List[Answer], answers)),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--questions", type=int, default=5_000)
+    parser.add_argument("--answers", type=int, default=3)
+    parser.add_argument("--tags", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--number", type=int, default=200, help="반복 1회당 호출 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", help="이름에 이 문자열이 들어간 항목만")
+    parser.add_argument("--database-url", help="기본값: 임시 SQLite 파일 (빈 DB)")
+    parser.add_argument("--output", type=Path, help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="회귀 판정 변화율"
+    )
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.database_url or f"sqlite:///{Path(tmp) / 'micro.db'}"
+        # app 모듈의 엔진/설정은 import 시점에 만들어지므로 먼저 지정
+        os.environ.setdefault("DATABASE_URL", url)
+        from app.core.migrations import alembic_config
+        from benchmarks.datagen import generate
+
+        command.upgrade(alembic_config(url), "head")
+        engine = create_engine(url)
+        with Session(engine) as db:
+            generate(
+                db, args.users, args.questions, args.answers, args.tags, seed=args.seed
+            )
+
+        measured: Dict[str, Dict[str, float]] = {}
+        print(f"{'name':<38} {'median us':>11} {'min us':>10}")
+        # 상세/답변 항목 대상 - 시드가 같으면 항상 같은 질문
+        for name, fn in cases(engine, question_id=args.questions // 2):
+            if args.filter and args.filter not in name:
+                continue
+            measured[name] = per_call_us(fn, args.number, args.repeat)
+            row = measured[name]
+            print(f"{name:<38} {row['median_us']:>11.1f} {row['min_us']:>10.1f}")
+        engine.dispose()
+
+    params = {
+        key: value
+        for key, value in vars(args).items()
+        if key not in ("output", "compare", "threshold", "fail_on_regression")
+    }
+    database = url.split(":", 1)[0]
+    if args.output:
+        results.save(args.output, "micro", measured, params, database=database)
+    if args.compare:
+        baseline = results.load(args.compare)
+        rows = [
+            row
+            for row in results.compare(baseline["results"], measured, args.threshold)
+            if row[1] == "median_us"
+        ]
+        results.print_comparison(rows, baseline.get("commit"))
+        if args.fail_on_regression and any(row[-1] for row in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
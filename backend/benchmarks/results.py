@@ -0,0 +1,93 @@
+"""
+벤치마크 결과 JSON 저장/비교 (커밋 간 회귀 확인용)
+
+결과 파일 형식:
+
+    {"benchmark": "micro", "commit": "abc1234", "created_at": "...",
+     "python": "3.13.0", "database": "sqlite", "params": {...},
+     "results": {"<이름>": {"<지표>": 값, ...}, ...}}
+
+compare()는 같은 이름/지표끼리 변화율을 계산한다. 지표는 모두 "작을수록 좋음"
+(시간, 지연 시간)으로 취급하고, 처리량처럼 클수록 좋은 지표는 HIGHER_IS_BETTER에 둔다.
+"""
+import json
+import platform
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+HIGHER_IS_BETTER = {"throughput_rps", "requests"}
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save(
+    path: Path,
+    benchmark: str,
+    results: Dict[str, Dict[str, float]],
+    params: Dict[str, Any],
+    database: Optional[str] = None,
+) -> None:
+    document = {
+        "benchmark": benchmark,
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "database": database,
+        "params": params,
+        "results": results,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2, ensure_ascii=False) + "\n")
+
+
+def load(path: Path) -> Dict[str, Any]:
+    return json.loads(path.read_text())
+
+
+def compare(
+    baseline: Dict[str, Dict[str, float]],
+    current: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> List[Tuple[str, str, float, float, float, bool]]:
+    """(이름, 지표, 기준값, 현재값, 변화율, 회귀 여부) - 변화율은 나빠진 방향이 +"""
+    rows = []
+    for name, metrics in current.items():
+        for metric, value in metrics.items():
+            base = baseline.get(name, {}).get(metric)
+            if not base or not isinstance(value, (int, float)):
+                continue
+            change = (value - base) / base
+            if metric in HIGHER_IS_BETTER:
+                change = -change
+            rows.append((name, metric, base, value, change, change > threshold))
+    return rows
+
+
+def print_comparison(rows, baseline_commit: Optional[str]) -> None:
+    print(f"\n기준 커밋 {baseline_commit or '?'} 대비 (+는 나빠짐)")
+    print(f"{'name':<36} {'metric':<16} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, metric, base, value, change, regressed in rows:
+        mark = "  <- 회귀" if regressed else ""
+        print(
+            f"{name:<36} {metric:<16} {base:>10.2f} {value:>10.2f} "
+            f"{change:>+7.1%}{mark}"
+        )
@@ -1,12 +1,15 @@
-"""PostgreSQL 데이터베이스 테이블 생성 스크립트"""
-from app.core.database import engine, Base
-from app.models import User, Question, Answer  # 모델 임포트해서 Base.metadata에 등록
+"""데이터베이스 스키마 생성/업그레이드 스크립트 (alembic upgrade head)"""
+from alembic import command
+
+from app.core.migrations import alembic_config
+
 
 def create_tables():
-    """모든 테이블 생성"""
-    print("테이블 생성 중...")
-    Base.metadata.create_all(bind=engine)
-    print("✓ 테이블 생성 완료!")
+    """마이그레이션을 head까지 적용 - 새 DB면 전체 테이블 생성"""
+    print("마이그레이션 적용 중...")
+    command.upgrade(alembic_config(), "head")
+    print("✓ 스키마가 최신 리비전입니다!")
+
 
 if __name__ == "__main__":
     create_tables()
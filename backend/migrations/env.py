@@ -0,0 +1,45 @@
+"""Alembic 실행 환경 - app.models의 메타데이터를 autogenerate 대상으로 사용"""
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+
+from app import models  # noqa: F401 - 모델을 Base.metadata에 등록
+from app.core.config import settings
+from app.core.database import Base
+from app.core.migrations import include_object
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+# 테스트/스크립트는 sqlalchemy.url을 직접 넘기고, 없으면 .env의 DATABASE_URL
+url = config.get_main_option("sqlalchemy.url") or settings.DATABASE_URL
+options = dict(
+    target_metadata=Base.metadata,
+    include_object=include_object,
+    # SQLite는 ALTER가 제한적이라 테이블 재생성 방식으로 변경
+    render_as_batch=url.startswith("sqlite"),
+)
+
+
+def run_migrations_offline() -> None:
+    """DB 연결 없이 SQL만 출력 (alembic upgrade head --sql)"""
+    context.configure(url=url, literal_binds=True, **options)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    engine = create_engine(url, poolclass=NullPool)
+    with engine.connect() as connection:
+        context.configure(connection=connection, **options)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,172 @@
+"""denormalized columns, list indexes and search storage
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:01
+
+목록 정렬/태그 필터용 비정규화 컬럼과 인덱스, 전문 검색 저장소(PostgreSQL tsvector +
+GIN, SQLite FTS5)를 추가하고 기존 행으로 값을 채운다 (답변 수/채택 여부, 마지막 활동
+시각, 태그별 질문 수와 질문 작성 시각 사본, 검색 색인).
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app.models.SEARCH_DDL / app.crud.search의 이 시점 사본 (마이그레이션은 앱 코드 변경과 무관해야 함)
+SEARCH_DDL = {
+    "postgresql": [
+        "ALTER TABLE questions ADD COLUMN IF NOT EXISTS search_vector tsvector",
+        "CREATE INDEX IF NOT EXISTS ix_questions_search_vector "
+        "ON questions USING GIN (search_vector)",
+    ],
+    "sqlite": [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS questions_fts USING fts5("
+        "title, content, answers, "
+        "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')",
+    ],
+}
+SEARCH_REBUILD = {
+    "postgresql": [
+        "UPDATE questions SET search_vector = "
+        "setweight(to_tsvector('simple', coalesce(questions.title, '')), 'A') "
+        "|| setweight(to_tsvector('simple', coalesce(questions.content, '')), 'B') "
+        "|| setweight(to_tsvector('simple', coalesce(("
+        "SELECT string_agg(answers.content, ' ') "
+        "FROM answers WHERE answers.question_id = questions.id), '')), 'C')",
+    ],
+    "sqlite": [
+        "DELETE FROM questions_fts",
+        "INSERT INTO questions_fts (rowid, title, content, answers) "
+        "SELECT questions.id, questions.title, questions.content, coalesce(("
+        "SELECT group_concat(answers.content, ' ') "
+        "FROM answers WHERE answers.question_id = questions.id), '') "
+        "FROM questions",
+    ],
+}
+
+BACKFILL = [
+    # 집계 컬럼 - 답변에서 다시 계산
+    "UPDATE questions SET "
+    "answer_count = (SELECT count(*) FROM answers "
+    "WHERE answers.question_id = questions.id), "
+    "has_accepted_answer = EXISTS (SELECT 1 FROM answers "
+    "WHERE answers.question_id = questions.id AND answers.is_accepted), "
+    "last_activity_at = coalesce(updated_at, created_at, CURRENT_TIMESTAMP)",
+    # NOT NULL/유니크 인덱스를 걸 수 없는 연결 행 정리 (빈 참조, 같은 태그 중복 부착)
+    "DELETE FROM question_tags WHERE question_id IS NULL OR tag_id IS NULL "
+    "OR question_id NOT IN (SELECT id FROM questions) "
+    "OR tag_id NOT IN (SELECT id FROM tags)",
+    "DELETE FROM question_tags WHERE id NOT IN ("
+    "SELECT min(id) FROM question_tags GROUP BY tag_id, question_id)",
+    "UPDATE question_tags SET question_created_at = coalesce(("
+    "SELECT questions.created_at FROM questions "
+    "WHERE questions.id = question_tags.question_id), CURRENT_TIMESTAMP)",
+    "UPDATE tags SET question_count = (SELECT count(*) FROM question_tags "
+    "WHERE question_tags.tag_id = tags.id)",
+]
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("questions") as batch:
+        batch.add_column(
+            sa.Column("answer_count", sa.Integer(), server_default="0", nullable=False)
+        )
+        batch.add_column(
+            sa.Column(
+                "has_accepted_answer",
+                sa.Boolean(),
+                server_default=sa.false(),
+                nullable=False,
+            )
+        )
+        batch.add_column(sa.Column("last_activity_at", sa.DateTime(), nullable=True))
+    with op.batch_alter_table("tags") as batch:
+        batch.add_column(
+            sa.Column(
+                "question_count", sa.Integer(), server_default="0", nullable=False
+            )
+        )
+    with op.batch_alter_table("question_tags") as batch:
+        batch.add_column(sa.Column("question_created_at", sa.DateTime(), nullable=True))
+
+    for statement in BACKFILL:
+        op.execute(statement)
+
+    with op.batch_alter_table("questions") as batch:
+        batch.alter_column(
+            "last_activity_at", existing_type=sa.DateTime(), nullable=False
+        )
+    with op.batch_alter_table("question_tags") as batch:
+        batch.alter_column("question_id", existing_type=sa.Integer(), nullable=False)
+        batch.alter_column("tag_id", existing_type=sa.Integer(), nullable=False)
+        batch.alter_column(
+            "question_created_at", existing_type=sa.DateTime(), nullable=False
+        )
+
+    op.create_index("ix_questions_created_at_id", "questions", ["created_at", "id"])
+    op.create_index("ix_questions_views_id", "questions", ["views", "id"])
+    op.create_index(
+        "ix_questions_last_activity_at_id", "questions", ["last_activity_at", "id"]
+    )
+    op.create_index(
+        "ix_questions_unanswered_created_at_id",
+        "questions",
+        ["created_at", "id"],
+        postgresql_where=sa.text("answer_count = 0"),
+        sqlite_where=sa.text("answer_count = 0"),
+    )
+    op.create_index("ix_answers_question_id", "answers", ["question_id"])
+    op.create_index("ix_tags_question_count", "tags", ["question_count"])
+    op.create_index(
+        "ux_question_tags_tag_id_question_id",
+        "question_tags",
+        ["tag_id", "question_id"],
+        unique=True,
+    )
+    op.create_index("ix_question_tags_question_id", "question_tags", ["question_id"])
+    op.create_index(
+        "ix_question_tags_tag_id_created_at",
+        "question_tags",
+        ["tag_id", "question_created_at", "question_id"],
+    )
+
+    dialect = op.get_context().dialect.name
+    for statement in SEARCH_DDL.get(dialect, []) + SEARCH_REBUILD.get(dialect, []):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_context().dialect.name
+    if dialect == "sqlite":
+        op.execute("DROP TABLE IF EXISTS questions_fts")
+    elif dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_questions_search_vector")
+        op.execute("ALTER TABLE questions DROP COLUMN IF EXISTS search_vector")
+
+    op.drop_index("ix_question_tags_tag_id_created_at", "question_tags")
+    op.drop_index("ix_question_tags_question_id", "question_tags")
+    op.drop_index("ux_question_tags_tag_id_question_id", "question_tags")
+    op.drop_index("ix_tags_question_count", "tags")
+    op.drop_index("ix_answers_question_id", "answers")
+    op.drop_index("ix_questions_unanswered_created_at_id", "questions")
+    op.drop_index("ix_questions_last_activity_at_id", "questions")
+    op.drop_index("ix_questions_views_id", "questions")
+    op.drop_index("ix_questions_created_at_id", "questions")
+
+    with op.batch_alter_table("question_tags") as batch:
+        batch.drop_column("question_created_at")
+        batch.alter_column("tag_id", existing_type=sa.Integer(), nullable=True)
+        batch.alter_column("question_id", existing_type=sa.Integer(), nullable=True)
+    with op.batch_alter_table("tags") as batch:
+        batch.drop_column("question_count")
+    with op.batch_alter_table("questions") as batch:
+        batch.drop_column("last_activity_at")
+        batch.drop_column("has_accepted_answer")
+        batch.drop_column("answer_count")
@@ -0,0 +1,30 @@
+"""users.updated_at
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:02
+
+작성자 프로필 변경을 질문/답변 응답의 검증자(ETag, Last-Modified)에 반영하기 위한
+사용자 수정 시각. 기존 행은 가입 시각으로 채운다.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("users") as batch:
+        batch.add_column(sa.Column("updated_at", sa.DateTime(), nullable=True))
+    op.execute("UPDATE users SET updated_at = created_at")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("users") as batch:
+        batch.drop_column("updated_at")
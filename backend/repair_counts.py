@@ -0,0 +1,25 @@
+"""비정규화 집계(질문 answer_count / has_accepted_answer, 태그 question_count) 재계산 스크립트"""
+import argparse
+
+from app.core.database import SessionLocal
+from app.crud import repair_answer_stats, repair_tag_counts
+
+
+def repair_counts(batch_size: int):
+    """answers / question_tags 테이블 기준으로 어긋난 집계를 바로잡음"""
+    db = SessionLocal()
+    try:
+        print("답변 집계 재계산 중...")
+        repaired = repair_answer_stats(db, batch_size=batch_size)
+        print(f"✓ {repaired}개 질문의 집계를 수정했습니다.")
+        print("태그 질문 수 재계산 중...")
+        repaired = repair_tag_counts(db)
+        print(f"✓ {repaired}개 태그의 질문 수를 수정했습니다.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    repair_counts(parser.parse_args().batch_size)
@@ -0,0 +1,35 @@
+"""포럼 데이터 내보내기/가져오기 스크립트 (NDJSON / CSV, 테이블당 파일 하나)"""
+import argparse
+import time
+from pathlib import Path
+
+from app.core.database import SessionLocal
+from app.crud.transfer import FORMATS, export_all, import_all
+
+
+def transfer(command: str, directory: Path, fmt: str, batch_size: int):
+    """command=export: DB -> directory, command=import: directory -> 빈 DB"""
+    db = SessionLocal()
+    started = time.perf_counter()
+    try:
+        if command == "export":
+            print(f"{directory}로 내보내는 중...")
+            counts = export_all(db, directory, fmt, batch_size)
+        else:
+            print(f"{directory}에서 가져오는 중...")
+            counts = import_all(db, directory, fmt, batch_size)
+        for table, count in counts.items():
+            print(f"  {table}: {count}행")
+        print(f"✓ 완료 ({time.perf_counter() - started:.1f}초)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("command", choices=["export", "import"])
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("--format", choices=FORMATS, default="ndjson")
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+    transfer(args.command, args.directory, args.format, args.batch_size)
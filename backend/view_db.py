@@ -25,7 +25,7 @@ def view_database():
             print(f"  작성자: {q.author.username}")
             print(f"  생성일: {q.created_at}")
             print(f"  조회수: {q.views} | 해결됨: {q.is_solved}")
-            print(f"  답변 수: {len(q.answers)}")
+            print(f"  답변 수: {q.answer_count} | 채택: {q.has_accepted_answer}")
             print("-" * 80)
         
         print("\n" + "=" * 80)
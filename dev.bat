@@ -27,6 +27,9 @@ if not exist "venv\" (
     call venv\Scripts\activate.bat
 )
 
+REM Apply database migrations (schema is no longer created on app import)
+alembic upgrade head
+
 echo [OK] Python environment ready
 echo.
 
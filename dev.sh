@@ -34,6 +34,9 @@ else
     source venv/bin/activate
 fi
 
+# Apply database migrations (schema is no longer created on app import)
+alembic upgrade head
+
 echo -e "${GREEN}✓ Python environment ready${NC}"
 echo ""
 
@@ -3,7 +3,7 @@ import { get } from 'svelte/store';
 import { authStore } from '$lib/stores/auth.js';
 
 // 백엔드 API 기본 URL
-const BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000/api/v1';
+export const BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000/api/v1';
 
 /**
  * API 요청 에러
@@ -1,5 +1,5 @@
 // 질문 관련 API 함수들
-import { api_get, api_post, api_put, api_delete } from './client.js';
+import { BASE_URL, api_get, api_post, api_put, api_delete } from './client.js';
 
 /**
  * 질문 목록 가져오기
@@ -19,6 +19,20 @@ export async function get_question(question_id) {
   return api_get(`/questions/${question_id}`);
 }
 
+/**
+ * 질문 페이지 한 번에 가져오기 (질문, 답변, 작성자)
+ * 응답의 question/answers는 author_id만 가지므로 users에서 author를 채워 돌려준다.
+ * @param {number} question_id - 질문 ID
+ * @returns {Promise<{question: object, answers: Array}>} author가 채워진 질문과 답변 목록
+ */
+export async function get_question_full(question_id) {
+  const result = await api_get(`/questions/${question_id}/full`);
+  const { question, answers, users } = result.data || result;
+  const users_by_id = new Map(users.map(user => [user.id, user]));
+  const with_author = (item) => ({ ...item, author: users_by_id.get(item.author_id) });
+  return { question: with_author(question), answers: answers.map(with_author) };
+}
+
 /**
  * 질문 작성하기
  * @param {object} q_data - 질문 데이터 { title, content, tags }
@@ -56,6 +70,29 @@ export async function get_question_answers(question_id) {
   return api_get(`/questions/${question_id}/answers`);
 }
 
+/**
+ * 질문의 답변 변경 이벤트 구독 (Server-Sent Events)
+ * 연결이 끊겼다 다시 붙으면 그 사이 이벤트는 없으므로 on_reconnect에서 답변 목록을 다시 읽는다.
+ * @param {number} question_id - 질문 ID
+ * @param {object} handlers - { created, updated, accepted, deleted, on_reconnect } (각각 답변 데이터를 받음)
+ * @returns {() => void} 구독 해제 함수
+ */
+export function subscribe_question_events(question_id, handlers) {
+  // 서버 렌더링 중에는 EventSource가 없음
+  if (typeof EventSource === 'undefined') return () => {};
+  const source = new EventSource(`${BASE_URL}/questions/${question_id}/events`);
+  let opened = false;
+
+  source.onopen = () => {
+    if (opened) handlers.on_reconnect?.();
+    opened = true;
+  };
+  for (const name of ['created', 'updated', 'accepted', 'deleted']) {
+    source.addEventListener(`answer.${name}`, (e) => handlers[name]?.(JSON.parse(e.data)));
+  }
+  return () => source.close();
+}
+
 /**
  * 질문에 투표하기
  * @param {number} question_id - 질문 ID
@@ -30,6 +30,9 @@ REM Install Python packages
 echo Installing Python dependencies...
 pip install -q -e .
 
+REM Apply database migrations (schema is no longer created on app import)
+alembic upgrade head
+
 echo [OK] Python environment ready
 echo.
 
@@ -38,6 +38,9 @@ source venv/bin/activate
 echo "Installing Python dependencies..."
 pip install -q -e .
 
+# Apply database migrations (schema is no longer created on app import)
+alembic upgrade head
+
 echo -e "${GREEN}✓ Python environment ready${NC}"
 echo ""
 